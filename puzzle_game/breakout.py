@@ -13,20 +13,26 @@ import curses
 import time
 import math
 import random
+from array import array
 
 # Game settings
 PADDLE_WIDTH = 10
 BALL_CHAR = 'O'
-BRICK_CHARS = '[]'
+FRAME_DT = 1 / 60      # Fixed physics step (seconds)
+MAX_LAG = 0.25         # Drop simulation time beyond this after a stall
+IDLE_TIMEOUT_MS = 100  # Input wait while the ball isn't moving
 
-# Brick colors and points
-BRICK_TYPES = [
-    {'color': 5, 'points': 50, 'char': '<>'},   # Red
-    {'color': 3, 'points': 40, 'char': '{}'},   # Yellow
-    {'color': 4, 'points': 30, 'char': '[]'},   # Green
-    {'color': 6, 'points': 20, 'char': '()'},   # Cyan
-    {'color': 2, 'points': 10, 'char': '##'},   # Blue
-]
+# Brick grid layout
+BRICK_WIDTH = 4
+BRICK_HEIGHT = 2
+BRICK_START_X = 4
+BRICK_START_Y = 4
+
+# Brick colors and points, indexed by brick type (one type per row)
+#               Red   Yellow Green Cyan  Blue
+BRICK_COLORS = (5,    3,     4,    6,    2)
+BRICK_POINTS = (50,   40,    30,   20,   10)
+BRICK_CHARS = ('<>', '{}',  '[]', '()', '##')
 
 
 class Ball:
@@ -45,12 +51,45 @@ class Ball:
         self.active = True
 
 
-class Brick:
-    def __init__(self, x, y, brick_type):
-        self.x = x
-        self.y = y
-        self.type = brick_type
-        self.alive = True
+def step_ball(x, y, dx, dy, width, paddle_x, paddle_y):
+    """Advance the ball one step, bouncing off walls and the paddle.
+
+    Works on plain floats and returns the new (x, y, dx, dy).
+    """
+    # Move ball
+    x += dx
+    y += dy
+
+    # Wall collision
+    if x <= 1:
+        x = 1
+        dx = abs(dx)
+    elif x >= width - 2:
+        x = width - 2
+        dx = -abs(dx)
+
+    if y <= 1:
+        y = 1
+        dy = abs(dy)
+
+    # Paddle collision
+    if (dy > 0 and
+        paddle_y <= y <= paddle_y + 1 and
+        paddle_x <= x <= paddle_x + PADDLE_WIDTH):
+
+        dy = -abs(dy)
+
+        # Angle based on hit position
+        hit_pos = (x - paddle_x) / PADDLE_WIDTH
+        dx = (hit_pos - 0.5) * 1.5
+
+        # Speed up slightly (compare squared speed against 1.5 ** 2)
+        if dx * dx + dy * dy < 2.25:
+            factor = 1.02
+            dx *= factor
+            dy *= factor
+
+    return x, y, dx, dy
 
 
 class Game:
@@ -68,26 +107,48 @@ class Game:
         self.paddle_y = height - 3
 
         self.ball = Ball(width // 2, self.paddle_y - 1)
-        self.bricks = []
+
+        # Bricks are stored as parallel arrays indexed by brick number
+        self.brick_x = array('h')
+        self.brick_y = array('h')
+        self.brick_type = array('b')
+        self.brick_alive = bytearray()
+        self.alive_count = 0
+        self.brick_rows = 0
+        self.brick_cols = 0
+
+        # What draw_game last put on screen, so it only repaints changes
+        self.needs_redraw = True
+        self.dead_bricks = []
+        self.prev_ball = None
+        self.prev_paddle_x = None
+        self.prev_header = None
+        self.prev_status = None
 
         self.create_bricks()
 
     def create_bricks(self):
         """Create brick layout."""
-        self.bricks = []
-        brick_width = 4
-        start_x = 4
-        start_y = 4
+        self.brick_x = array('h')
+        self.brick_y = array('h')
+        self.brick_type = array('b')
 
-        cols = (self.width - start_x * 2) // brick_width
-        rows = len(BRICK_TYPES)
+        cols = (self.width - BRICK_START_X * 2) // BRICK_WIDTH
+        rows = len(BRICK_POINTS)
 
         for row in range(rows):
-            brick_type = BRICK_TYPES[row]
             for col in range(cols):
-                x = start_x + col * brick_width
-                y = start_y + row * 2
-                self.bricks.append(Brick(x, y, brick_type))
+                self.brick_x.append(BRICK_START_X + col * BRICK_WIDTH)
+                self.brick_y.append(BRICK_START_Y + row * BRICK_HEIGHT)
+                self.brick_type.append(row)
+
+        self.brick_rows = rows
+        self.brick_cols = cols
+
+        self.brick_alive = bytearray([1]) * len(self.brick_x)
+        self.alive_count = len(self.brick_x)
+        self.dead_bricks = []
+        self.needs_redraw = True
 
     def reset_ball(self):
         """Reset ball to paddle."""
@@ -110,24 +171,12 @@ class Game:
         if self.paused or self.game_over or not self.ball.active:
             return
 
-        # Move ball
-        self.ball.x += self.ball.dx
-        self.ball.y += self.ball.dy
-
-        # Wall collision
-        if self.ball.x <= 1:
-            self.ball.x = 1
-            self.ball.dx = abs(self.ball.dx)
-        elif self.ball.x >= self.width - 2:
-            self.ball.x = self.width - 2
-            self.ball.dx = -abs(self.ball.dx)
-
-        if self.ball.y <= 1:
-            self.ball.y = 1
-            self.ball.dy = abs(self.ball.dy)
+        ball = self.ball
+        ball.x, ball.y, ball.dx, ball.dy = step_ball(
+            ball.x, ball.y, ball.dx, ball.dy, self.width, self.paddle_x, self.paddle_y)
 
         # Bottom - lose life
-        if self.ball.y >= self.height - 1:
+        if ball.y >= self.height - 1:
             self.lives -= 1
             if self.lives <= 0:
                 self.game_over = True
@@ -135,120 +184,158 @@ class Game:
                 self.reset_ball()
             return
 
-        # Paddle collision
-        if (self.ball.dy > 0 and
-            self.paddle_y <= self.ball.y <= self.paddle_y + 1 and
-            self.paddle_x <= self.ball.x <= self.paddle_x + PADDLE_WIDTH):
-
-            self.ball.dy = -abs(self.ball.dy)
-
-            # Angle based on hit position
-            hit_pos = (self.ball.x - self.paddle_x) / PADDLE_WIDTH
-            self.ball.dx = (hit_pos - 0.5) * 1.5
-
-            # Speed up slightly
-            speed = math.sqrt(self.ball.dx ** 2 + self.ball.dy ** 2)
-            if speed < 1.5:
-                factor = 1.02
-                self.ball.dx *= factor
-                self.ball.dy *= factor
-
-        # Brick collision
-        ball_x = int(self.ball.x)
-        ball_y = int(self.ball.y)
-
-        for brick in self.bricks:
-            if not brick.alive:
-                continue
-
-            if (brick.x <= ball_x <= brick.x + 3 and
-                brick.y <= ball_y <= brick.y + 1):
+        # Brick collision - bricks form a regular grid, so the cell under
+        # the ball identifies the only brick it can be touching
+        col = (int(ball.x) - BRICK_START_X) // BRICK_WIDTH
+        row = (int(ball.y) - BRICK_START_Y) // BRICK_HEIGHT
 
-                brick.alive = False
-                self.score += brick.type['points'] * self.level
+        if 0 <= row < self.brick_rows and 0 <= col < self.brick_cols:
+            i = row * self.brick_cols + col
+            if self.brick_alive[i]:
+                self.brick_alive[i] = 0
+                self.alive_count -= 1
+                self.dead_bricks.append(i)
+                self.score += BRICK_POINTS[self.brick_type[i]] * self.level
 
                 # Determine bounce direction
                 # Simple approach: reverse y direction
-                self.ball.dy = -self.ball.dy
-                break
+                ball.dy = -ball.dy
 
         # Check win
-        if all(not b.alive for b in self.bricks):
+        if self.alive_count == 0:
             self.level += 1
             self.create_bricks()
             self.reset_ball()
 
 
-def draw_game(stdscr, game):
-    """Draw the game."""
-    stdscr.clear()
+def safe_addstr(stdscr, y, x, text, attr, max_y, max_x):
+    """Write text clipped to a max_y x max_x screen so addstr cannot fail."""
+    if y < 0 or y >= max_y or x >= max_x:
+        return
+    if x < 0:
+        text = text[-x:]
+        x = 0
+    # Writing the bottom-right cell makes curses report an error
+    limit = max_x - x - (1 if y == max_y - 1 else 0)
+    if limit > 0 and text:
+        stdscr.addstr(y, x, text[:limit], attr)
+
+
+def get_status_lines(game):
+    """Return the (text, attr) overlay lines for the current game state."""
+    if game.paused:
+        return [(" PAUSED - Press Space to continue ",
+                 curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)]
+    elif not game.ball.active:
+        return [(" Press Space to launch ball ",
+                 curses.color_pair(4) | curses.A_BOLD)]
+    elif game.game_over:
+        attr = curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD
+        return [
+            (" GAME OVER ", attr),
+            (f" Final Score: {game.score} ", attr),
+            (" Press R to restart, Q to quit ", attr),
+        ]
+    return []
+
+
+def make_chrome(width, height):
+    """Render the static border and controls hint into an off-screen pad."""
+    chrome = curses.newpad(height, width)
 
     # Draw border
-    for y in range(game.height):
-        stdscr.addstr(y, 0, '|', curses.color_pair(7))
-        stdscr.addstr(y, game.width - 1, '|', curses.color_pair(7))
-    for x in range(game.width):
-        stdscr.addstr(0, x, '-', curses.color_pair(7))
+    for y in range(height):
+        safe_addstr(chrome, y, 0, '|', curses.color_pair(7), height, width)
+        safe_addstr(chrome, y, width - 1, '|', curses.color_pair(7), height, width)
+    safe_addstr(chrome, 0, 0, '-' * width, curses.color_pair(7), height, width)
+
+    # Controls hint
+    hint = " <-/-> or A/D: Move | Space: Launch/Pause | Q: Quit "
+    safe_addstr(chrome, height - 1, 2, hint[:width - 4], curses.color_pair(8), height, width)
+
+    return chrome
+
+
+def draw_playfield(stdscr, game, chrome):
+    """Repaint the whole screen: border, bricks and controls hint."""
+    height, width = game.height, game.width
+    chrome.overwrite(stdscr, 0, 0, 0, 0, height - 1, width - 1)
+
+    # Draw bricks, one string per row with gaps where bricks are gone
+    gap = ' ' * BRICK_WIDTH
+    for row in range(game.brick_rows):
+        first = row * game.brick_cols
+        alive = game.brick_alive[first:first + game.brick_cols]
+        if not alive:
+            break
+        brick_type = game.brick_type[first]
+        brick_str = BRICK_CHARS[brick_type] * 2
+        row_str = ''.join(brick_str if a else gap for a in alive)
+        safe_addstr(stdscr, game.brick_y[first], game.brick_x[first], row_str,
+                    curses.color_pair(BRICK_COLORS[brick_type]) | curses.A_BOLD, height, width)
+
+
+def draw_game(stdscr, game, chrome):
+    """Draw the game, repainting only what changed since the last frame."""
+    height, width = game.height, game.width
+    status = get_status_lines(game)
+
+    if game.needs_redraw or status != game.prev_status:
+        draw_playfield(stdscr, game, chrome)
+        game.needs_redraw = False
+        game.dead_bricks = []
+        game.prev_ball = None
+        game.prev_paddle_x = None
+        game.prev_header = None
+        game.prev_status = status
+    else:
+        # Blank bricks destroyed since the last frame
+        for i in game.dead_bricks:
+            safe_addstr(stdscr, game.brick_y[i], game.brick_x[i], ' ' * BRICK_WIDTH, 0,
+                        height, width)
+        game.dead_bricks = []
 
     # Draw header
     header = f" Score: {game.score}  Level: {game.level}  Lives: {'O ' * game.lives}"
-    stdscr.addstr(0, 2, header, curses.color_pair(7) | curses.A_BOLD)
+    if header != game.prev_header:
+        safe_addstr(stdscr, 0, 1, '-' * (width - 2), curses.color_pair(7), height, width)
+        safe_addstr(stdscr, 0, 2, header, curses.color_pair(7) | curses.A_BOLD, height, width)
+        game.prev_header = header
 
-    # Draw bricks
-    for brick in game.bricks:
-        if brick.alive:
-            try:
-                stdscr.addstr(brick.y, brick.x, brick.type['char'] * 2,
-                              curses.color_pair(brick.type['color']) | curses.A_BOLD)
-            except curses.error:
-                pass
+    # Erase paddle and ball at their previous positions
+    ball_x = int(game.ball.x)
+    ball_y = int(game.ball.y)
+    if game.prev_paddle_x is not None and game.prev_paddle_x != game.paddle_x:
+        safe_addstr(stdscr, game.paddle_y, game.prev_paddle_x, ' ' * PADDLE_WIDTH, 0,
+                    height, width)
+    if game.prev_ball is not None and game.prev_ball != (ball_x, ball_y):
+        safe_addstr(stdscr, game.prev_ball[1], game.prev_ball[0], ' ', 0, height, width)
+    game.prev_paddle_x = game.paddle_x
+    game.prev_ball = None
 
     # Draw paddle
     paddle_str = '=' * PADDLE_WIDTH
-    try:
-        stdscr.addstr(game.paddle_y, game.paddle_x, paddle_str, curses.color_pair(4) | curses.A_BOLD)
-    except curses.error:
-        pass
+    safe_addstr(stdscr, game.paddle_y, game.paddle_x, paddle_str,
+                curses.color_pair(4) | curses.A_BOLD, height, width)
 
     # Draw ball
-    ball_x = int(game.ball.x)
-    ball_y = int(game.ball.y)
-    if 0 <= ball_x < game.width and 0 <= ball_y < game.height:
-        try:
-            stdscr.addstr(ball_y, ball_x, BALL_CHAR, curses.color_pair(3) | curses.A_BOLD)
-        except curses.error:
-            pass
+    if 0 <= ball_x < width and 0 <= ball_y < height:
+        safe_addstr(stdscr, ball_y, ball_x, BALL_CHAR, curses.color_pair(3) | curses.A_BOLD,
+                    height, width)
+        game.prev_ball = (ball_x, ball_y)
 
     # Draw status
-    if game.paused:
-        msg = " PAUSED - Press Space to continue "
-        stdscr.addstr(game.height // 2, game.width // 2 - len(msg) // 2, msg,
-                      curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
-    elif not game.ball.active:
-        msg = " Press Space to launch ball "
-        stdscr.addstr(game.height // 2, game.width // 2 - len(msg) // 2, msg,
-                      curses.color_pair(4) | curses.A_BOLD)
-    elif game.game_over:
-        lines = [
-            " GAME OVER ",
-            f" Final Score: {game.score} ",
-            " Press R to restart, Q to quit ",
-        ]
-        for i, line in enumerate(lines):
-            y = game.height // 2 - 1 + i
-            x = game.width // 2 - len(line) // 2
-            stdscr.addstr(y, x, line, curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD)
-
-    # Controls hint
-    hint = " <-/-> or A/D: Move | Space: Launch/Pause | Q: Quit "
-    stdscr.addstr(game.height - 1, 2, hint[:game.width - 4], curses.color_pair(8))
+    for i, (line, attr) in enumerate(status):
+        y = height // 2 - (1 if len(status) > 1 else 0) + i
+        x = width // 2 - len(line) // 2
+        safe_addstr(stdscr, y, x, line, attr, height, width)
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
 
 
 def draw_title(stdscr, width, height):
     """Draw title screen."""
-    stdscr.clear()
+    stdscr.erase()
 
     title = [
         " ____  ____  _____ _   _ _  _____  _   _ _____ ",
@@ -262,10 +349,7 @@ def draw_title(stdscr, width, height):
     for i, line in enumerate(title):
         x = width // 2 - len(line) // 2
         color = curses.color_pair((i % 5) + 1)
-        try:
-            stdscr.addstr(start_y + i, max(0, x), line, color | curses.A_BOLD)
-        except curses.error:
-            pass
+        safe_addstr(stdscr, start_y + i, max(0, x), line, color | curses.A_BOLD, height, width)
 
     instructions = [
         "",
@@ -277,10 +361,7 @@ def draw_title(stdscr, width, height):
     for i, line in enumerate(instructions):
         y = height // 2 + 2 + i
         x = width // 2 - len(line) // 2
-        try:
-            stdscr.addstr(y, x, line, curses.color_pair(7))
-        except curses.error:
-            pass
+        safe_addstr(stdscr, y, x, line, curses.color_pair(7), height, width)
 
     stdscr.refresh()
 
@@ -320,12 +401,19 @@ def main(stdscr):
     stdscr.nodelay(True)
 
     game = Game(width, height)
-    last_time = time.time()
+    chrome = make_chrome(width, height)
+    last_time = time.monotonic()
+    lag = 0.0
 
     while True:
-        current_time = time.time()
-        dt = current_time - last_time
-        last_time = current_time
+        # Wait for input until the next physics step is due; getch returns
+        # as soon as a key arrives, or after a longer idle wait when nothing
+        # is moving
+        idle = game.paused or game.game_over or not game.ball.active
+        if idle:
+            stdscr.timeout(IDLE_TIMEOUT_MS)
+        else:
+            stdscr.timeout(max(0, round((FRAME_DT - lag) * 1000)))
 
         # Handle input
         try:
@@ -333,6 +421,10 @@ def main(stdscr):
         except:
             key = -1
 
+        now = time.monotonic()
+        lag = 0.0 if idle else min(lag + now - last_time, MAX_LAG)
+        last_time = now
+
         if key in [ord('q'), ord('Q')]:
             break
         elif key in [ord('r'), ord('R')] and game.game_over:
@@ -348,14 +440,15 @@ def main(stdscr):
                 else:
                     game.ball.launch()
 
-        # Update
-        if not game.paused:
-            game.update(dt)
+        # Update in fixed steps so ball speed doesn't depend on frame time
+        while lag >= FRAME_DT:
+            if not game.paused:
+                game.update(FRAME_DT)
+            lag -= FRAME_DT
 
         # Draw
-        draw_game(stdscr, game)
-
-        time.sleep(0.016)
+        draw_game(stdscr, game, chrome)
+        curses.doupdate()
 
 
 if __name__ == '__main__':
@@ -10,7 +10,6 @@ Controls:
 
 import curses
 import random
-import copy
 
 # Tile colors
 TILE_COLORS = {
@@ -28,11 +27,67 @@ TILE_COLORS = {
     2048: (4, 1),     # Blue bold
 }
 
+# The board is packed into one int with a 4-bit lane per cell holding the
+# tile's exponent (0 = empty, 1 = 2, 2 = 4, ...). Cell (x, y) lives at
+# bits 4 * (y * size + x), so each row is a contiguous run of lanes.
+TILE_BITS = 4
+TILE_MASK = (1 << TILE_BITS) - 1
+MAX_EXPONENT = TILE_MASK    # 32768, the largest tile a lane can hold
+WIN_EXPONENT = 11           # 2048
+
+# Slide results keyed by packed row: row -> (slid row, points scored).
+# Filled on first sight of each row, then every move is a dict lookup.
+# Left slides don't depend on board size; right slides do, so those
+# tables are kept per size.
+SLIDE_TABLE = {}
+SLIDE_RIGHT_TABLES = {}
+
+
+def slide_row(row):
+    """Slide and merge a packed row towards lane 0, returning (new_row, points)."""
+    # Collect non-empty tiles, lowest lane first
+    tiles = []
+    while row:
+        if row & TILE_MASK:
+            tiles.append(row & TILE_MASK)
+        row >>= TILE_BITS
+
+    # Merge adjacent equal tiles
+    merged = []
+    points = 0
+    skip = False
+    for i in range(len(tiles)):
+        if skip:
+            skip = False
+            continue
+
+        if (i + 1 < len(tiles) and tiles[i] == tiles[i + 1]
+                and tiles[i] < MAX_EXPONENT):
+            merged.append(tiles[i] + 1)
+            points += 1 << (tiles[i] + 1)
+            skip = True
+        else:
+            merged.append(tiles[i])
+
+    # Repack; lanes past the last tile are left empty
+    new_row = 0
+    for exponent in reversed(merged):
+        new_row = (new_row << TILE_BITS) | exponent
+
+    return new_row, points
+
 
 class Game2048:
     def __init__(self, size=4):
         self.size = size
-        self.board = [[0] * size for _ in range(size)]
+        self.board = 0
+        self.row_bits = TILE_BITS * size
+        self.row_mask = (1 << self.row_bits) - 1
+        # Lowest bit of every lane, for whole-board lane tests
+        self.lane_low_bits = sum(1 << (TILE_BITS * i) for i in range(size * size))
+        self.lane_high_bits = self.lane_low_bits << (TILE_BITS - 1)
+        self.last_col_lanes = sum(1 << (TILE_BITS * (y * size + size - 1)) for y in range(size))
+        self.slide_right_table = SLIDE_RIGHT_TABLES.setdefault(size, {})
         self.score = 0
         self.best_score = 0
         self.game_over = False
@@ -42,67 +97,96 @@ class Game2048:
         self.spawn_tile()
         self.spawn_tile()
 
+    def get(self, x, y):
+        """Return the tile value at (x, y), 0 if empty."""
+        exponent = (self.board >> (TILE_BITS * (y * self.size + x))) & TILE_MASK
+        return 1 << exponent if exponent else 0
+
     def spawn_tile(self):
         """Spawn a new tile (2 or 4) in a random empty cell."""
-        empty_cells = [(x, y) for y in range(self.size) for x in range(self.size)
-                       if self.board[y][x] == 0]
-
-        if empty_cells:
-            x, y = random.choice(empty_cells)
-            self.board[y][x] = 4 if random.random() < 0.1 else 2
+        # Fold each lane onto its low bit, then keep the low bits of the
+        # lanes that were all zero: one set bit per empty cell
+        occupied = self.board | (self.board >> 1)
+        occupied |= occupied >> 2
+        empty = ~occupied & self.lane_low_bits
 
-    def slide_row_left(self, row):
-        """Slide and merge a single row to the left."""
-        # Remove zeros
-        new_row = [x for x in row if x != 0]
-
-        # Merge adjacent equal tiles
-        merged = []
-        skip = False
-        for i in range(len(new_row)):
-            if skip:
-                skip = False
-                continue
-
-            if i + 1 < len(new_row) and new_row[i] == new_row[i + 1]:
-                merged_value = new_row[i] * 2
-                merged.append(merged_value)
-                self.score += merged_value
-                skip = True
-            else:
-                merged.append(new_row[i])
+        if empty:
+            # Drop a random number of lowest set bits to pick one empty cell
+            for _ in range(random.randrange(bin(empty).count('1'))):
+                empty &= empty - 1
+            cell = empty & -empty
 
-        # Pad with zeros
-        while len(merged) < self.size:
-            merged.append(0)
+            exponent = 2 if random.random() < 0.1 else 1
+            self.board |= cell * exponent
 
-        return merged
+    def slide_row_left(self, row):
+        """Slide and merge a single packed row to the left."""
+        result = SLIDE_TABLE.get(row)
+        if result is None:
+            result = SLIDE_TABLE[row] = slide_row(row)
+
+        new_row, points = result
+        self.score += points
+        return new_row
+
+    def slide_row_right(self, row):
+        """Slide and merge a single packed row to the right."""
+        result = self.slide_right_table.get(row)
+        if result is None:
+            new_row, points = slide_row(self.reverse_row(row))
+            result = self.slide_right_table[row] = (self.reverse_row(new_row), points)
+
+        new_row, points = result
+        self.score += points
+        return new_row
+
+    def reverse_row(self, row):
+        """Mirror the lanes of a packed row."""
+        reversed_row = 0
+        for _ in range(self.size):
+            reversed_row = (reversed_row << TILE_BITS) | (row & TILE_MASK)
+            row >>= TILE_BITS
+        return reversed_row
+
+    def transpose(self, board):
+        """Swap rows and columns of a packed board."""
+        size = self.size
+        if size == 4:
+            # Standard 4x4 nibble transpose: swap 4-bit lanes across the
+            # diagonal within each 2x2 block, then swap the 2x2 blocks
+            a = ((board & 0xF0F00F0FF0F00F0F) |
+                 ((board & 0x0000F0F00000F0F0) << 12) |
+                 ((board & 0x0F0F00000F0F0000) >> 12))
+            return ((a & 0xFF00FF0000FF00FF) |
+                    ((a & 0x00FF00FF00000000) >> 24) |
+                    ((a & 0x00000000FF00FF00) << 24))
+
+        transposed = 0
+        for y in range(size):
+            for x in range(size):
+                lane = (board >> (TILE_BITS * (y * size + x))) & TILE_MASK
+                transposed |= lane << (TILE_BITS * (x * size + y))
+        return transposed
 
     def move(self, direction):
         """Move tiles in the given direction."""
-        old_board = copy.deepcopy(self.board)
-
-        if direction == 'left':
-            for y in range(self.size):
-                self.board[y] = self.slide_row_left(self.board[y])
-
-        elif direction == 'right':
-            for y in range(self.size):
-                self.board[y] = self.slide_row_left(self.board[y][::-1])[::-1]
-
-        elif direction == 'up':
-            for x in range(self.size):
-                col = [self.board[y][x] for y in range(self.size)]
-                new_col = self.slide_row_left(col)
-                for y in range(self.size):
-                    self.board[y][x] = new_col[y]
-
-        elif direction == 'down':
-            for x in range(self.size):
-                col = [self.board[y][x] for y in range(self.size)]
-                new_col = self.slide_row_left(col[::-1])[::-1]
-                for y in range(self.size):
-                    self.board[y][x] = new_col[y]
+        old_board = self.board
+
+        # Columns are handled as rows of the transposed board
+        vertical = direction in ('up', 'down')
+        board = self.transpose(old_board) if vertical else old_board
+        towards_start = direction in ('left', 'up')
+
+        new_board = 0
+        for y in range(self.size):
+            row = (board >> (self.row_bits * y)) & self.row_mask
+            if towards_start:
+                row = self.slide_row_left(row)
+            else:
+                row = self.slide_row_right(row)
+            new_board |= row << (self.row_bits * y)
+
+        self.board = self.transpose(new_board) if vertical else new_board
 
         # Check if board changed
         if self.board != old_board:
@@ -112,35 +196,49 @@ class Game2048:
         if self.score > self.best_score:
             self.best_score = self.score
 
+    def has_zero_lane(self, value):
+        """Return True if any board lane of a packed value is zero."""
+        return bool((value - self.lane_low_bits) & ~value & self.lane_high_bits)
+
     def check_game_state(self):
         """Check if game is won or over."""
+        board = self.board
+
         # Check for 2048 tile
         if not self.continue_playing:
-            for row in self.board:
-                if 2048 in row:
-                    self.won = True
-                    return
+            if self.has_zero_lane(board ^ (self.lane_low_bits * WIN_EXPONENT)):
+                self.won = True
+                return
 
         # Check for empty cells
-        for row in self.board:
-            if 0 in row:
-                return
+        if self.has_zero_lane(board):
+            return
 
-        # Check for possible merges
-        for y in range(self.size):
-            for x in range(self.size):
-                current = self.board[y][x]
-                # Check right neighbor
-                if x + 1 < self.size and self.board[y][x + 1] == current:
-                    return
-                # Check bottom neighbor
-                if y + 1 < self.size and self.board[y + 1][x] == current:
-                    return
+        # Check for possible merges: XOR with the right or lower neighbour
+        # leaves a zero lane where two tiles match. The last column would
+        # be compared with the next row's first cell, so force it non-zero.
+        if self.has_zero_lane((board ^ (board >> TILE_BITS)) | self.last_col_lanes):
+            return
+        if self.has_zero_lane(board ^ (board >> self.row_bits)):
+            return
 
         self.game_over = True
 
 
-def draw_tile(stdscr, y, x, value, cell_width=7, cell_height=3):
+def safe_addstr(stdscr, y, x, text, attr, max_y, max_x):
+    """Write text clipped to a max_y x max_x screen so addstr cannot fail."""
+    if y < 0 or y >= max_y or x >= max_x:
+        return
+    if x < 0:
+        text = text[-x:]
+        x = 0
+    # Writing the bottom-right cell makes curses report an error
+    limit = max_x - x - (1 if y == max_y - 1 else 0)
+    if limit > 0 and text:
+        stdscr.addstr(y, x, text[:limit], attr)
+
+
+def draw_tile(stdscr, y, x, value, max_y, max_x, cell_width=7, cell_height=3):
     """Draw a single tile."""
     color_pair, bold = TILE_COLORS.get(value, (7, 0))
     attr = curses.color_pair(color_pair)
@@ -150,65 +248,81 @@ def draw_tile(stdscr, y, x, value, cell_width=7, cell_height=3):
     if value == 0:
         # Empty cell
         for row in range(cell_height):
-            try:
-                stdscr.addstr(y + row, x, '.' + ' ' * (cell_width - 2) + '.', curses.color_pair(8))
-            except curses.error:
-                pass
+            safe_addstr(stdscr, y + row, x, '.' + ' ' * (cell_width - 2) + '.',
+                        curses.color_pair(8), max_y, max_x)
     else:
         # Tile with value
         value_str = str(value).center(cell_width - 2)
-        try:
-            stdscr.addstr(y, x, '+' + '-' * (cell_width - 2) + '+', attr)
-            stdscr.addstr(y + 1, x, '|' + value_str + '|', attr | curses.A_BOLD)
-            stdscr.addstr(y + 2, x, '+' + '-' * (cell_width - 2) + '+', attr)
-        except curses.error:
-            pass
+        edge = '+' + '-' * (cell_width - 2) + '+'
+        safe_addstr(stdscr, y, x, edge, attr, max_y, max_x)
+        safe_addstr(stdscr, y + 1, x, '|' + value_str + '|', attr | curses.A_BOLD, max_y, max_x)
+        safe_addstr(stdscr, y + 2, x, edge, attr, max_y, max_x)
 
 
-def draw_game(stdscr, game, offset_y, offset_x):
-    """Draw the game board."""
+def make_chrome(size, offset_y, offset_x, max_y, max_x):
+    """Render the static title and controls line into an off-screen pad."""
     cell_width = 7
     cell_height = 3
+    chrome = curses.newpad(max_y, max_x)
 
     # Draw title
     title = "2048"
-    stdscr.addstr(offset_y - 4, offset_x + (cell_width * game.size) // 2 - 2,
-                  title, curses.color_pair(3) | curses.A_BOLD)
+    safe_addstr(chrome, offset_y - 4, offset_x + (cell_width * size) // 2 - 2,
+                title, curses.color_pair(3) | curses.A_BOLD, max_y, max_x)
+
+    # Draw controls
+    controls = "Arrow keys / WASD: Move | R: New Game | Q: Quit"
+    safe_addstr(chrome, offset_y + size * cell_height + 1, offset_x, controls,
+                curses.color_pair(8), max_y, max_x)
+
+    return chrome
+
+
+def draw_game(stdscr, game, offset_y, offset_x, chrome):
+    """Draw the game board."""
+    cell_width = 7
+    cell_height = 3
+    max_y, max_x = stdscr.getmaxyx()
+
+    # Start from the pre-rendered title and controls
+    chrome.overwrite(stdscr, 0, 0, 0, 0, max_y - 1, max_x - 1)
 
     # Draw scores
     score_text = f"Score: {game.score}"
     best_text = f"Best: {game.best_score}"
-    stdscr.addstr(offset_y - 2, offset_x, score_text, curses.color_pair(7) | curses.A_BOLD)
-    stdscr.addstr(offset_y - 2, offset_x + cell_width * game.size - len(best_text),
-                  best_text, curses.color_pair(6) | curses.A_BOLD)
+    safe_addstr(stdscr, offset_y - 2, offset_x, score_text,
+                curses.color_pair(7) | curses.A_BOLD, max_y, max_x)
+    safe_addstr(stdscr, offset_y - 2, offset_x + cell_width * game.size - len(best_text),
+                best_text, curses.color_pair(6) | curses.A_BOLD, max_y, max_x)
 
     # Draw board
     for y in range(game.size):
         for x in range(game.size):
             tile_x = offset_x + x * cell_width
             tile_y = offset_y + y * cell_height
-            draw_tile(stdscr, tile_y, tile_x, game.board[y][x], cell_width, cell_height)
-
-    # Draw controls
-    controls = "Arrow keys / WASD: Move | R: New Game | Q: Quit"
-    stdscr.addstr(offset_y + game.size * cell_height + 1, offset_x, controls, curses.color_pair(8))
+            draw_tile(stdscr, tile_y, tile_x, game.get(x, y), max_y, max_x,
+                      cell_width, cell_height)
 
     # Draw win/lose message
     if game.won and not game.continue_playing:
         msg = " YOU WIN! Press C to continue or R for new game "
         y = offset_y + (game.size * cell_height) // 2
         x = offset_x + (game.size * cell_width) // 2 - len(msg) // 2
-        stdscr.addstr(y, x, msg, curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD)
+        safe_addstr(stdscr, y, x, msg, curses.color_pair(2) | curses.A_REVERSE | curses.A_BOLD,
+                    max_y, max_x)
     elif game.game_over:
         msg = " GAME OVER! Press R for new game "
         y = offset_y + (game.size * cell_height) // 2
         x = offset_x + (game.size * cell_width) // 2 - len(msg) // 2
-        stdscr.addstr(y, x, msg, curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD)
+        safe_addstr(stdscr, y, x, msg, curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD,
+                    max_y, max_x)
+
+    stdscr.noutrefresh()
 
 
 def draw_title_screen(stdscr, width, height):
     """Draw title screen."""
-    stdscr.clear()
+    stdscr.erase()
 
     title = [
         " ___   ___  _  _   ___  ",
@@ -223,10 +337,7 @@ def draw_title_screen(stdscr, width, height):
     for i, line in enumerate(title):
         x = width // 2 - len(line) // 2
         color = curses.color_pair((i % 5) + 2)
-        try:
-            stdscr.addstr(start_y + i, x, line, color | curses.A_BOLD)
-        except curses.error:
-            pass
+        safe_addstr(stdscr, start_y + i, x, line, color | curses.A_BOLD, height, width)
 
     instructions = [
         "",
@@ -238,10 +349,7 @@ def draw_title_screen(stdscr, width, height):
     for i, line in enumerate(instructions):
         y = height // 2 + i
         x = width // 2 - len(line) // 2
-        try:
-            stdscr.addstr(y, x, line, curses.color_pair(7))
-        except curses.error:
-            pass
+        safe_addstr(stdscr, y, x, line, curses.color_pair(7), height, width)
 
     stdscr.refresh()
 
@@ -282,10 +390,11 @@ def main(stdscr):
     offset_x = (width - board_width) // 2
     offset_y = (height - board_height) // 2
 
+    chrome = make_chrome(game.size, offset_y, offset_x, height, width)
+
     while True:
-        stdscr.clear()
-        draw_game(stdscr, game, offset_y, offset_x)
-        stdscr.refresh()
+        draw_game(stdscr, game, offset_y, offset_x, chrome)
+        curses.doupdate()
 
         key = stdscr.getch()
 
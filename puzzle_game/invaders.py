@@ -11,14 +11,26 @@ Controls:
 """
 
 import curses
+import math
 import random
 import time
+from array import array
+from types import SimpleNamespace
 
 # Game settings
 PLAYER_LIVES = 3
 INVADER_ROWS = 5
 INVADER_COLS = 11
 INVADER_POINTS = [30, 20, 20, 10, 10]  # Points per row (top to bottom)
+INVADER_SPACING_X = 6  # Also the collision grid cell size
+INVADER_SPACING_Y = 3
+
+# Timing
+FRAME_DT = 1 / 60      # Fixed simulation step (seconds)
+MAX_LAG = 0.25         # Drop simulation time beyond this after a stall
+BULLET_SPEED = 30      # Rows per second
+UFO_SPEED = 30         # Columns per second
+EXPLOSION_RATE = 9     # Animation frames per second
 
 # Sprites
 PLAYER_SPRITE = [" /^\\ ", "/###\\"]
@@ -33,6 +45,11 @@ INVADER_SPRITES = [
     [[" |o| ", " / \\ "], [" |o| ", " \\ / "]],
 ]
 
+# Attribute words and (line0, line1, attr) per type_id * 2 + frame;
+# both filled in by init_colors()
+ATTR = SimpleNamespace()
+SPRITE_LUT = []
+
 UFO_SPRITE = "<=(@)=>"
 UFO_WIDTH = 7
 UFO_POINTS = [50, 100, 150, 300]
@@ -42,6 +59,51 @@ EXPLOSION_FRAMES = ["\\*/", " * ", " . ", "   "]
 BARRIER_CHAR = '#'
 
 
+def step_invaders(inv_x, inv_y, inv_alive, direction, width, player_y):
+    """Move the living invaders one step, dropping a row at the screen edge.
+
+    Updates the position arrays in place and returns
+    (new_direction, moved_down, reached_bottom).
+    """
+    # One pass for the formation bounds
+    min_x = max_x = None
+    max_y = 0
+    for x, y, alive in zip(inv_x, inv_y, inv_alive):
+        if alive:
+            if min_x is None:
+                min_x = max_x = x
+            elif x < min_x:
+                min_x = x
+            elif x > max_x:
+                max_x = x
+            if y > max_y:
+                max_y = y
+    if min_x is None:
+        return direction, False, False
+
+    move_down = False
+    if direction > 0 and max_x + 5 >= width - 2:
+        move_down = True
+        direction = -1
+    elif direction < 0 and min_x <= 2:
+        move_down = True
+        direction = 1
+
+    # One pass to move them
+    if move_down:
+        for i, alive in enumerate(inv_alive):
+            if alive:
+                inv_y[i] += 1
+        max_y += 1
+    else:
+        step = direction * 2
+        for i, alive in enumerate(inv_alive):
+            if alive:
+                inv_x[i] += step
+
+    return direction, move_down, max_y >= player_y - 2
+
+
 class Player:
     def __init__(self, x, y):
         self.x = x
@@ -56,24 +118,6 @@ class Player:
             self.x = new_x
 
 
-class Bullet:
-    def __init__(self, x, y, dy, is_player=True):
-        self.x = x
-        self.y = y
-        self.dy = dy
-        self.is_player = is_player
-        self.active = True
-
-
-class Invader:
-    def __init__(self, x, y, type_id, points):
-        self.x = x
-        self.y = y
-        self.type_id = type_id
-        self.points = points
-        self.alive = True
-
-
 class UFO:
     def __init__(self, x, y, direction):
         self.x = x
@@ -83,17 +127,9 @@ class UFO:
         self.points = random.choice(UFO_POINTS)
 
 
-class Explosion:
-    def __init__(self, x, y):
-        self.x = x
-        self.y = y
-        self.frame = 0
-        self.active = True
-
-
 class Barrier:
     def __init__(self, x, y):
-        self.blocks = set()
+        self.blocks = set()  # Packed (y << 16) | x block keys
         # Create barrier shape
         pattern = [
             "  ######  ",
@@ -106,7 +142,31 @@ class Barrier:
         for row, line in enumerate(pattern):
             for col, char in enumerate(line):
                 if char == '#':
-                    self.blocks.add((x + col, y + row))
+                    self.blocks.add((y + row) << 16 | (x + col))
+        self.runs = None
+
+    def remove(self, block):
+        """Destroy a block if it is still standing."""
+        if block in self.blocks:
+            self.blocks.discard(block)
+            self.runs = None
+
+    def get_runs(self):
+        """Return the blocks as (y, x, text) horizontal runs for drawing."""
+        if self.runs is None:
+            self.runs = []
+            run_y = run_x = run_len = None
+            for key in sorted(self.blocks):
+                bx, by = key & 0xFFFF, key >> 16
+                if by == run_y and bx == run_x + run_len:
+                    run_len += 1
+                    continue
+                if run_len:
+                    self.runs.append((run_y, run_x, BARRIER_CHAR * run_len))
+                run_y, run_x, run_len = by, bx, 1
+            if run_len:
+                self.runs.append((run_y, run_x, BARRIER_CHAR * run_len))
+        return self.runs
 
 
 class Game:
@@ -120,10 +180,28 @@ class Game:
         self.paused = False
 
         self.player = None
-        self.invaders = []
-        self.bullets = []
-        self.explosions = []
+        # Invaders are stored as parallel arrays indexed by invader number
+        self.inv_x = array('h')
+        self.inv_y = array('h')
+        self.inv_type = array('b')
+        self.inv_points = array('h')
+        self.inv_alive = bytearray()
+        self.alive_invader_count = 0
+        self.invader_grid = {}
+        self.bottom_invader_per_col = {}  # column -> index of its lowest alive invader
+        self.invader_fire_countdown = 0   # Ticks left before the next invader shot
+        # Player bullets fly up and invader bullets down, kept apart so
+        # each update loop only runs the checks for its own side
+        self.player_bullet_x = array('h')
+        self.player_bullet_y = array('d')
+        self.enemy_bullet_x = array('h')
+        self.enemy_bullet_y = array('d')
+        # Explosions: position and animation frame (fractional) each
+        self.exp_x = array('h')
+        self.exp_y = array('h')
+        self.exp_frame = array('d')
         self.barriers = []
+        self.barrier_blocks = {}  # Block key -> Barrier owning that block
         self.ufo = None
 
         self.invader_direction = 1
@@ -134,6 +212,12 @@ class Game:
         self.ufo_timer = 0
         self.ufo_spawn_delay = 15
 
+        # Render cache: header text and the values it was built from,
+        # plus the game-over box rows once the game has ended
+        self.header_state = None
+        self.header = ''
+        self.game_over_box = None
+
         self.init_game()
 
     def init_game(self):
@@ -152,8 +236,19 @@ class Game:
             by = self.height - 10
             self.barriers.append(Barrier(bx, by))
 
-        self.bullets = []
-        self.explosions = []
+        # Map every block key to its barrier so bullets need a single lookup
+        self.barrier_blocks = {}
+        for barrier in self.barriers:
+            for block in barrier.blocks:
+                self.barrier_blocks.setdefault(block, barrier)
+
+        self.player_bullet_x = array('h')
+        self.player_bullet_y = array('d')
+        self.enemy_bullet_x = array('h')
+        self.enemy_bullet_y = array('d')
+        self.exp_x = array('h')
+        self.exp_y = array('h')
+        self.exp_frame = array('d')
         self.ufo = None
         self.invader_direction = 1
         self.invader_frame = 0
@@ -161,8 +256,11 @@ class Game:
 
     def spawn_invaders(self):
         """Spawn a wave of invaders."""
-        self.invaders = []
-        start_x = (self.width - INVADER_COLS * 6) // 2
+        self.inv_x = array('h')
+        self.inv_y = array('h')
+        self.inv_type = array('b')
+        self.inv_points = array('h')
+        start_x = (self.width - INVADER_COLS * INVADER_SPACING_X) // 2
         start_y = 4
 
         for row in range(INVADER_ROWS):
@@ -170,13 +268,42 @@ class Game:
             points = INVADER_POINTS[row]
 
             for col in range(INVADER_COLS):
-                x = start_x + col * 6
-                y = start_y + row * 3
-                self.invaders.append(Invader(x, y, type_id, points))
+                self.inv_x.append(start_x + col * INVADER_SPACING_X)
+                self.inv_y.append(start_y + row * INVADER_SPACING_Y)
+                self.inv_type.append(type_id)
+                self.inv_points.append(points)
+
+        self.inv_alive = bytearray([1]) * len(self.inv_x)
+        self.alive_invader_count = len(self.inv_x)
+        self.bottom_invader_per_col = {
+            col: (INVADER_ROWS - 1) * INVADER_COLS + col for col in range(INVADER_COLS)
+        }
+        self.rebuild_invader_grid()
+        self.schedule_invader_fire()
+
+    def update_bottom_invader(self, col):
+        """Find the lowest alive invader left in a column."""
+        for i in range((INVADER_ROWS - 1) * INVADER_COLS + col, -1, -INVADER_COLS):
+            if self.inv_alive[i]:
+                self.bottom_invader_per_col[col] = i
+                return
+        del self.bottom_invader_per_col[col]
+
+    def rebuild_invader_grid(self):
+        """Index alive invaders by the grid cells their sprites cover."""
+        grid = {}
+        cell_w, cell_h = INVADER_SPACING_X, INVADER_SPACING_Y
+        for i, alive in enumerate(self.inv_alive):
+            if alive:
+                x, y = self.inv_x[i], self.inv_y[i]
+                for cy in range(y // cell_h, (y + 1) // cell_h + 1):
+                    for cx in range(x // cell_w, (x + 4) // cell_w + 1):
+                        grid.setdefault((cx, cy), []).append(i)
+        self.invader_grid = grid
 
     def update_speed(self):
         """Update invader speed based on remaining count and wave."""
-        alive_count = sum(1 for inv in self.invaders if inv.alive)
+        alive_count = self.alive_invader_count
         total = INVADER_ROWS * INVADER_COLS
 
         if alive_count == 0:
@@ -200,59 +327,52 @@ class Game:
     def fire_player_bullet(self):
         """Fire a bullet from the player."""
         # Limit player bullets on screen
-        player_bullets = sum(1 for b in self.bullets if b.is_player and b.active)
-        if player_bullets < 3 and self.player.alive:
-            bx = self.player.x + PLAYER_WIDTH // 2
-            by = self.player.y - 1
-            self.bullets.append(Bullet(bx, by, -1, True))
+        if len(self.player_bullet_x) < 3 and self.player.alive:
+            self.player_bullet_x.append(self.player.x + PLAYER_WIDTH // 2)
+            self.player_bullet_y.append(self.player.y - 1)
+
+    def schedule_invader_fire(self):
+        """Pick how many ticks pass before the next invader shot.
+
+        Invaders fire with a fixed chance each tick, so the wait is
+        geometric and can be drawn with one random number per shot.
+        """
+        chance = 0.02 + self.wave * 0.005
+        if chance >= 1:
+            self.invader_fire_countdown = 0
+        else:
+            self.invader_fire_countdown = int(math.log(1.0 - random.random()) / math.log(1.0 - chance))
 
     def fire_invader_bullet(self):
         """Random invader fires a bullet."""
-        alive_invaders = [inv for inv in self.invaders if inv.alive]
-        if alive_invaders and random.random() < 0.02 + self.wave * 0.005:
-            # Find bottom invaders in each column
-            columns = {}
-            for inv in alive_invaders:
-                col = inv.x
-                if col not in columns or inv.y > columns[col].y:
-                    columns[col] = inv
-
-            shooter = random.choice(list(columns.values()))
-            bx = shooter.x + 2
-            by = shooter.y + 2
-            self.bullets.append(Bullet(bx, by, 1, False))
-
-    def move_invaders(self):
-        """Move all invaders."""
-        alive_invaders = [inv for inv in self.invaders if inv.alive]
-        if not alive_invaders:
+        if not self.alive_invader_count:
+            return
+        if self.invader_fire_countdown > 0:
+            self.invader_fire_countdown -= 1
             return
 
-        # Check boundaries
-        min_x = min(inv.x for inv in alive_invaders)
-        max_x = max(inv.x for inv in alive_invaders) + 5
-        max_y = max(inv.y for inv in alive_invaders)
+        self.schedule_invader_fire()
 
-        move_down = False
+        # Only the bottom invader of a column can shoot
+        shooter = random.choice(list(self.bottom_invader_per_col.values()))
+        self.enemy_bullet_x.append(self.inv_x[shooter] + 2)
+        self.enemy_bullet_y.append(self.inv_y[shooter] + 2)
 
-        if self.invader_direction > 0 and max_x >= self.width - 2:
-            move_down = True
-            self.invader_direction = -1
-        elif self.invader_direction < 0 and min_x <= 2:
-            move_down = True
-            self.invader_direction = 1
+    def move_invaders(self):
+        """Move all invaders."""
+        if self.alive_invader_count == 0:
+            return
 
-        for inv in alive_invaders:
-            if move_down:
-                inv.y += 1
-            else:
-                inv.x += self.invader_direction * 2
+        self.invader_direction, _, reached_bottom = step_invaders(
+            self.inv_x, self.inv_y, self.inv_alive,
+            self.invader_direction, self.width, self.player.y)
 
-            # Check if invaders reached bottom
-            if inv.y >= self.player.y - 2:
-                self.game_over = True
+        # Check if invaders reached bottom
+        if reached_bottom:
+            self.game_over = True
 
         self.invader_frame = 1 - self.invader_frame
+        self.rebuild_invader_grid()
         self.update_speed()
 
     def spawn_ufo(self):
@@ -290,76 +410,31 @@ class Game:
             self.ufo_timer = 0
 
         if self.ufo and self.ufo.active:
-            self.ufo.x += self.ufo.direction * 0.5
+            self.ufo.x += self.ufo.direction * UFO_SPEED * dt
             if self.ufo.x < -UFO_WIDTH or self.ufo.x > self.width:
                 self.ufo = None
 
         # Update bullets
-        for bullet in self.bullets:
-            if not bullet.active:
-                continue
-
-            bullet.y += bullet.dy * 0.5
-
-            # Off screen
-            if bullet.y < 0 or bullet.y >= self.height:
-                bullet.active = False
-                continue
-
-            # Check barrier collision
-            for barrier in self.barriers:
-                bx, by = int(bullet.x), int(bullet.y)
-                if (bx, by) in barrier.blocks:
-                    barrier.blocks.discard((bx, by))
-                    barrier.blocks.discard((bx, by - bullet.dy))
-                    bullet.active = False
-                    break
-
-            if not bullet.active:
-                continue
-
-            if bullet.is_player:
-                # Hit invader
-                for inv in self.invaders:
-                    if inv.alive:
-                        if (inv.x <= bullet.x <= inv.x + 4 and
-                            inv.y <= bullet.y <= inv.y + 1):
-                            inv.alive = False
-                            bullet.active = False
-                            self.score += inv.points
-                            self.explosions.append(Explosion(inv.x + 1, inv.y))
-                            self.update_speed()
-                            break
-
-                # Hit UFO
-                if self.ufo and self.ufo.active:
-                    if (self.ufo.x <= bullet.x <= self.ufo.x + UFO_WIDTH and
-                        self.ufo.y <= bullet.y <= self.ufo.y + 1):
-                        self.score += self.ufo.points
-                        self.explosions.append(Explosion(int(self.ufo.x) + 2, self.ufo.y))
-                        self.ufo = None
-                        bullet.active = False
-
-            else:
-                # Hit player
-                if self.player.alive:
-                    if (self.player.x <= bullet.x <= self.player.x + PLAYER_WIDTH and
-                        self.player.y <= bullet.y <= self.player.y + 1):
-                        bullet.active = False
-                        self.player_hit()
-
-        # Update explosions
-        for exp in self.explosions:
-            exp.frame += 0.15
-            if exp.frame >= len(EXPLOSION_FRAMES):
-                exp.active = False
-
-        # Clean up
-        self.bullets = [b for b in self.bullets if b.active]
-        self.explosions = [e for e in self.explosions if e.active]
+        self.update_player_bullets(dt)
+        self.update_enemy_bullets(dt)
+
+        # Update explosions, compacting finished ones out in place
+        exp_x, exp_y, exp_frame = self.exp_x, self.exp_y, self.exp_frame
+        step = EXPLOSION_RATE * dt
+        kept = 0
+        for i in range(len(exp_frame)):
+            frame = exp_frame[i] + step
+            if frame < len(EXPLOSION_FRAMES):
+                exp_x[kept] = exp_x[i]
+                exp_y[kept] = exp_y[i]
+                exp_frame[kept] = frame
+                kept += 1
+        del exp_x[kept:]
+        del exp_y[kept:]
+        del exp_frame[kept:]
 
         # Check wave complete
-        if all(not inv.alive for inv in self.invaders):
+        if self.alive_invader_count == 0:
             self.wave += 1
             self.spawn_invaders()
             self.update_speed()
@@ -368,11 +443,116 @@ class Game:
         if self.score > self.high_score:
             self.high_score = self.score
 
+    def update_player_bullets(self, dt):
+        """Move player bullets up and resolve barrier, invader and UFO hits."""
+        bullet_x, bullet_y = self.player_bullet_x, self.player_bullet_y
+        step = BULLET_SPEED * dt
+        kept = 0
+
+        for i in range(len(bullet_x)):
+            x = bullet_x[i]
+            y = bullet_y[i] - step
+
+            if y < 0:
+                continue
+            if self.hit_barrier(int(y) << 16 | x, -1):
+                continue
+            if self.hit_invader(x, y) or self.hit_ufo(x, y):
+                continue
+
+            # Compact surviving bullets towards the front in place
+            bullet_x[kept] = x
+            bullet_y[kept] = y
+            kept += 1
+
+        del bullet_x[kept:]
+        del bullet_y[kept:]
+
+    def update_enemy_bullets(self, dt):
+        """Move invader bullets down and resolve barrier and player hits."""
+        bullet_x, bullet_y = self.enemy_bullet_x, self.enemy_bullet_y
+        player = self.player
+        step = BULLET_SPEED * dt
+        kept = 0
+
+        for i in range(len(bullet_x)):
+            x = bullet_x[i]
+            y = bullet_y[i] + step
+
+            if y >= self.height:
+                continue
+            if self.hit_barrier(int(y) << 16 | x, 1):
+                continue
+            if (player.alive and
+                player.x <= x <= player.x + PLAYER_WIDTH and
+                player.y <= y <= player.y + 1):
+                self.player_hit()
+                continue
+
+            # Compact surviving bullets towards the front in place
+            bullet_x[kept] = x
+            bullet_y[kept] = y
+            kept += 1
+
+        del bullet_x[kept:]
+        del bullet_y[kept:]
+
+    def hit_barrier(self, key, dy):
+        """Chip the barrier at a block key, if any, and report whether one was hit.
+
+        The block the bullet came from (one row back along dy) goes too.
+        """
+        barrier = self.barrier_blocks.pop(key, None)
+        if not barrier:
+            return False
+        barrier.remove(key)
+        behind = key - (dy << 16)
+        if self.barrier_blocks.get(behind) is barrier:
+            del self.barrier_blocks[behind]
+        barrier.remove(behind)
+        return True
+
+    def hit_invader(self, x, y):
+        """Kill the invader at (x, y), if any, and report whether one was hit."""
+        # Only invaders sharing the point's grid cell can be hit
+        cell = (x // INVADER_SPACING_X, int(y) // INVADER_SPACING_Y)
+        for i in self.invader_grid.get(cell, ()):
+            if self.inv_alive[i]:
+                ix, iy = self.inv_x[i], self.inv_y[i]
+                if ix <= x <= ix + 4 and iy <= y <= iy + 1:
+                    self.inv_alive[i] = 0
+                    self.score += self.inv_points[i]
+                    self.add_explosion(ix + 1, iy)
+                    self.alive_invader_count -= 1
+                    if self.bottom_invader_per_col[i % INVADER_COLS] == i:
+                        self.update_bottom_invader(i % INVADER_COLS)
+                    self.update_speed()
+                    return True
+        return False
+
+    def hit_ufo(self, x, y):
+        """Destroy the UFO if (x, y) is on it and report whether it was hit."""
+        ufo = self.ufo
+        if (ufo and ufo.active and
+            ufo.x <= x <= ufo.x + UFO_WIDTH and
+            ufo.y <= y <= ufo.y + 1):
+            self.score += ufo.points
+            self.add_explosion(int(ufo.x) + 2, ufo.y)
+            self.ufo = None
+            return True
+        return False
+
+    def add_explosion(self, x, y):
+        """Start an explosion animation at (x, y)."""
+        self.exp_x.append(x)
+        self.exp_y.append(y)
+        self.exp_frame.append(0)
+
     def player_hit(self):
         """Handle player being hit."""
         self.player.lives -= 1
         self.player.alive = False
-        self.explosions.append(Explosion(self.player.x + 1, self.player.y))
+        self.add_explosion(self.player.x + 1, self.player.y)
 
         if self.player.lives <= 0:
             self.game_over = True
@@ -380,104 +560,140 @@ class Game:
             self.player.respawn_timer = 2.0
 
 
-def draw_game(stdscr, game):
-    """Draw the game."""
-    stdscr.clear()
+def safe_addstr(stdscr, y, x, text, attr, max_y, max_x):
+    """Write text clipped to a max_y x max_x screen so addstr cannot fail."""
+    if y < 0 or y >= max_y or x >= max_x:
+        return
+    if x < 0:
+        text = text[-x:]
+        x = 0
+    # Writing the bottom-right cell makes curses report an error
+    limit = max_x - x - (1 if y == max_y - 1 else 0)
+    if limit > 0 and text:
+        stdscr.addstr(y, x, text[:limit], attr)
+
 
-    # Draw header
-    header = f" SCORE: {game.score:06d}  |  HIGH: {game.high_score:06d}  |  WAVE: {game.wave}  |  LIVES: {'A ' * game.player.lives}"
-    stdscr.addstr(0, 0, header[:game.width], curses.color_pair(7) | curses.A_BOLD)
+class ScreenBuffer:
+    """Shadow copy of the terminal so each frame only sends changed cells."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.shown = {}   # (y, x) -> (char, attr) currently on the terminal
+        self.cells = {}   # (y, x) -> (char, attr) of the frame being drawn
+
+    def put(self, y, x, text, attr=0):
+        """Draw text into the current frame, clipped to the screen."""
+        if not 0 <= y < self.height:
+            return
+        cells = self.cells
+        for cx, char in enumerate(text, x):
+            if 0 <= cx < self.width:
+                cells[(y, cx)] = (char, attr)
+
+    def flush(self, stdscr):
+        """Write the cells that differ from the terminal and start a new frame."""
+        cells, shown = self.cells, self.shown
+        changed = {pos: cell for pos, cell in cells.items() if shown.get(pos) != cell}
+        for pos in shown.keys() - cells.keys():
+            changed[pos] = (' ', 0)
+
+        # Adjacent changed cells with the same attribute go out in one call
+        run_y = run_x = run_attr = None
+        run = []
+        for y, x in sorted(changed):
+            char, attr = changed[(y, x)]
+            if y == run_y and x == run_x + len(run) and attr == run_attr:
+                run.append(char)
+                continue
+            if run:
+                safe_addstr(stdscr, run_y, run_x, ''.join(run), run_attr, self.height, self.width)
+            run_y, run_x, run_attr, run = y, x, attr, [char]
+        if run:
+            safe_addstr(stdscr, run_y, run_x, ''.join(run), run_attr, self.height, self.width)
+
+        self.shown = cells
+        self.cells = {}
+
+
+def draw_game(stdscr, game, screen):
+    """Draw the game, sending only cells that changed since the last frame."""
+    # Draw header, rebuilding the text only when a value in it changes
+    header_state = (game.score, game.high_score, game.wave, game.player.lives)
+    if header_state != game.header_state:
+        game.header_state = header_state
+        game.header = f" SCORE: {game.score:06d}  |  HIGH: {game.high_score:06d}  |  WAVE: {game.wave}  |  LIVES: {'A ' * game.player.lives}"[:game.width]
+    screen.put(0, 0, game.header, ATTR.ui)
 
     # Draw UFO
     if game.ufo and game.ufo.active:
         x = int(game.ufo.x)
         if 0 <= x < game.width - UFO_WIDTH:
-            stdscr.addstr(game.ufo.y, x, UFO_SPRITE, curses.color_pair(5) | curses.A_BOLD)
+            screen.put(game.ufo.y, x, UFO_SPRITE, ATTR.ufo)
 
     # Draw invaders
-    for inv in game.invaders:
-        if inv.alive and 0 <= inv.x < game.width - 4:
-            sprite = INVADER_SPRITES[inv.type_id][game.invader_frame]
-            color = curses.color_pair(inv.type_id + 1)
-            try:
-                stdscr.addstr(inv.y, inv.x, sprite[0], color | curses.A_BOLD)
-                stdscr.addstr(inv.y + 1, inv.x, sprite[1], color | curses.A_BOLD)
-            except curses.error:
-                pass
+    for i, alive in enumerate(game.inv_alive):
+        x, y = game.inv_x[i], game.inv_y[i]
+        if alive and 0 <= x < game.width - 4:
+            line0, line1, attr = SPRITE_LUT[game.inv_type[i] * 2 + game.invader_frame]
+            screen.put(y, x, line0, attr)
+            screen.put(y + 1, x, line1, attr)
 
     # Draw barriers
     for barrier in game.barriers:
-        for bx, by in barrier.blocks:
-            if 0 <= bx < game.width and 0 <= by < game.height:
-                try:
-                    stdscr.addstr(by, bx, BARRIER_CHAR, curses.color_pair(4))
-                except curses.error:
-                    pass
+        for y, x, run in barrier.get_runs():
+            screen.put(y, x, run, ATTR.barrier)
 
     # Draw player
     if game.player.alive:
-        try:
-            stdscr.addstr(game.player.y, game.player.x, PLAYER_SPRITE[0], curses.color_pair(4) | curses.A_BOLD)
-            stdscr.addstr(game.player.y + 1, game.player.x, PLAYER_SPRITE[1], curses.color_pair(4) | curses.A_BOLD)
-        except curses.error:
-            pass
+        screen.put(game.player.y, game.player.x, PLAYER_SPRITE[0], ATTR.player)
+        screen.put(game.player.y + 1, game.player.x, PLAYER_SPRITE[1], ATTR.player)
 
     # Draw bullets
-    for bullet in game.bullets:
-        if bullet.active:
-            by = int(bullet.y)
-            bx = int(bullet.x)
-            if 0 <= bx < game.width and 0 <= by < game.height:
-                char = '|' if bullet.is_player else 'v'
-                color = curses.color_pair(2 if bullet.is_player else 5)
-                try:
-                    stdscr.addstr(by, bx, char, color | curses.A_BOLD)
-                except curses.error:
-                    pass
+    for x, y in zip(game.player_bullet_x, game.player_bullet_y):
+        screen.put(int(y), x, '|', ATTR.player_bullet)
+    for x, y in zip(game.enemy_bullet_x, game.enemy_bullet_y):
+        screen.put(int(y), x, 'v', ATTR.enemy_bullet)
 
     # Draw explosions
-    for exp in game.explosions:
-        frame_idx = min(int(exp.frame), len(EXPLOSION_FRAMES) - 1)
-        try:
-            stdscr.addstr(exp.y, exp.x, EXPLOSION_FRAMES[frame_idx], curses.color_pair(2) | curses.A_BOLD)
-        except curses.error:
-            pass
+    for x, y, frame in zip(game.exp_x, game.exp_y, game.exp_frame):
+        frame_idx = min(int(frame), len(EXPLOSION_FRAMES) - 1)
+        screen.put(y, x, EXPLOSION_FRAMES[frame_idx], ATTR.explosion)
 
     # Draw pause overlay
     if game.paused:
         msg = " PAUSED - Press P to continue "
         x = game.width // 2 - len(msg) // 2
         y = game.height // 2
-        stdscr.addstr(y, x, msg, curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
+        screen.put(y, x, msg, ATTR.pause)
 
     # Draw game over
     if game.game_over:
-        lines = [
-            "  GAME OVER  ",
-            "",
-            f" Final Score: {game.score} ",
-            f" Wave: {game.wave} ",
-            "",
-            " R: Restart  Q: Quit ",
-        ]
-        box_width = max(len(line) for line in lines) + 4
-        box_height = len(lines) + 2
-        box_x = game.width // 2 - box_width // 2
-        box_y = game.height // 2 - box_height // 2
-
-        for i in range(box_height):
-            try:
-                stdscr.addstr(box_y + i, box_x, ' ' * box_width, curses.color_pair(5) | curses.A_REVERSE)
-            except curses.error:
-                pass
-
-        for i, line in enumerate(lines):
-            try:
+        # The final score and wave no longer change, so lay the box out once
+        if game.game_over_box is None:
+            lines = [
+                "  GAME OVER  ",
+                "",
+                f" Final Score: {game.score} ",
+                f" Wave: {game.wave} ",
+                "",
+                " R: Restart  Q: Quit ",
+            ]
+            box_width = max(len(line) for line in lines) + 4
+            box_height = len(lines) + 2
+            box_x = game.width // 2 - box_width // 2
+            box_y = game.height // 2 - box_height // 2
+
+            game.game_over_box = [(box_y + i, box_x, ' ' * box_width, ATTR.box)
+                                  for i in range(box_height)]
+            for i, line in enumerate(lines):
                 lx = game.width // 2 - len(line) // 2
-                stdscr.addstr(box_y + 1 + i, lx, line, curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD)
-            except curses.error:
-                pass
+                game.game_over_box.append((box_y + 1 + i, lx, line, ATTR.box_text))
+
+        for y, x, text, attr in game.game_over_box:
+            screen.put(y, x, text, attr)
 
+    screen.flush(stdscr)
     stdscr.refresh()
 
 
@@ -501,14 +717,11 @@ def draw_title(stdscr, width, height):
 
     start_y = height // 2 - len(title) // 2 - 4
 
-    colors = [1, 1, 1, 1, 1, 7, 4, 4, 4, 4, 4]
+    colors = [ATTR.inv_top] * 5 + [ATTR.ui] + [ATTR.player] * 5
     for i, line in enumerate(title):
         x = width // 2 - len(line) // 2
-        if x >= 0 and start_y + i < height:
-            try:
-                stdscr.addstr(start_y + i, x, line, curses.color_pair(colors[i]) | curses.A_BOLD)
-            except curses.error:
-                pass
+        if x >= 0:
+            safe_addstr(stdscr, start_y + i, x, line, colors[i], height, width)
 
     # Instructions
     instructions = [
@@ -524,31 +737,24 @@ def draw_title(stdscr, width, height):
     start_y = height // 2 + 4
     for i, line in enumerate(instructions):
         x = width // 2 - len(line) // 2
-        color = curses.color_pair(2) if i == len(instructions) - 1 else curses.color_pair(7)
-        if 0 <= start_y + i < height:
-            try:
-                stdscr.addstr(start_y + i, max(0, x), line, color)
-            except curses.error:
-                pass
+        color = ATTR.prompt if i == len(instructions) - 1 else ATTR.text
+        safe_addstr(stdscr, start_y + i, max(0, x), line, color, height, width)
 
     # Invader preview
     preview_y = height - 6
     preview_x = width // 2 - 15
 
     previews = [
-        (" {o} ", 30, 1),
-        (" dOb ", 20, 2),
-        (" |o| ", 10, 3),
+        (" {o} ", 30, ATTR.inv_top),
+        (" dOb ", 20, ATTR.inv_mid),
+        (" |o| ", 10, ATTR.inv_bot),
     ]
 
     for i, (sprite, pts, color) in enumerate(previews):
         x = preview_x + i * 12
         if x >= 0 and x + 10 < width:
-            try:
-                stdscr.addstr(preview_y, x, sprite, curses.color_pair(color) | curses.A_BOLD)
-                stdscr.addstr(preview_y + 1, x, f"={pts}pts", curses.color_pair(7))
-            except curses.error:
-                pass
+            safe_addstr(stdscr, preview_y, x, sprite, color, height, width)
+            safe_addstr(stdscr, preview_y + 1, x, f"={pts}pts", ATTR.text, height, width)
 
     stdscr.refresh()
 
@@ -566,6 +772,32 @@ def init_colors():
     curses.init_pair(6, curses.COLOR_BLUE, -1)
     curses.init_pair(7, curses.COLOR_WHITE, -1)    # UI
 
+    # Combine pairs and styles once instead of on every draw call
+    bold = curses.A_BOLD
+    ATTR.inv_top = curses.color_pair(1) | bold
+    ATTR.inv_mid = curses.color_pair(2) | bold
+    ATTR.inv_bot = curses.color_pair(3) | bold
+    ATTR.player = curses.color_pair(4) | bold
+    ATTR.barrier = curses.color_pair(4)
+    ATTR.ufo = curses.color_pair(5) | bold
+    ATTR.player_bullet = curses.color_pair(2) | bold
+    ATTR.enemy_bullet = curses.color_pair(5) | bold
+    ATTR.explosion = curses.color_pair(2) | bold
+    ATTR.pause = curses.color_pair(3) | curses.A_REVERSE | bold
+    ATTR.box = curses.color_pair(5) | curses.A_REVERSE
+    ATTR.box_text = curses.color_pair(5) | curses.A_REVERSE | bold
+    ATTR.ui = curses.color_pair(7) | bold
+    ATTR.text = curses.color_pair(7)
+    ATTR.prompt = curses.color_pair(2)
+
+    # Pre-combine invader sprites with their attributes
+    invader_attrs = (ATTR.inv_top, ATTR.inv_mid, ATTR.inv_bot)
+    SPRITE_LUT[:] = [
+        (lines[0], lines[1], invader_attrs[type_id])
+        for type_id, frames in enumerate(INVADER_SPRITES)
+        for lines in frames
+    ]
+
 
 def main(stdscr):
     """Main game loop."""
@@ -587,11 +819,15 @@ def main(stdscr):
     stdscr.nodelay(True)
 
     game = Game(width, height)
-    last_time = time.time()
+    screen = ScreenBuffer(width, height)
+    stdscr.erase()
+    last_time = time.monotonic()
+    next_frame = last_time
+    lag = 0.0
 
     while True:
-        current_time = time.time()
-        dt = current_time - last_time
+        current_time = time.monotonic()
+        lag = min(lag + current_time - last_time, MAX_LAG)
         last_time = current_time
 
         # Handle input
@@ -616,11 +852,19 @@ def main(stdscr):
             elif key == ord(' '):
                 game.fire_player_bullet()
 
-        # Update and draw
-        game.update(dt)
-        draw_game(stdscr, game)
-
-        time.sleep(0.016)  # ~60 FPS
+        # Run fixed simulation steps, then draw once
+        while lag >= FRAME_DT:
+            game.update(FRAME_DT)
+            lag -= FRAME_DT
+        draw_game(stdscr, game, screen)
+
+        # Sleep until the next frame deadline; resync if we fell behind
+        next_frame += FRAME_DT
+        now = time.monotonic()
+        if next_frame > now:
+            time.sleep(next_frame - now)
+        else:
+            next_frame = now
 
 
 if __name__ == '__main__':
@@ -13,30 +13,128 @@ Controls:
 import curses
 import random
 import time
-
-# Difficulty settings
-DIFFICULTIES = {
-    'easy': {'width': 9, 'height': 9, 'mines': 10},
-    'medium': {'width': 16, 'height': 16, 'mines': 40},
-    'hard': {'width': 30, 'height': 16, 'mines': 99},
-}
-
-# Cell states
-HIDDEN = 0
-REVEALED = 1
-FLAGGED = 2
-
-# Colors for numbers
-NUMBER_COLORS = {
-    1: curses.COLOR_BLUE,
-    2: curses.COLOR_GREEN,
-    3: curses.COLOR_RED,
-    4: curses.COLOR_MAGENTA,
-    5: curses.COLOR_YELLOW,
-    6: curses.COLOR_CYAN,
-    7: curses.COLOR_WHITE,
-    8: curses.COLOR_WHITE,
-}
+from array import array
+from types import SimpleNamespace
+
+# Difficulty settings: (name, width, height, mines)
+DIFFICULTIES = (
+    ('easy', 9, 9, 10),
+    ('medium', 16, 16, 40),
+    ('hard', 30, 16, 99),
+)
+
+# (dx, dy) offsets of the 8 surrounding cells
+NEIGHBORS = tuple((dx, dy) for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dx or dy)
+
+# Cell bits: each board byte packs the flags below with the
+# adjacent-mine count in the low nibble. A cell is hidden when neither
+# REVEALED nor FLAGGED is set.
+MINE = 0x80
+REVEALED = 0x40
+FLAGGED = 0x20
+COUNT_MASK = 0x0F
+
+# Colors for numbers, indexed by adjacent-mine count
+NUMBER_COLORS = (
+    -1,
+    curses.COLOR_BLUE,
+    curses.COLOR_GREEN,
+    curses.COLOR_RED,
+    curses.COLOR_MAGENTA,
+    curses.COLOR_YELLOW,
+    curses.COLOR_CYAN,
+    curses.COLOR_WHITE,
+    curses.COLOR_WHITE,
+)
+
+# Cell glyphs, two columns each; NUM_GLYPHS is indexed by count
+HIDDEN_GLYPH = "[]"
+FLAG_GLYPH = ">F"
+MINE_GLYPH = "()"
+HIT_MINE_GLYPH = "><"
+NUM_GLYPHS = ("  ", " 1", " 2", " 3", " 4", " 5", " 6", " 7", " 8")
+
+# Attribute words, indexed by adjacent-mine count for NUM_ATTR;
+# both filled in by init_colors()
+ATTR = SimpleNamespace()
+NUM_ATTR = []
+
+
+def count_adjacent(mine_positions, cells, width, height):
+    """Add each mine to the adjacent-mine counts of its non-mine neighbours."""
+    for x, y in mine_positions:
+        for dx, dy in NEIGHBORS:
+            nx, ny = x + dx, y + dy
+            if 0 <= nx < width and 0 <= ny < height:
+                if not cells[ny * width + nx] & MINE:
+                    cells[ny * width + nx] += 1
+
+
+def flood_reveal(cells, x, y, width, height):
+    """Reveal the safe cell (x, y) and, if it is empty, the region around it.
+
+    Works on the packed board and returns the indices it revealed.
+    """
+    # Anything set in these bits stops the fill at a cell
+    shown = REVEALED | FLAGGED
+    not_empty = MINE | shown | COUNT_MASK
+
+    # Scan-line flood fill: reveal whole runs of empty cells a row at a
+    # time, plus the numbered cells that border them
+    revealed = []
+    if cells[y * width + x] & COUNT_MASK:
+        cells[y * width + x] |= REVEALED
+        revealed.append(y * width + x)
+    else:
+        # Seed stack of linear indices; each cell is pushed at most once
+        seeds = array('i', bytes(4 * width * height))
+        seeds[0] = y * width + x
+        top = 1
+        queued = bytearray(width * height)  # Cells already pushed as seeds
+        queued[y * width + x] = 1
+        while top:
+            top -= 1
+            seed = seeds[top]
+            if cells[seed] & shown:
+                continue
+            sy, sx = divmod(seed, width)
+            row = seed - sx
+
+            # Extend across the hidden empty cells on this row
+            left = right = sx
+            while left > 0 and not cells[row + left - 1] & not_empty:
+                left -= 1
+            while right < width - 1 and not cells[row + right + 1] & not_empty:
+                right += 1
+            lo, hi = max(left - 1, 0), min(right + 1, width - 1)
+
+            for i in range(row + lo, row + hi + 1):
+                if not cells[i] & shown:
+                    cells[i] |= REVEALED
+                    revealed.append(i)
+
+            # Rows above and below: reveal numbers, seed each run of empties
+            for ny in (sy - 1, sy + 1):
+                if 0 <= ny < height:
+                    nrow = ny * width
+                    in_run = False
+                    for nx in range(lo, hi + 1):
+                        i = nrow + nx
+                        cell = cells[i]
+                        if cell & shown:
+                            in_run = False
+                        elif cell & COUNT_MASK:
+                            cells[i] = cell | REVEALED
+                            revealed.append(i)
+                            in_run = False
+                        elif not in_run:
+                            if not queued[i]:
+                                queued[i] = 1
+                                seeds[top] = i
+                                top += 1
+                            in_run = True
+
+    return revealed
 
 
 class Minesweeper:
@@ -44,6 +142,18 @@ class Minesweeper:
         self.width = width
         self.height = height
         self.num_mines = num_mines
+
+        # Board: one packed byte per cell, row-major by y * width + x,
+        # allocated once and cleared in place by reset()
+        self.cells = bytearray(width * height)
+
+        # Render state: cells to redraw, or the whole screen
+        self.dirty = set()
+
+        self.reset()
+
+    def reset(self):
+        """Start a new game on the same board size."""
         self.cursor_x = 0
         self.cursor_y = 0
         self.game_over = False
@@ -51,45 +161,49 @@ class Minesweeper:
         self.first_click = True
         self.start_time = None
         self.end_time = None
+        self.safe_remaining = self.width * self.height - self.num_mines  # Safe cells still hidden
+        self.flag_count = 0
+        self.now = 0.0  # Clock for this frame, set by tick()
+        self.mine_cells = []  # Linear indices of the mines, once placed
+
+        self.cells[:] = bytes(len(self.cells))
 
-        # Initialize board
-        self.mines = [[False] * width for _ in range(height)]
-        self.state = [[HIDDEN] * width for _ in range(height)]
-        self.adjacent = [[0] * width for _ in range(height)]
+        self.dirty.clear()
+        self.needs_redraw = True
+        self.prev_header = None
 
     def place_mines(self, exclude_x, exclude_y):
         """Place mines randomly, excluding the first click area."""
+        width = self.width
         excluded = set()
         for dy in range(-1, 2):
             for dx in range(-1, 2):
                 nx, ny = exclude_x + dx, exclude_y + dy
-                if 0 <= nx < self.width and 0 <= ny < self.height:
-                    excluded.add((nx, ny))
-
-        positions = [(x, y) for x in range(self.width) for y in range(self.height)
-                     if (x, y) not in excluded]
-
-        mine_positions = random.sample(positions, min(self.num_mines, len(positions)))
-
-        for x, y in mine_positions:
-            self.mines[y][x] = True
-
-        # Calculate adjacent mine counts
-        for y in range(self.height):
-            for x in range(self.width):
-                if not self.mines[y][x]:
-                    count = 0
-                    for dy in range(-1, 2):
-                        for dx in range(-1, 2):
-                            nx, ny = x + dx, y + dy
-                            if 0 <= nx < self.width and 0 <= ny < self.height:
-                                if self.mines[ny][nx]:
-                                    count += 1
-                    self.adjacent[y][x] = count
+                if 0 <= nx < width and 0 <= ny < self.height:
+                    excluded.add(ny * width + nx)
+
+        candidates = array('i', [i for i in range(width * self.height) if i not in excluded])
+        num_mines = min(self.num_mines, len(candidates))
+
+        # Partial Fisher-Yates: shuffle just the first num_mines slots
+        for k in range(num_mines):
+            j = random.randrange(k, len(candidates))
+            candidates[k], candidates[j] = candidates[j], candidates[k]
+
+        self.mine_cells = candidates[:num_mines].tolist()
+        mine_positions = []
+        for i in self.mine_cells:
+            self.cells[i] |= MINE
+            y, x = divmod(i, width)
+            mine_positions.append((x, y))
+        self.safe_remaining = width * self.height - len(mine_positions)
+
+        count_adjacent(mine_positions, self.cells, width, self.height)
 
     def reveal(self, x, y):
         """Reveal a cell."""
-        if self.game_over or self.state[y][x] != HIDDEN:
+        width = self.width
+        if self.game_over or self.cells[y * width + x] & (REVEALED | FLAGGED):
             return
 
         if self.first_click:
@@ -97,123 +211,156 @@ class Minesweeper:
             self.start_time = time.time()
             self.place_mines(x, y)
 
-        if self.mines[y][x]:
+        cells = self.cells
+        if cells[y * width + x] & MINE:
             self.game_over = True
             self.won = False
             self.end_time = time.time()
+            self.needs_redraw = True
             # Reveal all mines
-            for my in range(self.height):
-                for mx in range(self.width):
-                    if self.mines[my][mx]:
-                        self.state[my][mx] = REVEALED
+            for i in self.mine_cells:
+                cell = cells[i]
+                if cell & FLAGGED:
+                    self.flag_count -= 1
+                cells[i] = (cell & ~FLAGGED) | REVEALED
             return
 
-        # Flood fill for empty cells
-        stack = [(x, y)]
-        while stack:
-            cx, cy = stack.pop()
-            if self.state[cy][cx] == REVEALED:
-                continue
-            if self.state[cy][cx] == FLAGGED:
-                continue
-
-            self.state[cy][cx] = REVEALED
-
-            if self.adjacent[cy][cx] == 0:
-                for dy in range(-1, 2):
-                    for dx in range(-1, 2):
-                        nx, ny = cx + dx, cy + dy
-                        if 0 <= nx < self.width and 0 <= ny < self.height:
-                            if self.state[ny][nx] == HIDDEN:
-                                stack.append((nx, ny))
-
+        revealed = flood_reveal(cells, x, y, width, self.height)
+        self.safe_remaining -= len(revealed)
+        self.dirty.update(revealed)
         self.check_win()
 
     def toggle_flag(self, x, y):
         """Toggle flag on a cell."""
-        if self.game_over or self.state[y][x] == REVEALED:
+        i = y * self.width + x
+        if self.game_over or self.cells[i] & REVEALED:
             return
 
-        if self.state[y][x] == HIDDEN:
-            self.state[y][x] = FLAGGED
+        self.cells[i] ^= FLAGGED
+        if self.cells[i] & FLAGGED:
+            self.flag_count += 1
         else:
-            self.state[y][x] = HIDDEN
+            self.flag_count -= 1
+        self.dirty.add(i)
 
-        self.check_win()
+    def move_cursor(self, dx, dy):
+        """Move the cursor, keeping it on the board."""
+        self.dirty.add(self.cursor_y * self.width + self.cursor_x)
+        self.cursor_x = min(max(self.cursor_x + dx, 0), self.width - 1)
+        self.cursor_y = min(max(self.cursor_y + dy, 0), self.height - 1)
+        self.dirty.add(self.cursor_y * self.width + self.cursor_x)
 
     def check_win(self):
         """Check if player has won."""
-        for y in range(self.height):
-            for x in range(self.width):
-                if not self.mines[y][x] and self.state[y][x] != REVEALED:
-                    return
-
-        self.game_over = True
-        self.won = True
-        self.end_time = time.time()
+        if self.safe_remaining == 0:
+            self.game_over = True
+            self.won = True
+            self.end_time = time.time()
+            self.needs_redraw = True
 
     def count_flags(self):
         """Count number of flags placed."""
-        count = 0
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.state[y][x] == FLAGGED:
-                    count += 1
-        return count
+        return self.flag_count
+
+    def tick(self):
+        """Read the clock once for the frame about to be drawn."""
+        self.now = time.time()
 
     def get_elapsed_time(self):
-        """Get elapsed time in seconds."""
+        """Get elapsed time in whole seconds as of the last tick()."""
         if self.start_time is None:
             return 0
-        end = self.end_time if self.end_time else time.time()
+        end = self.end_time if self.end_time else self.now
         return int(end - self.start_time)
 
 
+def cell_glyph(cell, is_cursor, lost):
+    """Return the (text, attr) to draw for a packed cell byte."""
+    if cell & FLAGGED:
+        text, attr = FLAG_GLYPH, ATTR.flag
+    elif not cell & REVEALED:
+        text, attr = HIDDEN_GLYPH, ATTR.hidden
+    elif cell & MINE:
+        text = HIT_MINE_GLYPH if (is_cursor and lost) else MINE_GLYPH
+        attr = ATTR.mine
+    else:
+        count = cell & COUNT_MASK
+        text, attr = NUM_GLYPHS[count], NUM_ATTR[count]
+
+    if is_cursor:
+        attr |= curses.A_REVERSE
+    return text, attr
+
+
+def draw_cell(stdscr, game, i, offset_y, offset_x):
+    """Draw the board cell at flat index i."""
+    y, x = divmod(i, game.width)
+    is_cursor = (i == game.cursor_y * game.width + game.cursor_x)
+    lost = game.game_over and not game.won
+    text, attr = cell_glyph(game.cells[i], is_cursor, lost)
+    stdscr.addstr(offset_y + y, offset_x + x * 2, text, attr)
+
+
 def draw_game(stdscr, game, offset_y, offset_x):
-    """Draw the game board."""
+    """Draw the game, repainting only cells that changed since the last call."""
     # Draw header
     flags = game.count_flags()
     mines_left = game.num_mines - flags
     elapsed = game.get_elapsed_time()
 
-    header = f" Mines: {mines_left:3d}  |  Time: {elapsed:3d}s "
-    stdscr.addstr(offset_y - 2, offset_x, header, curses.color_pair(7) | curses.A_BOLD)
-
-    # Draw board
+    if game.needs_redraw:
+        stdscr.erase()
+        game.prev_header = None
+
+    # Only format and write the header when a value in it changed
+    if (mines_left, elapsed) != game.prev_header:
+        game.prev_header = (mines_left, elapsed)
+        header = f" Mines: {mines_left:3d}  |  Time: {elapsed:3d}s "
+        stdscr.addstr(offset_y - 2, offset_x, header, ATTR.header)
+
+    if not game.needs_redraw:
+        for i in game.dirty:
+            draw_cell(stdscr, game, i, offset_y, offset_x)
+        game.dirty.clear()
+        return
+
+    game.needs_redraw = False
+    game.dirty.clear()
+
+    # Draw board a row at a time, one addstr per run of equal attributes.
+    # Everything the loop reads is bound to a local first.
+    addstr = stdscr.addstr
+    glyph = cell_glyph
+    cells = game.cells
+    width = game.width
+    cursor = game.cursor_y * width + game.cursor_x
+    lost = game.game_over and not game.won
     for y in range(game.height):
-        for x in range(game.width):
-            screen_x = offset_x + x * 2
-            screen_y = offset_y + y
-
-            is_cursor = (x == game.cursor_x and y == game.cursor_y)
-            attr = curses.A_REVERSE if is_cursor else 0
-
-            if game.state[y][x] == HIDDEN:
-                stdscr.addstr(screen_y, screen_x, "[]", curses.color_pair(8) | attr)
-            elif game.state[y][x] == FLAGGED:
-                stdscr.addstr(screen_y, screen_x, ">F", curses.color_pair(5) | curses.A_BOLD | attr)
-            elif game.mines[y][x]:
-                char = "><" if (x == game.cursor_x and y == game.cursor_y and game.game_over and not game.won) else "()"
-                stdscr.addstr(screen_y, screen_x, char, curses.color_pair(5) | curses.A_BOLD | attr)
-            else:
-                count = game.adjacent[y][x]
-                if count == 0:
-                    stdscr.addstr(screen_y, screen_x, "  ", attr)
-                else:
-                    stdscr.addstr(screen_y, screen_x, f" {count}", curses.color_pair(count) | curses.A_BOLD | attr)
+        row = y * width
+        screen_y = offset_y + y
+        run_x, run_attr, run = 0, None, []
+        for x in range(width):
+            text, attr = glyph(cells[row + x], row + x == cursor, lost)
+            if attr != run_attr and run:
+                addstr(screen_y, offset_x + run_x * 2, ''.join(run), run_attr)
+                run_x, run = x, []
+            run_attr = attr
+            run.append(text)
+        if run:
+            addstr(screen_y, offset_x + run_x * 2, ''.join(run), run_attr)
 
     # Draw status
     status_y = offset_y + game.height + 1
     if game.game_over:
         if game.won:
             msg = " YOU WIN! Press R for new game, Q to quit "
-            stdscr.addstr(status_y, offset_x, msg, curses.color_pair(4) | curses.A_BOLD)
+            stdscr.addstr(status_y, offset_x, msg, ATTR.win)
         else:
             msg = " GAME OVER! Press R for new game, Q to quit "
-            stdscr.addstr(status_y, offset_x, msg, curses.color_pair(5) | curses.A_BOLD)
+            stdscr.addstr(status_y, offset_x, msg, ATTR.mine)
     else:
         msg = " Space: Reveal | F: Flag | R: New | Q: Quit "
-        stdscr.addstr(status_y, offset_x, msg, curses.color_pair(7))
+        stdscr.addstr(status_y, offset_x, msg, ATTR.text)
 
 
 def select_difficulty(stdscr):
@@ -221,7 +368,6 @@ def select_difficulty(stdscr):
     stdscr.clear()
     curses.curs_set(0)
 
-    options = ['easy', 'medium', 'hard']
     selected = 0
 
     while True:
@@ -229,33 +375,30 @@ def select_difficulty(stdscr):
         height, width = stdscr.getmaxyx()
 
         title = "MINESWEEPER"
-        stdscr.addstr(height // 2 - 6, width // 2 - len(title) // 2, title,
-                      curses.color_pair(4) | curses.A_BOLD)
+        stdscr.addstr(height // 2 - 6, width // 2 - len(title) // 2, title, ATTR.win)
 
-        stdscr.addstr(height // 2 - 4, width // 2 - 10, "Select Difficulty:",
-                      curses.color_pair(7) | curses.A_BOLD)
+        stdscr.addstr(height // 2 - 4, width // 2 - 10, "Select Difficulty:", ATTR.header)
 
-        for i, opt in enumerate(options):
-            diff = DIFFICULTIES[opt]
-            text = f"{opt.upper():8} ({diff['width']}x{diff['height']}, {diff['mines']} mines)"
+        for i, (name, board_w, board_h, mines) in enumerate(DIFFICULTIES):
+            text = f"{name.upper():8} ({board_w}x{board_h}, {mines} mines)"
             y = height // 2 - 2 + i * 2
 
             if i == selected:
-                stdscr.addstr(y, width // 2 - 15, "> " + text, curses.color_pair(4) | curses.A_BOLD)
+                stdscr.addstr(y, width // 2 - 15, "> " + text, ATTR.win)
             else:
-                stdscr.addstr(y, width // 2 - 15, "  " + text, curses.color_pair(7))
+                stdscr.addstr(y, width // 2 - 15, "  " + text, ATTR.text)
 
-        stdscr.addstr(height // 2 + 5, width // 2 - 12, "Enter: Select  Q: Quit", curses.color_pair(8))
+        stdscr.addstr(height // 2 + 5, width // 2 - 12, "Enter: Select  Q: Quit", ATTR.hidden)
         stdscr.refresh()
 
         key = stdscr.getch()
 
         if key in [curses.KEY_UP, ord('w'), ord('W')]:
-            selected = (selected - 1) % len(options)
+            selected = (selected - 1) % len(DIFFICULTIES)
         elif key in [curses.KEY_DOWN, ord('s'), ord('S')]:
-            selected = (selected + 1) % len(options)
+            selected = (selected + 1) % len(DIFFICULTIES)
         elif key in [ord('\n'), ord(' ')]:
-            return options[selected]
+            return DIFFICULTIES[selected]
         elif key in [ord('q'), ord('Q')]:
             return None
 
@@ -274,26 +417,40 @@ def init_colors():
     curses.init_pair(7, curses.COLOR_WHITE, -1)
     curses.init_pair(8, 8, -1)  # Gray
 
+    # Combine pairs and styles once instead of on every cell
+    ATTR.hidden = curses.color_pair(8)
+    ATTR.flag = curses.color_pair(5) | curses.A_BOLD
+    ATTR.mine = curses.color_pair(5) | curses.A_BOLD
+    ATTR.win = curses.color_pair(4) | curses.A_BOLD
+    ATTR.header = curses.color_pair(7) | curses.A_BOLD
+    ATTR.text = curses.color_pair(7)
+    NUM_ATTR[:] = [0] + [curses.color_pair(n) | curses.A_BOLD for n in range(1, 9)]
+
 
 def main(stdscr):
     """Main game loop."""
     curses.curs_set(0)
     init_colors()
+    game = None
 
     while True:
         difficulty = select_difficulty(stdscr)
         if difficulty is None:
             break
 
-        settings = DIFFICULTIES[difficulty]
-        game = Minesweeper(settings['width'], settings['height'], settings['mines'])
+        # Reuse the previous board's buffers when the size is unchanged
+        size = difficulty[1:]
+        if game and (game.width, game.height, game.num_mines) == size:
+            game.reset()
+        else:
+            game = Minesweeper(*size)
 
         height, width = stdscr.getmaxyx()
         offset_x = (width - game.width * 2) // 2
         offset_y = (height - game.height) // 2
 
         while True:
-            stdscr.clear()
+            game.tick()
             draw_game(stdscr, game, offset_y, offset_x)
             stdscr.refresh()
 
@@ -305,13 +462,13 @@ def main(stdscr):
                 break  # New game
             elif not game.game_over:
                 if key in [curses.KEY_UP, ord('w'), ord('W')]:
-                    game.cursor_y = max(0, game.cursor_y - 1)
+                    game.move_cursor(0, -1)
                 elif key in [curses.KEY_DOWN, ord('s'), ord('S')]:
-                    game.cursor_y = min(game.height - 1, game.cursor_y + 1)
+                    game.move_cursor(0, 1)
                 elif key in [curses.KEY_LEFT, ord('a'), ord('A')]:
-                    game.cursor_x = max(0, game.cursor_x - 1)
+                    game.move_cursor(-1, 0)
                 elif key in [curses.KEY_RIGHT, ord('d'), ord('D')]:
-                    game.cursor_x = min(game.width - 1, game.cursor_x + 1)
+                    game.move_cursor(1, 0)
                 elif key in [ord(' '), ord('\n')]:
                     game.reveal(game.cursor_x, game.cursor_y)
                 elif key in [ord('f'), ord('F'), ord('m'), ord('M')]:
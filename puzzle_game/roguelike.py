@@ -13,13 +13,16 @@ Controls:
 
 import curses
 import random
+from collections import deque
+from itertools import islice
+from types import SimpleNamespace
 
-# Tile types
-FLOOR = '.'
-WALL = '#'
-DOOR = '+'
-STAIRS_DOWN = '>'
-STAIRS_UP = '<'
+# Tile types, stored as their byte codes in Dungeon.tiles
+FLOOR = ord('.')
+WALL = ord('#')
+DOOR = ord('+')
+STAIRS_DOWN = ord('>')
+STAIRS_UP = ord('<')
 
 # Entity symbols
 PLAYER = '@'
@@ -36,6 +39,20 @@ WEAPON = '/'
 ARMOR = '['
 SCROLL = '?'
 
+# Chance of each item type turning up in a room, in spawn order
+ITEM_CHANCES = (
+    ('gold', 0.6),
+    ('potion', 0.3),
+    ('weapon', 0.15),
+    ('armor', 0.1),
+)
+
+# Monster AI: chase within CHASE_RANGE tiles (Manhattan), following
+# paths of up to CHASE_DEPTH steps
+CHASE_RANGE = 10
+CHASE_DEPTH = 20
+UNREACHED = 255  # Distance map value for tiles beyond CHASE_DEPTH
+
 # Colors
 COLOR_PLAYER = 2      # Green
 COLOR_ENEMY = 5       # Red
@@ -45,8 +62,30 @@ COLOR_FLOOR = 8       # Gray
 COLOR_STAIRS = 6      # Cyan
 COLOR_UI = 7          # White
 
+# Input keys: movement maps each key to its (dx, dy) step
+MOVE_KEYS = {key: step for keys, step in (
+    ((curses.KEY_UP, *map(ord, 'wWkK')), (0, -1)),
+    ((curses.KEY_DOWN, *map(ord, 'sSjJ')), (0, 1)),
+    ((curses.KEY_LEFT, *map(ord, 'aAhH')), (-1, 0)),
+    ((curses.KEY_RIGHT, *map(ord, 'dDlL')), (1, 0)),
+) for key in keys}
+KEYS_QUIT = frozenset(map(ord, 'qQ'))
+KEYS_RESTART = frozenset(map(ord, 'rR'))
+KEYS_PICK_UP = frozenset(map(ord, 'gG'))
+KEYS_POTION = frozenset(map(ord, 'pP'))
+
+# Screen row of the top edge of the map
+MAP_OFFSET_Y = 1
+
+# Attribute words, and bold attributes indexed by color pair for the
+# entities' own colors; both filled in by init_colors()
+ATTR = SimpleNamespace()
+BOLD_ATTR = []
+
 
 class Entity:
+    __slots__ = ('x', 'y', 'char', 'name', 'color', 'max_hp', 'hp', 'attack', 'defense', 'alive')
+
     def __init__(self, x, y, char, name, color, hp=10, attack=2, defense=0):
         self.x = x
         self.y = y
@@ -69,6 +108,9 @@ class Entity:
 
 
 class Player(Entity):
+    __slots__ = ('level', 'exp', 'exp_to_level', 'gold', 'inventory',
+                 'equipped_weapon', 'equipped_armor', 'total_attack', 'total_defense')
+
     def __init__(self, x, y):
         super().__init__(x, y, PLAYER, "Hero", COLOR_PLAYER, hp=30, attack=5, defense=1)
         self.level = 1
@@ -78,6 +120,7 @@ class Player(Entity):
         self.inventory = []
         self.equipped_weapon = None
         self.equipped_armor = None
+        self.refresh_stats()
 
     def gain_exp(self, amount):
         self.exp += amount
@@ -94,17 +137,30 @@ class Player(Entity):
         self.hp = min(self.hp + 10, self.max_hp)
         self.attack += 2
         self.defense += 1
+        self.refresh_stats()
+
+    def equip(self, item):
+        if item.item_type == 'weapon':
+            self.equipped_weapon = item
+        else:
+            self.equipped_armor = item
+        self.refresh_stats()
+
+    def refresh_stats(self):
+        """Recompute the totals with equipment, after a level-up or equip."""
+        self.total_attack = self.attack + (self.equipped_weapon.bonus if self.equipped_weapon else 0)
+        self.total_defense = self.defense + (self.equipped_armor.bonus if self.equipped_armor else 0)
 
     def get_attack(self):
-        bonus = self.equipped_weapon.bonus if self.equipped_weapon else 0
-        return self.attack + bonus
+        return self.total_attack
 
     def get_defense(self):
-        bonus = self.equipped_armor.bonus if self.equipped_armor else 0
-        return self.defense + bonus
+        return self.total_defense
 
 
 class Item:
+    __slots__ = ('x', 'y', 'char', 'name', 'color', 'item_type', 'value', 'bonus')
+
     def __init__(self, x, y, char, name, color, item_type, value=0, bonus=0):
         self.x = x
         self.y = y
@@ -117,6 +173,8 @@ class Item:
 
 
 class Monster(Entity):
+    __slots__ = ('exp_value', 'awake')
+
     def __init__(self, x, y, monster_type):
         monsters = {
             'goblin': (GOBLIN, "Goblin", 8, 3, 0, 5),
@@ -128,17 +186,29 @@ class Monster(Entity):
         char, name, hp, attack, defense, exp = monsters[monster_type]
         super().__init__(x, y, char, name, COLOR_ENEMY, hp, attack, defense)
         self.exp_value = exp
+        self.awake = False  # Set once the player first comes within CHASE_RANGE
 
 
 class Dungeon:
-    def __init__(self, width, height, level=1):
+    def __init__(self, width, height, level=1, seed=None):
         self.width = width
         self.height = height
         self.level = level
-        self.tiles = [[WALL for _ in range(width)] for _ in range(height)]
+        # Generation draws only from this, so a seed rebuilds the same floor
+        self.rng = random.Random(level if seed is None else seed)
+        # Row-major tile codes, indexed by y * width + x
+        self.tiles = bytearray([WALL]) * (width * height)
         self.rooms = []
         self.monsters = []
-        self.items = []
+        # Living monsters by (x, y), at most one per cell
+        self.monster_by_pos = {}
+        # Living monsters that have woken, in spawn order, and (room,
+        # monsters) pairs for the ones still asleep where they spawned
+        self.active_monsters = []
+        self.sleepers = []
+        # Floor items by (x, y), at most one per cell; the dict is the
+        # only store, so picking one up is a single delete
+        self.items = {}
         self.stairs_down = None
         self.stairs_up = None
 
@@ -146,47 +216,55 @@ class Dungeon:
 
     def generate(self):
         """Generate dungeon using BSP."""
-        # Create rooms
-        num_rooms = random.randint(5, 9)
+        # Create rooms; the placement loop runs on local names
+        randint = self.rng.randint
+        rooms = self.rooms
+        width, height = self.width, self.height
+        num_rooms = randint(5, 9)
         min_size = 4
         max_size = 10
+        occupied = [0] * height  # Per-row bitmask of columns taken by rooms
 
         for _ in range(num_rooms * 3):
-            if len(self.rooms) >= num_rooms:
+            if len(rooms) >= num_rooms:
                 break
 
-            w = random.randint(min_size, max_size)
-            h = random.randint(min_size, max_size)
-            x = random.randint(1, self.width - w - 1)
-            y = random.randint(1, self.height - h - 1)
+            w = randint(min_size, max_size)
+            h = randint(min_size, max_size)
+            x = randint(1, width - w - 1)
+            y = randint(1, height - h - 1)
 
             new_room = {'x': x, 'y': y, 'w': w, 'h': h}
 
-            # Check overlap
+            # Check overlap: no room cell may touch the new room or the
+            # one-tile margin around it
+            margin = ((1 << (w + 2)) - 1) << (x - 1)
             overlap = False
-            for room in self.rooms:
-                if (x < room['x'] + room['w'] + 1 and x + w + 1 > room['x'] and
-                    y < room['y'] + room['h'] + 1 and y + h + 1 > room['y']):
+            for row_mask in occupied[y - 1:y + h + 1]:
+                if row_mask & margin:
                     overlap = True
                     break
 
             if not overlap:
+                span = ((1 << w) - 1) << x
+                for row in range(y, y + h):
+                    occupied[row] |= span
                 self.carve_room(new_room)
-                if self.rooms:
-                    self.connect_rooms(self.rooms[-1], new_room)
-                self.rooms.append(new_room)
+                if rooms:
+                    self.connect_rooms(rooms[-1], new_room)
+                rooms.append(new_room)
 
         # Place stairs
         if self.rooms:
             first_room = self.rooms[0]
             self.stairs_up = (first_room['x'] + first_room['w'] // 2,
                               first_room['y'] + first_room['h'] // 2)
-            self.tiles[self.stairs_up[1]][self.stairs_up[0]] = STAIRS_UP
+            self.tiles[self.stairs_up[1] * self.width + self.stairs_up[0]] = STAIRS_UP
 
             last_room = self.rooms[-1]
             self.stairs_down = (last_room['x'] + last_room['w'] // 2,
                                 last_room['y'] + last_room['h'] // 2)
-            self.tiles[self.stairs_down[1]][self.stairs_down[0]] = STAIRS_DOWN
+            self.tiles[self.stairs_down[1] * self.width + self.stairs_down[0]] = STAIRS_DOWN
 
         # Spawn monsters and items
         self.spawn_monsters()
@@ -194,9 +272,10 @@ class Dungeon:
 
     def carve_room(self, room):
         """Carve out a room."""
+        floor = bytes([FLOOR]) * room['w']
         for y in range(room['y'], room['y'] + room['h']):
-            for x in range(room['x'], room['x'] + room['w']):
-                self.tiles[y][x] = FLOOR
+            start = y * self.width + room['x']
+            self.tiles[start:start + room['w']] = floor
 
     def connect_rooms(self, room1, room2):
         """Connect two rooms with corridors."""
@@ -205,7 +284,7 @@ class Dungeon:
         x2 = room2['x'] + room2['w'] // 2
         y2 = room2['y'] + room2['h'] // 2
 
-        if random.random() < 0.5:
+        if self.rng.random() < 0.5:
             self.carve_h_corridor(x1, x2, y1)
             self.carve_v_corridor(y1, y2, x2)
         else:
@@ -213,12 +292,15 @@ class Dungeon:
             self.carve_h_corridor(x1, x2, y2)
 
     def carve_h_corridor(self, x1, x2, y):
-        for x in range(min(x1, x2), max(x1, x2) + 1):
-            self.tiles[y][x] = FLOOR
+        lo, hi = min(x1, x2), max(x1, x2)
+        row = y * self.width
+        self.tiles[row + lo:row + hi + 1] = bytes([FLOOR]) * (hi - lo + 1)
 
     def carve_v_corridor(self, y1, y2, x):
-        for y in range(min(y1, y2), max(y1, y2) + 1):
-            self.tiles[y][x] = FLOOR
+        # A column is every width-th byte of the row-major buffer
+        lo, hi = min(y1, y2), max(y1, y2)
+        start = lo * self.width + x
+        self.tiles[start:hi * self.width + x + 1:self.width] = bytes([FLOOR]) * (hi - lo + 1)
 
     def spawn_monsters(self):
         """Spawn monsters in rooms."""
@@ -231,65 +313,125 @@ class Dungeon:
             monster_types.append('dragon')
 
         for room in self.rooms[1:]:  # Skip first room (player spawn)
-            num_monsters = random.randint(0, 2 + self.level // 2)
+            sleepers = []
+            num_monsters = self.rng.randint(0, 2 + self.level // 2)
             for _ in range(num_monsters):
-                x = random.randint(room['x'] + 1, room['x'] + room['w'] - 2)
-                y = random.randint(room['y'] + 1, room['y'] + room['h'] - 2)
+                x = self.rng.randint(room['x'] + 1, room['x'] + room['w'] - 2)
+                y = self.rng.randint(room['y'] + 1, room['y'] + room['h'] - 2)
+
+                if self.tiles[y * self.width + x] == FLOOR:
+                    monster_type = self.rng.choice(monster_types)
+                    monster = Monster(x, y, monster_type)
+                    if self.add_monster(monster):
+                        sleepers.append(monster)
+            if sleepers:
+                self.sleepers.append((room, sleepers))
+
+    def add_monster(self, monster):
+        """Add a monster unless its cell is already taken; return if added."""
+        if self.monster_by_pos.setdefault((monster.x, monster.y), monster) is monster:
+            self.monsters.append(monster)
+            return True
+        return False
+
+    def wake_monsters(self, x, y):
+        """Wake the sleeping monsters within CHASE_RANGE of (x, y).
+
+        Sleepers have not moved from their room, so a room further than
+        CHASE_RANGE from (x, y) can be skipped without looking inside.
+        """
+        woke = False
+        for room, sleepers in self.sleepers:
+            gap_x = max(room['x'] - x, 0, x - (room['x'] + room['w'] - 1))
+            gap_y = max(room['y'] - y, 0, y - (room['y'] + room['h'] - 1))
+            if not sleepers or gap_x + gap_y >= CHASE_RANGE:
+                continue
+            for monster in sleepers:
+                if abs(monster.x - x) + abs(monster.y - y) < CHASE_RANGE:
+                    monster.awake = woke = True
+            sleepers[:] = [monster for monster in sleepers if not monster.awake]
+
+        if woke:
+            self.active_monsters = [monster for monster in self.monsters
+                                    if monster.awake and monster.alive]
 
-                if self.tiles[y][x] == FLOOR:
-                    monster_type = random.choice(monster_types)
-                    self.monsters.append(Monster(x, y, monster_type))
+    def add_item(self, item):
+        """Add an item unless its cell is already taken."""
+        self.items.setdefault((item.x, item.y), item)
 
     def spawn_items(self):
         """Spawn items in rooms."""
+        # Positions are scaled from random() rather than drawn with
+        # randint(), which costs several Python calls per number
+        rand = self.rng.random
+        level = self.level
         for room in self.rooms:
-            # Gold
-            if random.random() < 0.6:
-                x = random.randint(room['x'] + 1, room['x'] + room['w'] - 2)
-                y = random.randint(room['y'] + 1, room['y'] + room['h'] - 2)
-                if self.tiles[y][x] == FLOOR:
-                    value = random.randint(5, 20) * self.level
-                    self.items.append(Item(x, y, GOLD, f"{value} Gold", COLOR_ITEM, 'gold', value))
-
-            # Health potion
-            if random.random() < 0.3:
-                x = random.randint(room['x'] + 1, room['x'] + room['w'] - 2)
-                y = random.randint(room['y'] + 1, room['y'] + room['h'] - 2)
-                if self.tiles[y][x] == FLOOR:
-                    self.items.append(Item(x, y, POTION_HEALTH, "Health Potion", COLOR_ITEM, 'potion', 20))
-
-            # Weapon
-            if random.random() < 0.15:
-                x = random.randint(room['x'] + 1, room['x'] + room['w'] - 2)
-                y = random.randint(room['y'] + 1, room['y'] + room['h'] - 2)
-                if self.tiles[y][x] == FLOOR:
-                    bonus = random.randint(1, 3) + self.level // 2
-                    self.items.append(Item(x, y, WEAPON, f"Sword +{bonus}", COLOR_ITEM, 'weapon', 0, bonus))
-
-            # Armor
-            if random.random() < 0.1:
-                x = random.randint(room['x'] + 1, room['x'] + room['w'] - 2)
-                y = random.randint(room['y'] + 1, room['y'] + room['h'] - 2)
-                if self.tiles[y][x] == FLOOR:
-                    bonus = random.randint(1, 2) + self.level // 3
-                    self.items.append(Item(x, y, ARMOR, f"Armor +{bonus}", COLOR_ITEM, 'armor', 0, bonus))
+            left, top = room['x'] + 1, room['y'] + 1
+            span_w, span_h = room['w'] - 2, room['h'] - 2
+            for item_type, chance in ITEM_CHANCES:
+                if rand() >= chance:
+                    continue
+                x = left + int(rand() * span_w)
+                y = top + int(rand() * span_h)
+                if self.tiles[y * self.width + x] != FLOOR:
+                    continue
+
+                if item_type == 'gold':
+                    value = (5 + int(rand() * 16)) * level
+                    item = Item(x, y, GOLD, f"{value} Gold", COLOR_ITEM, 'gold', value)
+                elif item_type == 'potion':
+                    item = Item(x, y, POTION_HEALTH, "Health Potion", COLOR_ITEM, 'potion', 20)
+                elif item_type == 'weapon':
+                    bonus = 1 + int(rand() * 3) + level // 2
+                    item = Item(x, y, WEAPON, f"Sword +{bonus}", COLOR_ITEM, 'weapon', 0, bonus)
+                else:
+                    bonus = 1 + int(rand() * 2) + level // 3
+                    item = Item(x, y, ARMOR, f"Armor +{bonus}", COLOR_ITEM, 'armor', 0, bonus)
+                self.add_item(item)
 
     def is_walkable(self, x, y):
         if 0 <= x < self.width and 0 <= y < self.height:
-            return self.tiles[y][x] != WALL
+            return self.tiles[y * self.width + x] != WALL
         return False
 
+    def tile_at(self, x, y):
+        return self.tiles[y * self.width + x]
+
+    def distance_map(self, x, y, max_dist):
+        """Return BFS step counts from (x, y) over walkable tiles.
+
+        The map is flat like tiles; tiles further than max_dist steps hold
+        UNREACHED. The map edge is always wall, so the neighbours of a
+        walkable tile never fall off the map.
+        """
+        width = self.width
+        tiles = self.tiles
+        dist = bytearray([UNREACHED]) * len(tiles)
+        frontier = [y * width + x]
+        dist[frontier[0]] = 0
+        for d in range(1, max_dist + 1):
+            next_frontier = []
+            for i in frontier:
+                for n in (i - 1, i + 1, i - width, i + width):
+                    if dist[n] == UNREACHED and tiles[n] != WALL:
+                        dist[n] = d
+                        next_frontier.append(n)
+            if not next_frontier:
+                break
+            frontier = next_frontier
+        return dist
+
     def get_monster_at(self, x, y):
-        for monster in self.monsters:
-            if monster.alive and monster.x == x and monster.y == y:
-                return monster
-        return None
+        return self.monster_by_pos.get((x, y))
 
     def get_item_at(self, x, y):
-        for item in self.items:
-            if item.x == x and item.y == y:
-                return item
-        return None
+        return self.items.get((x, y))
+
+    def move_monster(self, monster, x, y):
+        del self.monster_by_pos[(monster.x, monster.y)]
+        self.monster_by_pos[(x, y)] = monster
+        monster.x = x
+        monster.y = y
 
 
 class Game:
@@ -297,20 +439,36 @@ class Game:
         self.width = width
         self.height = height
         self.dungeon_level = 1
-        self.dungeon = Dungeon(width - 20, height - 6, self.dungeon_level)
+        # Each run gets its own seed; floors are built from it on first
+        # visit and kept, so returning to one finds it as it was left
+        self.seed = random.getrandbits(32)
+        self.dungeon_cache = {}
+        self.dungeon = self.get_dungeon(self.dungeon_level)
 
         # Spawn player in first room
         room = self.dungeon.rooms[0]
         self.player = Player(room['x'] + room['w'] // 2, room['y'] + room['h'] // 2)
 
-        self.messages = []
+        self.messages = deque(maxlen=5)  # Oldest message drops off automatically
         self.game_over = False
         self.show_inventory = False
 
+        # Render state: map cells to redraw, or the whole screen, and
+        # the pad the map is drawn into (created on first draw)
+        self.dirty = set()
+        self.needs_redraw = True
+        self.map_pad = None
+
+    def get_dungeon(self, level):
+        """Return the floor for level, generating it on the first visit."""
+        dungeon = self.dungeon_cache.get(level)
+        if dungeon is None:
+            dungeon = Dungeon(self.width - 20, self.height - 6, level, seed=f"{self.seed}:{level}")
+            self.dungeon_cache[level] = dungeon
+        return dungeon
+
     def add_message(self, text):
         self.messages.append(text)
-        if len(self.messages) > 5:
-            self.messages.pop(0)
 
     def move_player(self, dx, dy):
         if self.game_over:
@@ -328,13 +486,16 @@ class Game:
 
         # Check walkable
         if self.dungeon.is_walkable(new_x, new_y):
+            self.dirty.add((self.player.x, self.player.y))
+            self.dirty.add((new_x, new_y))
             self.player.x = new_x
             self.player.y = new_y
 
             # Check stairs
-            if self.dungeon.tiles[new_y][new_x] == STAIRS_DOWN:
+            tile = self.dungeon.tile_at(new_x, new_y)
+            if tile == STAIRS_DOWN:
                 self.add_message("Press > to descend")
-            elif self.dungeon.tiles[new_y][new_x] == STAIRS_UP:
+            elif tile == STAIRS_UP:
                 self.add_message("Press < to ascend")
 
             # Check item
@@ -347,44 +508,54 @@ class Game:
     def attack_monster(self, monster):
         damage = monster.take_damage(self.player.get_attack())
         self.add_message(f"You hit {monster.name} for {damage} damage!")
+        self.dirty.add((monster.x, monster.y))
 
         if not monster.alive:
+            # Only an awake monster can be next to the player
+            del self.dungeon.monster_by_pos[(monster.x, monster.y)]
+            self.dungeon.active_monsters.remove(monster)
             self.add_message(f"You killed {monster.name}!")
             if self.player.gain_exp(monster.exp_value):
                 self.add_message(f"Level up! You are now level {self.player.level}!")
 
     def monster_turns(self):
         """Process monster AI."""
-        for monster in self.dungeon.monsters:
-            if not monster.alive:
-                continue
-
+        player = self.player
+        px, py = player.x, player.y  # The player does not move during this turn
+        width = self.dungeon.width
+        occupied = self.dungeon.monster_by_pos
+        dist_map = None  # Built on first use, shared by every monster this turn
+        self.dungeon.wake_monsters(px, py)
+        for monster in self.dungeon.active_monsters:
             # Simple AI: move toward player if close
-            dx = self.player.x - monster.x
-            dy = self.player.y - monster.y
-            dist = abs(dx) + abs(dy)
+            dist = abs(px - monster.x) + abs(py - monster.y)
 
             if dist == 1:
                 # Attack player
-                damage = self.player.take_damage(monster.attack)
+                damage = player.take_damage(monster.attack)
                 self.add_message(f"{monster.name} hits you for {damage} damage!")
 
-                if not self.player.alive:
+                if not player.alive:
                     self.add_message("You have died!")
                     self.game_over = True
-            elif dist < 10:
-                # Move toward player
-                move_x = 1 if dx > 0 else (-1 if dx < 0 else 0)
-                move_y = 1 if dy > 0 else (-1 if dy < 0 else 0)
-
-                new_x = monster.x + move_x
-                new_y = monster.y + move_y
-
-                if (self.dungeon.is_walkable(new_x, new_y) and
-                    not self.dungeon.get_monster_at(new_x, new_y) and
-                    (new_x != self.player.x or new_y != self.player.y)):
-                    monster.x = new_x
-                    monster.y = new_y
+                    self.needs_redraw = True
+            elif dist < CHASE_RANGE:
+                # Step to the free neighbour with the shortest path to the
+                # player; only a monster next to the player can reach its cell
+                if dist_map is None:
+                    dist_map = self.dungeon.distance_map(px, py, CHASE_DEPTH)
+                i = monster.y * width + monster.x
+                best, target = dist_map[i], None
+                for n in (i - 1, i + 1, i - width, i + width):
+                    if dist_map[n] < best:
+                        new_y, new_x = divmod(n, width)
+                        if (new_x, new_y) not in occupied:
+                            best, target = dist_map[n], (new_x, new_y)
+
+                if target:
+                    self.dirty.add((monster.x, monster.y))
+                    self.dirty.add(target)
+                    self.dungeon.move_monster(monster, *target)
 
     def pick_up_item(self):
         item = self.dungeon.get_item_at(self.player.x, self.player.y)
@@ -395,14 +566,12 @@ class Game:
             elif item.item_type == 'potion':
                 self.player.inventory.append(item)
                 self.add_message(f"Picked up {item.name}!")
-            elif item.item_type == 'weapon':
-                self.player.equipped_weapon = item
-                self.add_message(f"Equipped {item.name}!")
-            elif item.item_type == 'armor':
-                self.player.equipped_armor = item
+            elif item.item_type in ('weapon', 'armor'):
+                self.player.equip(item)
                 self.add_message(f"Equipped {item.name}!")
 
-            self.dungeon.items.remove(item)
+            del self.dungeon.items[(item.x, item.y)]
+            self.dirty.add((item.x, item.y))
 
     def use_potion(self):
         for i, item in enumerate(self.player.inventory):
@@ -415,63 +584,104 @@ class Game:
         self.add_message("No potions!")
 
     def go_down_stairs(self):
-        if self.dungeon.tiles[self.player.y][self.player.x] == STAIRS_DOWN:
+        if self.dungeon.tile_at(self.player.x, self.player.y) == STAIRS_DOWN:
             self.dungeon_level += 1
-            self.dungeon = Dungeon(self.width - 20, self.height - 6, self.dungeon_level)
+            self.dungeon = self.get_dungeon(self.dungeon_level)
             room = self.dungeon.rooms[0]
             self.player.x = room['x'] + room['w'] // 2
             self.player.y = room['y'] + room['h'] // 2
             self.add_message(f"You descend to dungeon level {self.dungeon_level}...")
+            self.needs_redraw = True
 
 
-def draw_game(stdscr, game):
-    """Draw the game."""
-    stdscr.clear()
+def draw_tile(pad, dungeon, x, y):
+    """Draw the bare map tile at (x, y)."""
+    tile = dungeon.tile_at(x, y)
+    attr = ATTR.stairs if tile in (STAIRS_DOWN, STAIRS_UP) else ATTR.wall
+    try:
+        pad.addstr(y, x, chr(tile), attr)
+    except curses.error:
+        pass
 
+
+def draw_entities(pad, game, cells=None):
+    """Draw items, monsters and the player, limited to cells if given."""
     dungeon = game.dungeon
     player = game.player
-    offset_y = 1
-
-    # Draw dungeon
-    for y in range(dungeon.height):
-        for x in range(dungeon.width):
-            tile = dungeon.tiles[y][x]
-            color = COLOR_FLOOR
-
-            if tile == WALL:
-                color = COLOR_WALL
-            elif tile in [STAIRS_DOWN, STAIRS_UP]:
-                color = COLOR_STAIRS
 
+    # Draw items
+    for item in dungeon.items.values():
+        if cells is None or (item.x, item.y) in cells:
             try:
-                stdscr.addstr(y + offset_y, x, tile, curses.color_pair(color))
+                pad.addstr(item.y, item.x, item.char, BOLD_ATTR[item.color])
             except curses.error:
                 pass
 
-    # Draw items
-    for item in dungeon.items:
-        try:
-            stdscr.addstr(item.y + offset_y, item.x, item.char,
-                          curses.color_pair(item.color) | curses.A_BOLD)
-        except curses.error:
-            pass
-
     # Draw monsters
     for monster in dungeon.monsters:
-        if monster.alive:
+        if monster.alive and (cells is None or (monster.x, monster.y) in cells):
             try:
-                stdscr.addstr(monster.y + offset_y, monster.x, monster.char,
-                              curses.color_pair(monster.color) | curses.A_BOLD)
+                pad.addstr(monster.y, monster.x, monster.char, BOLD_ATTR[monster.color])
             except curses.error:
                 pass
 
     # Draw player
     try:
-        stdscr.addstr(player.y + offset_y, player.x, player.char,
-                      curses.color_pair(player.color) | curses.A_BOLD)
+        pad.addstr(player.y, player.x, player.char, BOLD_ATTR[player.color])
     except curses.error:
         pass
 
+
+def draw_full(pad, game):
+    """Redraw the whole map, for a new game or floor."""
+    pad.erase()
+
+    dungeon = game.dungeon
+
+    # Draw dungeon one row at a time; floor and walls share a color, so
+    # only the stairs need drawing over it
+    tiles = dungeon.tiles
+    width = dungeon.width
+    for y in range(dungeon.height):
+        row = tiles[y * width:(y + 1) * width].decode('ascii')
+        try:
+            pad.addstr(y, 0, row, ATTR.wall)
+        except curses.error:
+            pass
+
+    for stairs in (dungeon.stairs_up, dungeon.stairs_down):
+        if stairs:
+            draw_tile(pad, dungeon, *stairs)
+
+    draw_entities(pad, game)
+
+
+def draw_incremental(pad, game):
+    """Redraw only the map cells that changed since the last frame."""
+    for x, y in game.dirty:
+        draw_tile(pad, game.dungeon, x, y)
+    draw_entities(pad, game, game.dirty)
+
+
+def draw_game(stdscr, game):
+    """Draw the game."""
+    dungeon = game.dungeon
+    player = game.player
+
+    # The map lives in its own pad, one column wider than the map so the
+    # last cell can be written; everything else is drawn on stdscr
+    if game.map_pad is None:
+        game.map_pad = curses.newpad(dungeon.height, dungeon.width + 1)
+    pad = game.map_pad
+
+    if game.needs_redraw:
+        stdscr.erase()
+        draw_full(pad, game)
+        game.needs_redraw = False
+    else:
+        draw_incremental(pad, game)
+    game.dirty.clear()
+
     # Draw sidebar
     sidebar_x = dungeon.width + 2
     max_y, max_x = stdscr.getmaxyx()
@@ -487,42 +697,57 @@ def draw_game(stdscr, game):
         except curses.error:
             pass
 
-    safe_addstr(1, sidebar_x, "ROGUELIKE", curses.color_pair(COLOR_UI) | curses.A_BOLD)
-    safe_addstr(2, sidebar_x, "=" * 15, curses.color_pair(COLOR_WALL))
+    def clear_line(y, x):
+        """Blank a text line from x to the right edge before redrawing it."""
+        try:
+            if y < max_y and x < max_x:
+                stdscr.move(y, x)
+                stdscr.clrtoeol()
+        except curses.error:
+            pass
+
+    for y in range(1, 18):
+        clear_line(y, sidebar_x)
 
-    safe_addstr(4, sidebar_x, f"Level: {player.level}", curses.color_pair(COLOR_UI))
-    safe_addstr(5, sidebar_x, f"HP: {player.hp}/{player.max_hp}", curses.color_pair(2 if player.hp > player.max_hp // 3 else 5))
-    safe_addstr(6, sidebar_x, f"ATK: {player.get_attack()}", curses.color_pair(COLOR_UI))
-    safe_addstr(7, sidebar_x, f"DEF: {player.get_defense()}", curses.color_pair(COLOR_UI))
-    safe_addstr(8, sidebar_x, f"EXP: {player.exp}/{player.exp_to_level}", curses.color_pair(COLOR_UI))
-    safe_addstr(9, sidebar_x, f"Gold: {player.gold}", curses.color_pair(3))
-    safe_addstr(10, sidebar_x, f"Floor: {game.dungeon_level}", curses.color_pair(COLOR_UI))
+    safe_addstr(1, sidebar_x, "ROGUELIKE", ATTR.ui_bold)
+    safe_addstr(2, sidebar_x, "=" * 15, ATTR.wall)
+
+    safe_addstr(4, sidebar_x, f"Level: {player.level}", ATTR.ui)
+    safe_addstr(5, sidebar_x, f"HP: {player.hp}/{player.max_hp}", ATTR.hp_ok if player.hp > player.max_hp // 3 else ATTR.hp_low)
+    safe_addstr(6, sidebar_x, f"ATK: {player.get_attack()}", ATTR.ui)
+    safe_addstr(7, sidebar_x, f"DEF: {player.get_defense()}", ATTR.ui)
+    safe_addstr(8, sidebar_x, f"EXP: {player.exp}/{player.exp_to_level}", ATTR.ui)
+    safe_addstr(9, sidebar_x, f"Gold: {player.gold}", ATTR.item)
+    safe_addstr(10, sidebar_x, f"Floor: {game.dungeon_level}", ATTR.ui)
 
     # Equipment
-    safe_addstr(12, sidebar_x, "Equipment:", curses.color_pair(COLOR_UI) | curses.A_BOLD)
+    safe_addstr(12, sidebar_x, "Equipment:", ATTR.ui_bold)
     weapon_name = player.equipped_weapon.name if player.equipped_weapon else "None"
     armor_name = player.equipped_armor.name if player.equipped_armor else "None"
-    safe_addstr(13, sidebar_x, f"Wpn: {weapon_name[:12]}", curses.color_pair(COLOR_UI))
-    safe_addstr(14, sidebar_x, f"Arm: {armor_name[:12]}", curses.color_pair(COLOR_UI))
+    safe_addstr(13, sidebar_x, f"Wpn: {weapon_name[:12]}", ATTR.ui)
+    safe_addstr(14, sidebar_x, f"Arm: {armor_name[:12]}", ATTR.ui)
 
     # Inventory
     potions = sum(1 for item in player.inventory if item.item_type == 'potion')
-    safe_addstr(16, sidebar_x, f"Potions: {potions}", curses.color_pair(COLOR_ITEM))
-    safe_addstr(17, sidebar_x, "P: Use potion", curses.color_pair(COLOR_WALL))
+    safe_addstr(16, sidebar_x, f"Potions: {potions}", ATTR.item)
+    safe_addstr(17, sidebar_x, "P: Use potion", ATTR.wall)
 
     # Messages
     msg_y = dungeon.height + 2
+    for i in range(1, 4):
+        clear_line(msg_y + i, 0)
     if msg_y < max_y:
-        safe_addstr(msg_y, 0, "-" * min(dungeon.width, max_x - 1), curses.color_pair(COLOR_WALL))
-    for i, msg in enumerate(game.messages[-3:]):
+        safe_addstr(msg_y, 0, "-" * min(dungeon.width, max_x - 1), ATTR.wall)
+    recent = islice(game.messages, max(0, len(game.messages) - 3), None)
+    for i, msg in enumerate(recent):
         if msg_y + 1 + i < max_y:
-            safe_addstr(msg_y + 1 + i, 0, msg[:dungeon.width], curses.color_pair(COLOR_UI))
+            safe_addstr(msg_y + 1 + i, 0, msg[:dungeon.width], ATTR.ui)
 
     # Controls
     controls_y = dungeon.height + 6
     if controls_y < max_y:
         safe_addstr(controls_y, 0, "Move: Arrows/WASD | G: Get | >: Descend | Q: Quit",
-                    curses.color_pair(COLOR_WALL))
+                    ATTR.wall)
 
     # Game over overlay
     if game.game_over:
@@ -543,47 +768,51 @@ def draw_game(stdscr, game):
 
         for i in range(box_height):
             try:
-                stdscr.addstr(box_y + i + offset_y, box_x, ' ' * box_width,
-                              curses.color_pair(5) | curses.A_REVERSE)
+                pad.addstr(box_y + i, box_x, ' ' * box_width, ATTR.box)
             except curses.error:
                 pass
 
         for i, line in enumerate(lines):
             x = dungeon.width // 2 - len(line) // 2
             try:
-                stdscr.addstr(box_y + 1 + i + offset_y, x, line,
-                              curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD)
+                pad.addstr(box_y + 1 + i, x, line, ATTR.box_text)
             except curses.error:
                 pass
 
-    stdscr.refresh()
+    # Copy stdscr first: its blank map area must not cover the pad
+    stdscr.noutrefresh()
+    pad.noutrefresh(0, 0, MAP_OFFSET_Y, 0, MAP_OFFSET_Y + dungeon.height - 1, dungeon.width - 1)
+    curses.doupdate()
+
+
+TITLE_ART = (
+    " ____   ___   ____ _   _ _____ _     ___ _  _______ ",
+    "|  _ \\ / _ \\ / ___| | | | ____| |   |_ _| |/ / ____|",
+    "| |_) | | | | |  _| | | |  _| | |    | || ' /|  _|  ",
+    "|  _ <| |_| | |_| | |_| | |___| |___ | || . \\| |___ ",
+    "|_| \\_\\\\___/ \\____|\\___/|_____|_____|___|_|\\_\\_____|",
+)
+
+# (line, half its width, color pair) for each banner line
+TITLE_RENDER = tuple((line, len(line) // 2, (i % 4) + 2) for i, line in enumerate(TITLE_ART))
 
 
 def draw_title(stdscr, width, height):
     """Draw title screen."""
     stdscr.clear()
 
-    title = [
-        " ____   ___   ____ _   _ _____ _     ___ _  _______ ",
-        "|  _ \\ / _ \\ / ___| | | | ____| |   |_ _| |/ / ____|",
-        "| |_) | | | | |  _| | | |  _| | |    | || ' /|  _|  ",
-        "|  _ <| |_| | |_| | |_| | |___| |___ | || . \\| |___ ",
-        "|_| \\_\\\\___/ \\____|\\___/|_____|_____|___|_|\\_\\_____|",
-    ]
-
     start_y = height // 2 - 8
-    for i, line in enumerate(title):
-        x = width // 2 - len(line) // 2
-        color = curses.color_pair((i % 4) + 2)
+    for i, (line, half_width, pair) in enumerate(TITLE_RENDER):
+        x = width // 2 - half_width
         try:
-            stdscr.addstr(start_y + i, max(0, x), line, color | curses.A_BOLD)
+            stdscr.addstr(start_y + i, max(0, x), line, BOLD_ATTR[pair])
         except curses.error:
             pass
 
     subtitle = "~ Dungeon Crawler ~"
     try:
         stdscr.addstr(start_y + 6, max(0, width // 2 - len(subtitle) // 2), subtitle,
-                      curses.color_pair(3))
+                      ATTR.item)
     except curses.error:
         pass
 
@@ -602,7 +831,7 @@ def draw_title(stdscr, width, height):
         y = height // 2 + 1 + i
         x = width // 2 - len(line) // 2
         try:
-            stdscr.addstr(y, x, line, curses.color_pair(7))
+            stdscr.addstr(y, x, line, ATTR.ui)
         except curses.error:
             pass
 
@@ -627,6 +856,18 @@ def init_colors():
     else:
         curses.init_pair(8, curses.COLOR_WHITE, -1)
 
+    # Combine pairs and styles once instead of on every draw call
+    BOLD_ATTR[:] = [curses.color_pair(n) | curses.A_BOLD for n in range(9)]
+    ATTR.wall = curses.color_pair(COLOR_WALL)
+    ATTR.stairs = curses.color_pair(COLOR_STAIRS)
+    ATTR.item = curses.color_pair(COLOR_ITEM)
+    ATTR.ui = curses.color_pair(COLOR_UI)
+    ATTR.ui_bold = curses.color_pair(COLOR_UI) | curses.A_BOLD
+    ATTR.hp_ok = curses.color_pair(2)
+    ATTR.hp_low = curses.color_pair(5)
+    ATTR.box = curses.color_pair(5) | curses.A_REVERSE
+    ATTR.box_text = curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD
+
 
 def main(stdscr):
     """Main game loop."""
@@ -661,23 +902,17 @@ def main(stdscr):
 
         key = stdscr.getch()
 
-        if key in [ord('q'), ord('Q')]:
+        if key in KEYS_QUIT:
             break
-        elif key in [ord('r'), ord('R')] and game.game_over:
+        elif key in KEYS_RESTART and game.game_over:
             game = Game(width, height)
         elif not game.game_over:
             # Movement
-            if key in [curses.KEY_UP, ord('w'), ord('W'), ord('k'), ord('K')]:
-                game.move_player(0, -1)
-            elif key in [curses.KEY_DOWN, ord('s'), ord('S'), ord('j'), ord('J')]:
-                game.move_player(0, 1)
-            elif key in [curses.KEY_LEFT, ord('a'), ord('A'), ord('h'), ord('H')]:
-                game.move_player(-1, 0)
-            elif key in [curses.KEY_RIGHT, ord('d'), ord('D'), ord('l'), ord('L')]:
-                game.move_player(1, 0)
-            elif key in [ord('g'), ord('G')]:
+            if key in MOVE_KEYS:
+                game.move_player(*MOVE_KEYS[key])
+            elif key in KEYS_PICK_UP:
                 game.pick_up_item()
-            elif key in [ord('p'), ord('P')]:
+            elif key in KEYS_POTION:
                 game.use_potion()
             elif key == ord('>'):
                 game.go_down_stairs()
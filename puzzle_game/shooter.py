@@ -16,6 +16,7 @@ import curses
 import random
 import time
 import math
+from types import SimpleNamespace
 
 # Player ship
 PLAYER_SHIP = [
@@ -23,6 +24,7 @@ PLAYER_SHIP = [
     " /A\\ ",
     "/===\\",
 ]
+PLAYER_SHIP_LINES = tuple(enumerate(PLAYER_SHIP))
 
 # Enemy types
 ENEMIES = {
@@ -61,12 +63,57 @@ ENEMIES = {
     },
 }
 
+# (row offset, line) pairs per enemy type, enumerated once for drawing
+ENEMY_SPRITE_LINES = {name: tuple(enumerate(data['sprite'])) for name, data in ENEMIES.items()}
+
 POWERUP_TYPES = {
     'rapid': {'char': 'R', 'color': 3, 'name': 'Rapid Fire'},
     'spread': {'char': 'S', 'color': 6, 'name': 'Spread Shot'},
     'shield': {'char': 'O', 'color': 2, 'name': 'Shield'},
     'life': {'char': '+', 'color': 5, 'name': 'Extra Life'},
 }
+POWERUP_KEYS = tuple(POWERUP_TYPES)
+
+# Background star field
+NUM_STARS = 30
+STAR_CHARS = ('.', '*', '+')
+
+# Explosion animations
+SMALL_EXPLOSION_FRAMES = ('*', '+', '.')
+BIG_EXPLOSION_FRAMES = (
+    ('\\|/', '-*-', '/|\\'),
+    (' | ', '-+-', ' | '),
+    (' . ', ' . ', ' . '),
+)
+
+# Target frame duration (60 FPS)
+FRAME_TIME = 1 / 60
+
+# Simulation step; movement is per step, so this matches the frame rate to
+# keep the game's speed, and catch-up is capped to avoid a spiral of death
+FIXED_DT = FRAME_TIME
+MAX_STEPS_PER_FRAME = 5
+
+# Poll interval while paused or on the game over screen
+IDLE_SLEEP = 0.05
+
+# Length of an enemy bullet's aim vector
+ENEMY_AIM_SPEED = 0.5
+
+# Pool capacities
+MAX_BULLETS = 256
+MAX_ENEMIES = 64
+MAX_EXPLOSIONS = 32
+MAX_POWERUPS = 16
+
+# Spatial grid used for bullet-vs-enemy hit tests
+GRID_COLS = 8
+GRID_ROWS = 8
+
+# Attribute words, and bold attributes indexed by color pair for the
+# enemy and powerup colors; both filled in by init_colors()
+ATTR = SimpleNamespace()
+BOLD_ATTR = []
 
 
 class Player:
@@ -89,66 +136,163 @@ class Player:
         return 0.1 if self.rapid_fire > 0 else 0.25
 
 
+class Pool:
+    """Fixed-capacity set of reusable objects with a free-slot stack."""
+
+    def __init__(self, cls, size):
+        self.items = [cls() for _ in range(size)]
+        for slot, item in enumerate(self.items):
+            item.slot = slot
+        # Reversed so the lowest slots are handed out first
+        self.free = list(range(size - 1, -1, -1))
+
+    def acquire(self):
+        """Take a free object, or None if the pool is exhausted."""
+        if not self.free:
+            return None
+        return self.items[self.free.pop()]
+
+    def release(self, item):
+        """Return an object's slot to the free stack."""
+        self.free.append(item.slot)
+
+    def in_use(self):
+        return len(self.items) - len(self.free)
+
+
 class Bullet:
-    def __init__(self, x, y, dx=0, dy=-1, is_player=True, speed=1.5):
+    __slots__ = ('x', 'y', 'is_player', 'active', 'steps', 'step_x', 'step_y', 'slot')
+
+    def __init__(self):
+        self.active = False
+
+    def reset(self, x, y, dx=0.0, dy=-1.0, is_player=True, speed=1.5):
         self.x = x
         self.y = y
-        self.dx = dx
-        self.dy = dy
         self.is_player = is_player
-        self.speed = speed
         self.active = True
 
+        # Split each move into sub-steps of at most one cell
+        self.steps = max(1, math.ceil(max(abs(dx), abs(dy)) * speed))
+        self.step_x = dx * speed / self.steps
+        self.step_y = dy * speed / self.steps
+
 
 class Enemy:
-    def __init__(self, x, y, enemy_type):
+    __slots__ = ('x', 'y', 'type', 'data', 'attr', 'hp', 'sprite', 'sprite_lines',
+                 'width', 'height', 'alive', 'move_timer', 'shoot_timer', 'move_dir', 'slot')
+
+    def __init__(self):
+        self.alive = False
+
+    def reset(self, x, y, enemy_type):
         self.x = x
         self.y = y
         self.type = enemy_type
         self.data = ENEMIES[enemy_type]
+        self.attr = BOLD_ATTR[self.data['color']]
         self.hp = self.data['hp']
         self.sprite = self.data['sprite']
+        self.sprite_lines = ENEMY_SPRITE_LINES[enemy_type]
         self.width = max(len(line) for line in self.sprite)
         self.height = len(self.sprite)
         self.alive = True
-        self.move_timer = 0
-        self.shoot_timer = random.uniform(1, 3)
-        self.move_dir = random.choice([-1, 1])
+        self.move_timer = 0.0
+        # random.uniform(1, 3), spelled out to skip its Python-level wrapper
+        self.shoot_timer = 1 + 2 * random.random()
+        self.move_dir = random.choice((-1, 1))
 
 
 class Powerup:
-    def __init__(self, x, y, ptype):
+    __slots__ = ('x', 'y', 'type', 'data', 'attr', 'active', 'slot')
+
+    def __init__(self):
+        self.active = False
+
+    def reset(self, x, y, ptype):
         self.x = x
         self.y = y
         self.type = ptype
         self.data = POWERUP_TYPES[ptype]
+        self.attr = BOLD_ATTR[self.data['color']]
         self.active = True
 
 
 class Explosion:
-    def __init__(self, x, y, size='small'):
+    __slots__ = ('x', 'y', 'frame', 'size', 'active', 'frames',
+                 'total_frames', 'max_frame_idx', 'slot')
+
+    def __init__(self):
+        self.active = False
+
+    def reset(self, x, y, size='small'):
         self.x = x
         self.y = y
-        self.frame = 0
+        self.frame = 0.0
         self.size = size
         self.active = True
 
-        if size == 'small':
-            self.frames = ['*', '+', '.']
-        else:
-            self.frames = [
-                ['\\|/', '-*-', '/|\\'],
-                [' | ', '-+-', ' | '],
-                [' . ', ' . ', ' . '],
-            ]
+        self.frames = SMALL_EXPLOSION_FRAMES if size == 'small' else BIG_EXPLOSION_FRAMES
+        self.total_frames = len(self.frames)
+        self.max_frame_idx = self.total_frames - 1
 
 
-class Star:
-    def __init__(self, x, y, speed):
-        self.x = x
-        self.y = y
-        self.speed = speed
-        self.char = random.choice(['.', '*', '+'])
+class Canvas:
+    """Back buffer of packed cells (attr | ord(char)) diffed against the last frame."""
+
+    def __init__(self, width, height):
+        self.width = width
+        self.height = height
+        self.blank = [ord(' ')] * (width * height)
+        self.back = self.blank[:]
+        # Nothing is known about the screen yet, so the first flush writes every cell
+        self.front = [-1] * (width * height)
+
+    def erase(self):
+        self.back[:] = self.blank
+
+    def addstr(self, y, x, text, attr=0):
+        """Write text into the back buffer, clipped to the screen."""
+        if not 0 <= y < self.height or x < 0:
+            return
+        cells = [attr | ord(ch) for ch in text[:self.width - x]]
+        start = y * self.width + x
+        self.back[start:start + len(cells)] = cells
+
+    def flush(self, stdscr):
+        """Send only the cells that changed since the last flush to curses.
+
+        Neighbouring changed cells that share an attribute go out as one addstr.
+        """
+        back = self.back
+        front = self.front
+        width = self.width
+        for y in range(self.height):
+            start = y * width
+            end = start + width
+            if back[start:end] == front[start:end]:
+                continue
+            i = start
+            while i < end:
+                cell = back[i]
+                if cell == front[i]:
+                    i += 1
+                    continue
+                attr = cell & curses.A_ATTRIBUTES
+                run_start = i
+                chars = []
+                while i < end:
+                    cell = back[i]
+                    if cell == front[i] or cell & curses.A_ATTRIBUTES != attr:
+                        break
+                    chars.append(chr(cell & curses.A_CHARTEXT))
+                    i += 1
+                try:
+                    stdscr.addstr(y, run_start - start, ''.join(chars), attr)
+                except curses.error:
+                    pass
+        self.front = back
+        self.back = front
 
 
 class Game:
@@ -162,11 +306,17 @@ class Game:
         self.paused = False
 
         self.player = Player(width // 2 - 2, height - 5)
-        self.bullets = []
-        self.enemies = []
-        self.powerups = []
-        self.explosions = []
-        self.stars = []
+        self.bullet_pool = Pool(Bullet, MAX_BULLETS)
+        self.enemy_pool = Pool(Enemy, MAX_ENEMIES)
+        self.powerup_pool = Pool(Powerup, MAX_POWERUPS)
+        self.explosion_pool = Pool(Explosion, MAX_EXPLOSIONS)
+
+        self.canvas = Canvas(width, height)
+
+        # Enemies binned by grid cell each frame
+        self.grid = [[] for _ in range(GRID_COLS * GRID_ROWS)]
+        self.cell_w = -(-width // GRID_COLS)
+        self.cell_h = -(-height // GRID_ROWS)
 
         self.fire_timer = 0
         self.spawn_timer = 0
@@ -174,13 +324,17 @@ class Game:
         self.enemies_spawned = 0
         self.enemies_to_spawn = 5
 
-        # Create stars
-        for _ in range(30):
-            self.stars.append(Star(
-                random.randint(0, width - 1),
-                random.randint(0, height - 1),
-                random.uniform(0.2, 0.8)
-            ))
+        # Create stars, kept as parallel lists so the whole layer can be
+        # advanced with one comprehension
+        self.star_x = []
+        self.star_y = []
+        self.star_speed = []
+        self.star_char = []
+        for _ in range(NUM_STARS):
+            self.star_x.append(random.randint(0, width - 1))
+            self.star_y.append(random.randint(0, height - 1))
+            self.star_speed.append(random.uniform(0.2, 0.8))
+            self.star_char.append(random.choice(STAR_CHARS))
 
     def spawn_enemy(self):
         """Spawn a new enemy."""
@@ -188,7 +342,7 @@ class Game:
             return
 
         # Choose enemy type based on wave
-        if self.wave >= 10 and random.random() < 0.1 and not any(e.type == 'boss' for e in self.enemies):
+        if self.wave >= 10 and random.random() < 0.1 and not any(e.alive and e.type == 'boss' for e in self.enemy_pool.items):
             enemy_type = 'boss'
         elif self.wave >= 5 and random.random() < 0.2:
             enemy_type = 'bomber'
@@ -197,11 +351,15 @@ class Game:
         else:
             enemy_type = 'scout'
 
+        enemy = self.enemy_pool.acquire()
+        if enemy is None:
+            return
+
         sprite_width = max(len(line) for line in ENEMIES[enemy_type]['sprite'])
         x = random.randint(2, self.width - sprite_width - 2)
         y = -len(ENEMIES[enemy_type]['sprite'])
 
-        self.enemies.append(Enemy(x, y, enemy_type))
+        enemy.reset(x, y, enemy_type)
         self.enemies_spawned += 1
 
     def fire_bullet(self):
@@ -213,11 +371,11 @@ class Game:
         py = self.player.y - 1
 
         if self.player.spread_shot > 0:
-            self.bullets.append(Bullet(px, py, -0.3, -1))
-            self.bullets.append(Bullet(px, py, 0, -1))
-            self.bullets.append(Bullet(px, py, 0.3, -1))
+            self.add_bullet(px, py, -0.3, -1)
+            self.add_bullet(px, py, 0, -1)
+            self.add_bullet(px, py, 0.3, -1)
         else:
-            self.bullets.append(Bullet(px, py))
+            self.add_bullet(px, py)
 
         self.fire_timer = self.player.get_fire_delay()
 
@@ -229,45 +387,67 @@ class Game:
         # Aim at player
         dx = self.player.x - ex
         dy = self.player.y - ey
-        dist = math.sqrt(dx * dx + dy * dy)
-        if dist > 0:
-            dx = dx / dist * 0.5
-            dy = dy / dist * 0.5
+        # Alpha-max-plus-beta-min estimate of the distance (within about 4%),
+        # which is plenty for aiming on a character grid
+        ax = abs(dx)
+        ay = abs(dy)
+        if ax > ay:
+            dist = 0.96 * ax + 0.398 * ay
+        else:
+            dist = 0.96 * ay + 0.398 * ax
+        inv = ENEMY_AIM_SPEED / (dist + 1e-6)
+        dx *= inv
+        dy *= inv
+
+        self.add_bullet(ex, ey, dx, max(0.3, dy), False, 0.8)
 
-        self.bullets.append(Bullet(ex, ey, dx, max(0.3, dy), False, 0.8))
+    def add_bullet(self, *args):
+        """Take a bullet from the pool; dropped if the pool is full."""
+        bullet = self.bullet_pool.acquire()
+        if bullet is not None:
+            bullet.reset(*args)
+
+    def add_explosion(self, x, y, size):
+        """Take an explosion from the pool; dropped if the pool is full."""
+        exp = self.explosion_pool.acquire()
+        if exp is not None:
+            exp.reset(x, y, size)
 
     def update(self, dt):
-        """Update game state."""
-        if self.paused or self.game_over:
-            return
+        """Update game state; the caller skips this while paused or game over."""
+        player = self.player
+        width = self.width
+        height = self.height
+        randint = random.randint
+        rand = random.random
 
         # Update timers
         self.fire_timer = max(0, self.fire_timer - dt)
 
-        # Update powerup timers
-        if self.player.rapid_fire > 0:
-            self.player.rapid_fire -= dt
-        if self.player.spread_shot > 0:
-            self.player.spread_shot -= dt
-        if self.player.shield > 0:
-            self.player.shield -= dt
-        if self.player.invincible_timer > 0:
-            self.player.invincible_timer -= dt
+        # Update powerup timers; they are only ever tested for > 0, so they
+        # can simply keep running down
+        player.rapid_fire -= dt
+        player.spread_shot -= dt
+        player.shield -= dt
+        player.invincible_timer -= dt
 
         # Player respawn
-        if not self.player.alive:
-            self.player.respawn_timer -= dt
-            if self.player.respawn_timer <= 0:
-                self.player.alive = True
-                self.player.x = self.width // 2 - 2
-                self.player.invincible_timer = 2.0
+        if not player.alive:
+            player.respawn_timer -= dt
+            if player.respawn_timer <= 0:
+                player.alive = True
+                player.x = width // 2 - 2
+                player.invincible_timer = 2.0
 
         # Update stars
-        for star in self.stars:
-            star.y += star.speed
-            if star.y >= self.height:
-                star.y = 0
-                star.x = random.randint(0, self.width - 1)
+        star_y = [y + speed for y, speed in zip(self.star_y, self.star_speed)]
+        if max(star_y) >= height:
+            star_x = self.star_x
+            for i, y in enumerate(star_y):
+                if y >= height:
+                    star_y[i] = 0
+                    star_x[i] = randint(0, width - 1)
+        self.star_y = star_y
 
         # Spawn enemies
         self.spawn_timer += dt
@@ -276,13 +456,13 @@ class Game:
             self.spawn_timer = 0
 
         # Check wave complete
-        if self.enemies_spawned >= self.enemies_to_spawn and not self.enemies:
+        if self.enemies_spawned >= self.enemies_to_spawn and not self.enemy_pool.in_use():
             self.wave += 1
             self.enemies_spawned = 0
             self.enemies_to_spawn = 5 + self.wave * 2
 
         # Update enemies
-        for enemy in self.enemies:
+        for enemy in self.enemy_pool.items:
             if not enemy.alive:
                 continue
 
@@ -294,140 +474,198 @@ class Game:
                 enemy.move_timer += dt
                 if enemy.move_timer >= 0.5:
                     enemy.x += enemy.move_dir * 2
-                    if enemy.x <= 1 or enemy.x >= self.width - enemy.width - 1:
+                    if enemy.x <= 1 or enemy.x >= width - enemy.width - 1:
                         enemy.move_dir *= -1
-                    enemy.move_timer = 0
+                    enemy.move_timer = 0.0
 
             # Shooting
             enemy.shoot_timer -= dt
             if enemy.shoot_timer <= 0:
                 self.enemy_fire(enemy)
-                enemy.shoot_timer = random.uniform(1.5, 3.0) if enemy.type != 'boss' else 0.5
+                # Same draw as random.uniform(1.5, 3.0), without the wrapper call
+                enemy.shoot_timer = 1.5 + 1.5 * rand() if enemy.type != 'boss' else 0.5
 
             # Off screen
-            if enemy.y > self.height:
-                enemy.alive = False
+            if enemy.y > height:
+                self.kill_enemy(enemy)
 
         # Update bullets
-        for bullet in self.bullets:
-            if not bullet.active:
-                continue
-
-            bullet.x += bullet.dx * bullet.speed
-            bullet.y += bullet.dy * bullet.speed
-
-            # Off screen
-            if bullet.y < 0 or bullet.y >= self.height or bullet.x < 0 or bullet.x >= self.width:
-                bullet.active = False
-                continue
-
-            if bullet.is_player:
-                # Hit enemy
-                for enemy in self.enemies:
-                    if not enemy.alive:
-                        continue
-
-                    if (enemy.x <= bullet.x <= enemy.x + enemy.width and
-                        enemy.y <= bullet.y <= enemy.y + enemy.height):
-                        bullet.active = False
-                        enemy.hp -= 1
-
-                        if enemy.hp <= 0:
-                            enemy.alive = False
-                            self.score += enemy.data['points'] * self.wave
-                            size = 'big' if enemy.type == 'boss' else 'small'
-                            self.explosions.append(Explosion(
-                                enemy.x + enemy.width // 2,
-                                enemy.y + enemy.height // 2,
-                                size
-                            ))
-
-                            # Drop powerup
-                            if random.random() < 0.15:
-                                ptype = random.choice(list(POWERUP_TYPES.keys()))
-                                self.powerups.append(Powerup(
-                                    enemy.x + enemy.width // 2,
-                                    enemy.y,
-                                    ptype
-                                ))
-                        break
-            else:
-                # Hit player
-                if self.player.alive and self.player.invincible_timer <= 0:
-                    if (self.player.x <= bullet.x <= self.player.x + self.player.width and
-                        self.player.y <= bullet.y <= self.player.y + self.player.height):
-
-                        if self.player.shield > 0:
-                            self.player.shield = 0
-                            bullet.active = False
-                        else:
-                            bullet.active = False
-                            self.player_hit()
+        self.update_bullets()
 
         # Enemy collision with player
-        for enemy in self.enemies:
-            if not enemy.alive or not self.player.alive:
+        for enemy in self.enemy_pool.items:
+            if not enemy.alive or not player.alive:
                 continue
-            if self.player.invincible_timer > 0:
+            if player.invincible_timer > 0:
                 continue
 
-            if (self.player.x < enemy.x + enemy.width and
-                self.player.x + self.player.width > enemy.x and
-                self.player.y < enemy.y + enemy.height and
-                self.player.y + self.player.height > enemy.y):
+            if (player.x < enemy.x + enemy.width and
+                player.x + player.width > enemy.x and
+                player.y < enemy.y + enemy.height and
+                player.y + player.height > enemy.y):
 
-                if self.player.shield > 0:
-                    self.player.shield = 0
-                    enemy.alive = False
-                    self.explosions.append(Explosion(enemy.x, enemy.y, 'small'))
+                if player.shield > 0:
+                    player.shield = 0
+                    self.kill_enemy(enemy)
+                    self.add_explosion(enemy.x, enemy.y, 'small')
                 else:
                     self.player_hit()
-                    enemy.alive = False
+                    self.kill_enemy(enemy)
 
         # Update powerups
-        for powerup in self.powerups:
+        for powerup in self.powerup_pool.items:
             if not powerup.active:
                 continue
 
             powerup.y += 0.3
 
-            if powerup.y >= self.height:
-                powerup.active = False
+            if powerup.y >= height:
+                self.remove_powerup(powerup)
                 continue
 
             # Collect
-            if self.player.alive:
-                if (self.player.x <= powerup.x <= self.player.x + self.player.width and
-                    self.player.y <= powerup.y <= self.player.y + self.player.height):
-                    powerup.active = False
+            if player.alive:
+                if (player.x <= powerup.x <= player.x + player.width and
+                    player.y <= powerup.y <= player.y + player.height):
+                    self.remove_powerup(powerup)
                     self.apply_powerup(powerup.type)
 
         # Update explosions
-        for exp in self.explosions:
+        for exp in self.explosion_pool.items:
+            if not exp.active:
+                continue
             exp.frame += dt * 5
-            max_frames = len(exp.frames) if exp.size == 'small' else len(exp.frames)
-            if exp.frame >= max_frames:
+            if exp.frame >= exp.total_frames:
                 exp.active = False
-
-        # Clean up
-        self.bullets = [b for b in self.bullets if b.active]
-        self.enemies = [e for e in self.enemies if e.alive]
-        self.powerups = [p for p in self.powerups if p.active]
-        self.explosions = [e for e in self.explosions if e.active]
+                self.explosion_pool.release(exp)
 
         # Update high score
         if self.score > self.high_score:
             self.high_score = self.score
 
+    def update_bullets(self):
+        """Move bullets and resolve their hits on enemies and the player."""
+        # Bin enemy bounds into every grid cell they overlap, so a bullet
+        # only tests the enemies sharing its cell
+        grid = self.grid
+        cell_w = self.cell_w
+        cell_h = self.cell_h
+        for cell in grid:
+            cell.clear()
+        for e in self.enemy_pool.items:
+            if not e.alive:
+                continue
+            target = (e.x, e.x + e.width, e.y, e.y + e.height, e)
+            cx0 = max(0, int(e.x) // cell_w)
+            cx1 = min(GRID_COLS - 1, int(e.x + e.width) // cell_w)
+            cy0 = max(0, int(e.y) // cell_h)
+            cy1 = min(GRID_ROWS - 1, int(e.y + e.height) // cell_h)
+            for cy in range(cy0, cy1 + 1):
+                row = cy * GRID_COLS
+                for cx in range(cx0, cx1 + 1):
+                    grid[row + cx].append(target)
+
+        player = self.player
+        px = player.x
+        py = player.y
+        # Last column and row the ship's sprite covers
+        px1 = px + player.width - 1
+        py1 = py + player.height - 1
+        width = self.width
+        height = self.height
+        for bullet in self.bullet_pool.items:
+            if not bullet.active:
+                continue
+
+            # Advance in sub-steps and test each one, so a fast bullet can't
+            # skip over an enemy between frames
+            bx = bullet.x
+            by = bullet.y
+            step_x = bullet.step_x
+            step_y = bullet.step_y
+            for _ in range(bullet.steps):
+                bx += step_x
+                by += step_y
+
+                # Off screen
+                if by < 0 or by >= height or bx < 0 or bx >= width:
+                    self.remove_bullet(bullet)
+                    break
+
+                if bullet.is_player:
+                    # Hit enemy
+                    target = None
+                    for x0, x1, y0, y1, enemy in grid[int(by) // cell_h * GRID_COLS + int(bx) // cell_w]:
+                        if enemy.alive and x0 <= bx <= x1 and y0 <= by <= y1:
+                            target = enemy
+                            break
+                    if target is not None:
+                        self.remove_bullet(bullet)
+                        self.damage_enemy(target)
+                        break
+                elif player.alive and player.invincible_timer <= 0:
+                    # Hit player: the bullet's cell is inside the ship's box
+                    # exactly when none of the four edge distances is negative
+                    bxi = int(bx)
+                    byi = int(by)
+                    if ((bxi - px) | (px1 - bxi) | (byi - py) | (py1 - byi)) >= 0:
+                        self.remove_bullet(bullet)
+                        if player.shield > 0:
+                            player.shield = 0
+                        else:
+                            self.player_hit()
+                        break
+
+            bullet.x = bx
+            bullet.y = by
+
+    def damage_enemy(self, enemy):
+        """Apply one bullet hit to an enemy, scoring it if destroyed."""
+        enemy.hp -= 1
+        if enemy.hp > 0:
+            return
+
+        self.kill_enemy(enemy)
+        self.score += enemy.data['points'] * self.wave
+        size = 'big' if enemy.type == 'boss' else 'small'
+        self.add_explosion(
+            enemy.x + enemy.width // 2,
+            enemy.y + enemy.height // 2,
+            size
+        )
+
+        # Drop powerup
+        if random.random() < 0.15:
+            ptype = random.choice(POWERUP_KEYS)
+            powerup = self.powerup_pool.acquire()
+            if powerup is not None:
+                powerup.reset(
+                    enemy.x + enemy.width // 2,
+                    enemy.y,
+                    ptype
+                )
+
+    def remove_bullet(self, bullet):
+        bullet.active = False
+        self.bullet_pool.release(bullet)
+
+    def kill_enemy(self, enemy):
+        enemy.alive = False
+        self.enemy_pool.release(enemy)
+
+    def remove_powerup(self, powerup):
+        powerup.active = False
+        self.powerup_pool.release(powerup)
+
     def player_hit(self):
         """Handle player being hit."""
         self.player.lives -= 1
         self.player.alive = False
-        self.explosions.append(Explosion(
+        self.add_explosion(
             self.player.x + self.player.width // 2,
             self.player.y + 1,
             'big'
-        ))
+        )
 
         if self.player.lives <= 0:
             self.game_over = True
@@ -464,83 +702,70 @@ class Game:
 
 def draw_game(stdscr, game):
     """Draw the game."""
-    stdscr.clear()
+    canvas = game.canvas
+    canvas.erase()
+    addstr = canvas.addstr
+    height = game.height
 
     # Draw stars
-    for star in game.stars:
-        try:
-            stdscr.addstr(int(star.y), int(star.x), star.char, curses.color_pair(8))
-        except curses.error:
-            pass
+    star_attr = ATTR.star
+    for x, y, char in zip(game.star_x, game.star_y, game.star_char):
+        addstr(int(y), x, char, star_attr)
 
     # Draw powerups
-    for powerup in game.powerups:
-        try:
-            stdscr.addstr(int(powerup.y), int(powerup.x), powerup.data['char'],
-                          curses.color_pair(powerup.data['color']) | curses.A_BOLD)
-        except curses.error:
-            pass
+    for powerup in game.powerup_pool.items:
+        if not powerup.active:
+            continue
+        addstr(int(powerup.y), int(powerup.x), powerup.data['char'], powerup.attr)
 
     # Draw enemies
-    for enemy in game.enemies:
+    for enemy in game.enemy_pool.items:
         if not enemy.alive:
             continue
-        color = curses.color_pair(enemy.data['color'])
-        for i, line in enumerate(enemy.sprite):
-            y = int(enemy.y) + i
-            if 0 <= y < game.height:
-                try:
-                    stdscr.addstr(y, int(enemy.x), line, color | curses.A_BOLD)
-                except curses.error:
-                    pass
+        ex = int(enemy.x)
+        ey = int(enemy.y)
+        for i, line in enemy.sprite_lines:
+            y = ey + i
+            if 0 <= y < height:
+                addstr(y, ex, line, enemy.attr)
 
     # Draw bullets
-    for bullet in game.bullets:
+    for bullet in game.bullet_pool.items:
         if not bullet.active:
             continue
-        char = '|' if bullet.is_player else 'v'
-        color = curses.color_pair(2 if bullet.is_player else 5)
-        try:
-            stdscr.addstr(int(bullet.y), int(bullet.x), char, color | curses.A_BOLD)
-        except curses.error:
-            pass
+        if bullet.is_player:
+            addstr(int(bullet.y), int(bullet.x), '|', ATTR.player_bullet)
+        else:
+            addstr(int(bullet.y), int(bullet.x), 'v', ATTR.enemy_bullet)
 
     # Draw player
     if game.player.alive:
         # Blink when invincible
         if game.player.invincible_timer <= 0 or int(time.time() * 10) % 2:
-            color = curses.color_pair(2)
-            if game.player.shield > 0:
-                color = curses.color_pair(6)
-            for i, line in enumerate(PLAYER_SHIP):
-                try:
-                    stdscr.addstr(game.player.y + i, game.player.x, line, color | curses.A_BOLD)
-                except curses.error:
-                    pass
+            attr = ATTR.shielded if game.player.shield > 0 else ATTR.player
+            px = game.player.x
+            py = game.player.y
+            for i, line in PLAYER_SHIP_LINES:
+                addstr(py + i, px, line, attr)
 
     # Draw explosions
-    for exp in game.explosions:
-        frame_idx = min(int(exp.frame), len(exp.frames) - 1)
+    for exp in game.explosion_pool.items:
+        if not exp.active:
+            continue
+        frame_idx = int(exp.frame) if exp.frame < exp.total_frames else exp.max_frame_idx
         if exp.size == 'small':
-            try:
-                stdscr.addstr(int(exp.y), int(exp.x), exp.frames[frame_idx],
-                              curses.color_pair(3) | curses.A_BOLD)
-            except curses.error:
-                pass
+            addstr(int(exp.y), int(exp.x), exp.frames[frame_idx], ATTR.small_explosion)
         else:
             frame = exp.frames[frame_idx]
             for i, line in enumerate(frame):
                 y = int(exp.y) - 1 + i
                 x = int(exp.x) - 1
-                if 0 <= y < game.height:
-                    try:
-                        stdscr.addstr(y, x, line, curses.color_pair(5) | curses.A_BOLD)
-                    except curses.error:
-                        pass
+                if 0 <= y < height:
+                    addstr(y, x, line, ATTR.big_explosion)
 
     # Draw HUD
     hud = f" Score: {game.score}  |  High: {game.high_score}  |  Wave: {game.wave}  |  Lives: {'<3 ' * game.player.lives}"
-    stdscr.addstr(0, 0, hud[:game.width], curses.color_pair(7) | curses.A_BOLD)
+    addstr(0, 0, hud[:game.width], ATTR.hud)
 
     # Powerup indicators
     indicators = []
@@ -553,13 +778,12 @@ def draw_game(stdscr, game):
 
     if indicators:
         indicator_str = " | ".join(indicators)
-        stdscr.addstr(1, 0, indicator_str, curses.color_pair(6))
+        addstr(1, 0, indicator_str, ATTR.indicators)
 
     # Pause/Game over
     if game.paused:
         msg = " PAUSED "
-        stdscr.addstr(game.height // 2, game.width // 2 - len(msg) // 2, msg,
-                      curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
+        addstr(game.height // 2, game.width // 2 - len(msg) // 2, msg, ATTR.pause)
 
     if game.game_over:
         lines = [
@@ -577,20 +801,13 @@ def draw_game(stdscr, game):
         box_y = game.height // 2 - box_height // 2
 
         for i in range(box_height):
-            try:
-                stdscr.addstr(box_y + i, box_x, ' ' * box_width,
-                              curses.color_pair(5) | curses.A_REVERSE)
-            except curses.error:
-                pass
+            addstr(box_y + i, box_x, ' ' * box_width, ATTR.box)
 
         for i, line in enumerate(lines):
             x = game.width // 2 - len(line) // 2
-            try:
-                stdscr.addstr(box_y + 1 + i, x, line,
-                              curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD)
-            except curses.error:
-                pass
+            addstr(box_y + 1 + i, x, line, ATTR.box_text)
 
+    canvas.flush(stdscr)
     stdscr.refresh()
 
 
@@ -609,9 +826,8 @@ def draw_title(stdscr, width, height):
     start_y = height // 2 - 8
     for i, line in enumerate(title):
         x = width // 2 - len(line) // 2
-        color = curses.color_pair((i % 4) + 2)
         try:
-            stdscr.addstr(start_y + i, max(0, x), line, color | curses.A_BOLD)
+            stdscr.addstr(start_y + i, max(0, x), line, BOLD_ATTR[(i % 4) + 2])
         except curses.error:
             pass
 
@@ -632,7 +848,7 @@ def draw_title(stdscr, width, height):
         y = height // 2 + i
         x = width // 2 - len(line) // 2
         try:
-            stdscr.addstr(y, x, line, curses.color_pair(7))
+            stdscr.addstr(y, x, line, ATTR.text)
         except curses.error:
             pass
 
@@ -653,11 +869,28 @@ def init_colors():
     curses.init_pair(7, curses.COLOR_WHITE, -1)
     curses.init_pair(8, 8, -1)
 
+    # Combine pairs and styles once instead of on every draw call
+    BOLD_ATTR[:] = [curses.color_pair(n) | curses.A_BOLD for n in range(9)]
+    ATTR.star = curses.color_pair(8)
+    ATTR.player = BOLD_ATTR[2]
+    ATTR.shielded = BOLD_ATTR[6]
+    ATTR.player_bullet = BOLD_ATTR[2]
+    ATTR.enemy_bullet = BOLD_ATTR[5]
+    ATTR.small_explosion = BOLD_ATTR[3]
+    ATTR.big_explosion = BOLD_ATTR[5]
+    ATTR.hud = BOLD_ATTR[7]
+    ATTR.indicators = curses.color_pair(6)
+    ATTR.pause = curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD
+    ATTR.box = curses.color_pair(5) | curses.A_REVERSE
+    ATTR.box_text = curses.color_pair(5) | curses.A_REVERSE | curses.A_BOLD
+    ATTR.text = curses.color_pair(7)
+
 
 def main(stdscr):
     """Main game loop."""
     curses.curs_set(0)
     stdscr.nodelay(True)
+    stdscr.leaveok(True)
     init_colors()
 
     height, width = stdscr.getmaxyx()
@@ -675,6 +908,9 @@ def main(stdscr):
 
     game = Game(width, height)
     last_time = time.time()
+    next_frame = last_time + FRAME_TIME
+    accumulator = 0.0
+    overlay_shown = False
 
     while True:
         current_time = time.time()
@@ -705,13 +941,37 @@ def main(stdscr):
             elif key == ord(' '):
                 game.fire_bullet()
 
-        # Update
-        game.update(dt)
+        # Nothing moves while paused or game over: draw the overlay once,
+        # then just poll for keys at a slower rate
+        if game.paused or game.game_over:
+            if not overlay_shown:
+                draw_game(stdscr, game)
+                overlay_shown = True
+            time.sleep(IDLE_SLEEP)
+            last_time = time.time()
+            next_frame = last_time + FRAME_TIME
+            accumulator = 0.0
+            continue
+        overlay_shown = False
+
+        # Update in fixed steps, independent of how long the frame took
+        accumulator = min(accumulator + dt, MAX_STEPS_PER_FRAME * FIXED_DT)
+        while accumulator >= FIXED_DT:
+            game.update(FIXED_DT)
+            accumulator -= FIXED_DT
 
         # Draw
         draw_game(stdscr, game)
 
-        time.sleep(0.016)
+        # Sleep until the next frame is due rather than a fixed 16ms on top
+        # of the frame's own work; resync if more than a frame behind
+        now = time.time()
+        delay = next_frame - now
+        if delay > 0:
+            time.sleep(delay)
+        next_frame += FRAME_TIME
+        if delay < -FRAME_TIME:
+            next_frame = now + FRAME_TIME
 
 
 if __name__ == '__main__':
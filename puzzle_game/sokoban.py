@@ -17,7 +17,14 @@ Controls:
 
 import os
 import sys
-import copy
+from collections import deque
+from contextlib import contextmanager
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import termios
+    import tty
 
 # Game symbols
 WALL = '#'
@@ -28,6 +35,36 @@ BOX_ON_GOAL = '*'
 PLAYER = '@'
 PLAYER_ON_GOAL = '+'
 
+# Byte codes of the symbols stored in the grid
+WALL_CELL = ord(WALL)
+FLOOR_CELL = ord(FLOOR)
+BOX_CELL = ord(BOX)
+
+# Terminal control sequences
+CLEAR = '\033[H\033[2J'
+CURSOR_HOME = '\033[H'
+# Line ending that also wipes what an earlier, longer frame left on the row
+EOL = '\033[K\n'
+ERASE_BELOW = '\033[J'
+SAVE_CURSOR = '\0337'
+RESTORE_CURSOR = '\0338'
+
+# Screen layout of render(): lines above the board and its left indent
+HEADER_ROWS = 7
+LEFT_MARGIN = 2
+STATS_ROW = 5
+
+# Movement keys and their (dx, dy)
+MOVES = {
+    'w': (0, -1),
+    's': (0, 1),
+    'a': (-1, 0),
+    'd': (1, 0),
+}
+
+# Undo steps kept; older ones are dropped
+MAX_UNDO = 256
+
 # ANSI color codes
 class Colors:
     RESET = '\033[0m'
@@ -41,6 +78,17 @@ class Colors:
     WHITE = '\033[97m'
     BG_BLACK = '\033[40m'
 
+# Colored text for each (symbol, on goal) pair on the board; other cells
+# are drawn as their plain character
+RENDER = {
+    (ord(PLAYER), True): f"{Colors.BOLD}{Colors.GREEN}{PLAYER_ON_GOAL}{Colors.RESET}",
+    (ord(PLAYER), False): f"{Colors.BOLD}{Colors.BLUE}{PLAYER}{Colors.RESET}",
+    (BOX_CELL, True): f"{Colors.BOLD}{Colors.GREEN}{BOX_ON_GOAL}{Colors.RESET}",
+    (BOX_CELL, False): f"{Colors.BOLD}{Colors.YELLOW}{BOX}{Colors.RESET}",
+    (FLOOR_CELL, True): f"{Colors.RED}{GOAL}{Colors.RESET}",
+    (WALL_CELL, False): f"{Colors.WHITE}{WALL}{Colors.RESET}",
+}
+
 # Level designs
 LEVELS = [
     # Level 1 - Tutorial
@@ -124,33 +172,28 @@ LEVELS = [
 
 def clear_screen():
     """Clear the terminal screen."""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    sys.stdout.write(CLEAR)
+    sys.stdout.flush()
+
+@contextmanager
+def cbreak_input():
+    """Keep the terminal in cbreak mode (keys unbuffered, no echo) while active."""
+    if os.name == 'nt':
+        # Windows: msvcrt already reads single keys
+        yield
+        return
+    fd = sys.stdin.fileno()
+    old_settings = termios.tcgetattr(fd)
+    try:
+        tty.setcbreak(fd)
+        yield
+    finally:
+        termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
 
 def get_char():
-    """Get a single character from stdin without requiring Enter."""
-    try:
-        import tty
-        import termios
-        fd = sys.stdin.fileno()
-        old_settings = termios.tcgetattr(fd)
-        try:
-            tty.setraw(sys.stdin.fileno())
-            ch = sys.stdin.read(1)
-            # Handle arrow keys (escape sequences)
-            if ch == '\x1b':
-                ch2 = sys.stdin.read(1)
-                ch3 = sys.stdin.read(1)
-                if ch2 == '[':
-                    if ch3 == 'A': return 'w'  # Up
-                    if ch3 == 'B': return 's'  # Down
-                    if ch3 == 'C': return 'd'  # Right
-                    if ch3 == 'D': return 'a'  # Left
-            return ch
-        finally:
-            termios.tcsetattr(fd, termios.TCSADRAIN, old_settings)
-    except ImportError:
+    """Get a single character from stdin; run inside cbreak_input()."""
+    if os.name == 'nt':
         # Windows fallback
-        import msvcrt
         ch = msvcrt.getch()
         if ch in [b'\x00', b'\xe0']:
             ch2 = msvcrt.getch()
@@ -160,13 +203,35 @@ def get_char():
             if ch2 == b'K': return 'a'  # Left
         return ch.decode('utf-8', errors='ignore')
 
+    ch = sys.stdin.read(1)
+    # Handle arrow keys (escape sequences)
+    if ch == '\x1b':
+        ch2 = sys.stdin.read(1)
+        ch3 = sys.stdin.read(1)
+        if ch2 == '[':
+            if ch3 == 'A': return 'w'  # Up
+            if ch3 == 'B': return 's'  # Down
+            if ch3 == 'C': return 'd'  # Right
+            if ch3 == 'D': return 'a'  # Left
+    return ch
+
+# One undo step: state before a move and the grid cells it changed
+class Undo:
+    __slots__ = ('player', 'moves', 'pushes', 'changes')
+
+    def __init__(self, player, moves, pushes, changes):
+        self.player = player
+        self.moves = moves
+        self.pushes = pushes
+        self.changes = changes  # (x, y, old_cell) tuples
+
 class Game:
     def __init__(self):
         self.current_level = 0
         self.max_unlocked = 0
         self.moves = 0
         self.pushes = 0
-        self.history = []
+        self.history = deque(maxlen=MAX_UNDO)
         self.load_level(0)
 
     def load_level(self, level_num):
@@ -177,7 +242,9 @@ class Game:
         self.current_level = level_num
         self.moves = 0
         self.pushes = 0
-        self.history = []
+        self.history = deque(maxlen=MAX_UNDO)
+        # Cells changed since the last render; None forces a full redraw
+        self.dirty = None
 
         # Parse level map
         level_data = LEVELS[level_num]['map']
@@ -186,88 +253,104 @@ class Game:
         # Find max width
         max_width = max(len(row) for row in level_data)
 
-        # Create game grid
-        self.grid = []
+        # Create game grid: one byte per cell, row-major
+        self.width = max_width
+        self.height = len(level_data)
+        self.grid = bytearray()
         self.goals = set()
+        self.boxes = set()
         self.player_pos = None
 
         for y, row in enumerate(level_data):
-            grid_row = []
             for x, char in enumerate(row.ljust(max_width)):
                 if char == PLAYER:
                     self.player_pos = (x, y)
-                    grid_row.append(FLOOR)
+                    self.grid.append(FLOOR_CELL)
                 elif char == PLAYER_ON_GOAL:
                     self.player_pos = (x, y)
                     self.goals.add((x, y))
-                    grid_row.append(FLOOR)
+                    self.grid.append(FLOOR_CELL)
                 elif char == BOX_ON_GOAL:
                     self.goals.add((x, y))
-                    grid_row.append(BOX)
+                    self.boxes.add((x, y))
+                    self.grid.append(BOX_CELL)
                 elif char == GOAL:
                     self.goals.add((x, y))
-                    grid_row.append(FLOOR)
+                    self.grid.append(FLOOR_CELL)
                 else:
-                    grid_row.append(char)
-            self.grid.append(grid_row)
+                    if char == BOX:
+                        self.boxes.add((x, y))
+                    self.grid.append(ord(char))
 
+        self.boxes_on_goal = len(self.boxes & self.goals)
         return True
 
     def get_boxes(self):
         """Get all box positions."""
-        boxes = set()
-        for y, row in enumerate(self.grid):
-            for x, cell in enumerate(row):
-                if cell == BOX:
-                    boxes.add((x, y))
-        return boxes
+        return self.boxes
 
     def is_complete(self):
         """Check if all boxes are on goals."""
-        return self.get_boxes() == self.goals
-
-    def can_move(self, x, y):
-        """Check if a position is walkable (floor or box can be pushed)."""
-        if y < 0 or y >= len(self.grid) or x < 0 or x >= len(self.grid[y]):
-            return False
-        return self.grid[y][x] != WALL
+        return self.boxes_on_goal == len(self.goals) == len(self.boxes)
+
+    def set_cell(self, x, y, cell):
+        """Write a grid cell, keeping the box set and on-goal count in step."""
+        pos = (x, y)
+        idx = y * self.width + x
+        if self.grid[idx] == BOX_CELL:
+            self.boxes.discard(pos)
+            if pos in self.goals:
+                self.boxes_on_goal -= 1
+        if cell == BOX_CELL:
+            self.boxes.add(pos)
+            if pos in self.goals:
+                self.boxes_on_goal += 1
+        self.grid[idx] = cell
 
     def move_player(self, dx, dy):
         """Try to move the player in the given direction."""
         px, py = self.player_pos
         new_x, new_y = px + dx, py + dy
+        width = self.width
+        height = self.height
+        grid = self.grid
 
-        if not self.can_move(new_x, new_y):
+        # Target must be on the board and not a wall
+        if not (0 <= new_x < width and 0 <= new_y < height):
+            return False
+        new_idx = new_y * width + new_x
+        cell = grid[new_idx]
+        if cell == WALL_CELL:
             return False
 
         # Check if there's a box to push
-        if self.grid[new_y][new_x] == BOX:
+        if cell == BOX_CELL:
             box_new_x, box_new_y = new_x + dx, new_y + dy
-            if not self.can_move(box_new_x, box_new_y) or self.grid[box_new_y][box_new_x] == BOX:
+            if not (0 <= box_new_x < width and 0 <= box_new_y < height):
+                return False
+            box_cell = grid[new_idx + dy * width + dx]
+            if box_cell == WALL_CELL or box_cell == BOX_CELL:
                 return False
 
-            # Save state for undo
-            self.history.append({
-                'player': self.player_pos,
-                'grid': copy.deepcopy(self.grid),
-                'moves': self.moves,
-                'pushes': self.pushes
-            })
+            # Save state for undo: only the two cells the push changes
+            self.history.append(Undo(
+                self.player_pos, self.moves, self.pushes,
+                [(new_x, new_y, BOX_CELL), (box_new_x, box_new_y, box_cell)]))
 
             # Move box
-            self.grid[new_y][new_x] = FLOOR
-            self.grid[box_new_y][box_new_x] = BOX
+            self.set_cell(new_x, new_y, FLOOR_CELL)
+            self.set_cell(box_new_x, box_new_y, BOX_CELL)
             self.pushes += 1
+            if self.dirty is not None:
+                self.dirty.append((box_new_x, box_new_y))
         else:
-            # Save state for undo
-            self.history.append({
-                'player': self.player_pos,
-                'grid': copy.deepcopy(self.grid),
-                'moves': self.moves,
-                'pushes': self.pushes
-            })
+            # Save state for undo; a plain step leaves the grid untouched
+            self.history.append(Undo(self.player_pos, self.moves, self.pushes, []))
 
         # Move player
+        if self.dirty is not None:
+            self.dirty.append((px, py))
+            self.dirty.append((new_x, new_y))
         self.player_pos = (new_x, new_y)
         self.moves += 1
         return True
@@ -276,66 +359,96 @@ class Game:
         """Undo the last move."""
         if self.history:
             state = self.history.pop()
-            self.player_pos = state['player']
-            self.grid = state['grid']
-            self.moves = state['moves']
-            self.pushes = state['pushes']
+            for x, y, old_cell in state.changes:
+                self.set_cell(x, y, old_cell)
+            self.player_pos = state.player
+            self.moves = state.moves
+            self.pushes = state.pushes
+            self.dirty = None
             return True
         return False
 
+    def stats_line(self):
+        """Build the moves/pushes line of the header."""
+        c = Colors
+        return f"{c.WHITE}  Moves: {c.YELLOW}{self.moves}{c.RESET}  |  Pushes: {c.YELLOW}{self.pushes}{c.RESET}{EOL}"
+
+    def cell_text(self, x, y):
+        """Get the colored text drawn for one board cell."""
+        if (x, y) == self.player_pos:
+            cell = ord(PLAYER)
+        else:
+            cell = self.grid[y * self.width + x]
+        text = RENDER.get((cell, (x, y) in self.goals))
+        return text if text is not None else chr(cell)
+
+    def render_delta(self):
+        """Redraw only the cells changed since the last render, and the stats."""
+        parts = [SAVE_CURSOR]
+        for x, y in self.dirty:
+            parts.append(f"\033[{HEADER_ROWS + y + 1};{LEFT_MARGIN + x + 1}H{self.cell_text(x, y)}")
+        parts.append(f"\033[{STATS_ROW + 1};1H{self.stats_line()}")
+        parts.append(RESTORE_CURSOR)
+        self.dirty = []
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
+
     def render(self):
         """Render the game state."""
-        clear_screen()
-
         c = Colors
+        reset = c.RESET
+        white = c.WHITE
+        bold_cyan = c.BOLD + c.CYAN
 
         # Header
-        print(f"{c.BOLD}{c.CYAN}{'=' * 50}{c.RESET}")
-        print(f"{c.BOLD}{c.YELLOW}  SOKOBAN - 倉庫番  {c.RESET}")
-        print(f"{c.BOLD}{c.CYAN}{'=' * 50}{c.RESET}")
-        print()
-        print(f"{c.WHITE}  Level {self.current_level + 1}/{len(LEVELS)}: {c.GREEN}{self.level_name}{c.RESET}")
-        print(f"{c.WHITE}  Moves: {c.YELLOW}{self.moves}{c.RESET}  |  Pushes: {c.YELLOW}{self.pushes}{c.RESET}")
-        print()
+        parts = [
+            CURSOR_HOME,
+            f"{bold_cyan}{'=' * 50}{reset}{EOL}",
+            f"{c.BOLD}{c.YELLOW}  SOKOBAN - 倉庫番  {reset}{EOL}",
+            f"{bold_cyan}{'=' * 50}{reset}{EOL}",
+            EOL,
+            f"{white}  Level {self.current_level + 1}/{len(LEVELS)}: {c.GREEN}{self.level_name}{reset}{EOL}",
+            self.stats_line(),
+            EOL,
+        ]
 
         # Render grid
-        for y, row in enumerate(self.grid):
-            line = "  "
-            for x, cell in enumerate(row):
-                pos = (x, y)
-                if pos == self.player_pos:
-                    if pos in self.goals:
-                        line += f"{c.BOLD}{c.GREEN}{PLAYER_ON_GOAL}{c.RESET}"
-                    else:
-                        line += f"{c.BOLD}{c.BLUE}{PLAYER}{c.RESET}"
-                elif cell == BOX:
-                    if pos in self.goals:
-                        line += f"{c.BOLD}{c.GREEN}{BOX_ON_GOAL}{c.RESET}"
-                    else:
-                        line += f"{c.BOLD}{c.YELLOW}{BOX}{c.RESET}"
-                elif pos in self.goals:
-                    line += f"{c.RED}{GOAL}{c.RESET}"
-                elif cell == WALL:
-                    line += f"{c.WHITE}{WALL}{c.RESET}"
-                else:
-                    line += cell
-            print(line)
-
-        print()
-        print(f"{c.CYAN}  Controls:{c.RESET}")
-        print(f"  {c.WHITE}WASD/Arrows{c.RESET}: Move  |  {c.WHITE}R{c.RESET}: Restart  |  {c.WHITE}U{c.RESET}: Undo")
-        print(f"  {c.WHITE}N{c.RESET}: Next Level  |  {c.WHITE}P{c.RESET}: Prev Level  |  {c.WHITE}Q{c.RESET}: Quit")
-        print()
+        render = RENDER
+        goals = self.goals
+        player_x, player_y = self.player_pos
+        player_cell = ord(PLAYER)
+        width = self.width
+        for y in range(self.height):
+            parts.append("  ")
+            for x, cell in enumerate(self.grid[y * width:(y + 1) * width]):
+                if x == player_x and y == player_y:
+                    cell = player_cell
+                text = render.get((cell, (x, y) in goals))
+                parts.append(text if text is not None else chr(cell))
+            parts.append(EOL)
+
+        parts.append(EOL)
+        parts.append(f"{c.CYAN}  Controls:{reset}{EOL}")
+        parts.append(f"  {white}WASD/Arrows{reset}: Move  |  {white}R{reset}: Restart  |  {white}U{reset}: Undo{EOL}")
+        parts.append(f"  {white}N{reset}: Next Level  |  {white}P{reset}: Prev Level  |  {white}Q{reset}: Quit{EOL}")
+        parts.append(EOL)
 
         # Legend
-        print(f"  {c.MAGENTA}Legend:{c.RESET}")
-        print(f"  {c.BLUE}@{c.RESET}=You  {c.YELLOW}${c.RESET}=Box  {c.RED}.{c.RESET}=Goal  {c.GREEN}*{c.RESET}=Box on Goal  {c.WHITE}#{c.RESET}=Wall")
-        print()
+        parts.append(f"  {c.MAGENTA}Legend:{reset}{EOL}")
+        parts.append(f"  {c.BLUE}@{reset}=You  {c.YELLOW}${reset}=Box  {c.RED}.{reset}=Goal  {c.GREEN}*{reset}=Box on Goal  {white}#{reset}=Wall{EOL}")
+        parts.append(EOL)
+        parts.append(ERASE_BELOW)
+        self.dirty = []
+        sys.stdout.write("".join(parts))
+        sys.stdout.flush()
 
     def show_victory(self):
         """Show victory screen."""
         clear_screen()
+        self.dirty = None
         c = Colors
+        reset = c.RESET
+        yellow = c.YELLOW
 
         print(f"\n{c.BOLD}{c.GREEN}")
         print("  ╔═══════════════════════════════════════╗")
@@ -347,13 +460,13 @@ class Game:
         print(f"  ║     Pushes: {self.pushes:<23} ║")
         print("  ║                                       ║")
         print("  ╚═══════════════════════════════════════╝")
-        print(f"{c.RESET}")
+        print(f"{reset}")
 
         if self.current_level < len(LEVELS) - 1:
-            print(f"\n  {c.YELLOW}Press N for next level, R to replay, Q to quit{c.RESET}")
+            print(f"\n  {yellow}Press N for next level, R to replay, Q to quit{reset}")
         else:
-            print(f"\n  {c.CYAN}★ Congratulations! You've completed all levels! ★{c.RESET}")
-            print(f"  {c.YELLOW}Press R to replay, P for previous levels, Q to quit{c.RESET}")
+            print(f"\n  {c.CYAN}★ Congratulations! You've completed all levels! ★{reset}")
+            print(f"  {yellow}Press R to replay, P for previous levels, Q to quit{reset}")
 
     def run(self):
         """Main game loop."""
@@ -362,12 +475,16 @@ class Game:
                 if self.current_level > self.max_unlocked:
                     self.max_unlocked = self.current_level
                 self.show_victory()
-            else:
+            elif self.dirty is None:
                 self.render()
+            else:
+                self.render_delta()
 
             key = get_char().lower()
 
-            if key == 'q':
+            if key in MOVES:
+                self.move_player(*MOVES[key])
+            elif key == 'q':
                 clear_screen()
                 print("\nThanks for playing Sokoban! Goodbye!\n")
                 break
@@ -382,14 +499,6 @@ class Game:
             elif key == 'p':
                 if self.current_level > 0:
                     self.load_level(self.current_level - 1)
-            elif key == 'w':
-                self.move_player(0, -1)
-            elif key == 's':
-                self.move_player(0, 1)
-            elif key == 'a':
-                self.move_player(-1, 0)
-            elif key == 'd':
-                self.move_player(1, 0)
             elif key == '\x03':  # Ctrl+C
                 clear_screen()
                 print("\nGame interrupted. Goodbye!\n")
@@ -426,9 +535,10 @@ def show_title():
 def main():
     """Main entry point."""
     try:
-        show_title()
-        game = Game()
-        game.run()
+        with cbreak_input():
+            show_title()
+            game = Game()
+            game.run()
     except KeyboardInterrupt:
         clear_screen()
         print("\nGame interrupted. Goodbye!\n")
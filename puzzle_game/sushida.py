@@ -13,6 +13,8 @@ import random
 import time
 import sys
 import os
+from bisect import insort
+from collections import defaultdict
 
 # Word lists (Japanese romaji and English mix)
 WORDS_EASY = [
@@ -38,6 +40,19 @@ WORDS_HARD = [
     "kaiten-zushi", "omakase", "itamae", "shokunin",
 ]
 
+# Word pools per difficulty, each word paired with its encoded bytes
+WORDS_EASY_B = tuple((word, word.encode('ascii')) for word in WORDS_EASY)
+WORDS_MEDIUM_B = tuple((word, word.encode('ascii')) for word in WORDS_MEDIUM)
+WORDS_HARD_B = tuple((word, word.encode('ascii')) for word in WORDS_HARD)
+POOL = {
+    "easy": WORDS_EASY_B,
+    "normal": WORDS_EASY_B + WORDS_MEDIUM_B,
+    "hard": WORDS_EASY_B + WORDS_MEDIUM_B + WORDS_HARD_B,
+}
+
+# Target frame duration (60 FPS)
+FRAME_TIME = 1 / 60
+
 # Sushi art
 SUSHI_ART = [
     "🍣",
@@ -47,12 +62,15 @@ SUSHI_ART = [
 ]
 
 class Sushi:
-    def __init__(self, word, y, speed, screen_width):
+    __slots__ = ('word', 'word_b', 'y', 'x', 'speed', 'pos', 'active', 'eaten')
+
+    def __init__(self, word, word_b, y, speed, screen_width):
         self.word = word
+        self.word_b = word_b
         self.y = y
         self.x = float(screen_width - 1)
         self.speed = speed
-        self.typed = ""
+        self.pos = 0  # Number of letters typed so far
         self.active = True
         self.eaten = False
 
@@ -61,24 +79,23 @@ class Sushi:
         if self.x < -len(self.word) - 5:
             self.active = False
 
-    def check_input(self, char):
+    def check_input(self, char_code):
         if not self.active or self.eaten:
             return False
 
-        expected = self.word[len(self.typed)]
-        if char == expected:
-            self.typed += char
-            if self.typed == self.word:
+        if char_code == self.word_b[self.pos]:
+            self.pos += 1
+            if self.pos == len(self.word_b):
                 self.eaten = True
                 self.active = False
                 return True
         else:
             # Wrong key - reset progress
-            self.typed = ""
+            self.pos = 0
         return False
 
     def get_progress(self):
-        return len(self.typed)
+        return self.pos
 
 
 class Game:
@@ -89,17 +106,17 @@ class Game:
 
         # Game settings based on difficulty
         if difficulty == "easy":
-            self.words = WORDS_EASY
+            self.pool = POOL["easy"]
             self.spawn_interval = 3.0
             self.base_speed = 5.0
             self.time_limit = 60
         elif difficulty == "hard":
-            self.words = WORDS_EASY + WORDS_MEDIUM + WORDS_HARD
+            self.pool = POOL["hard"]
             self.spawn_interval = 1.5
             self.base_speed = 12.0
             self.time_limit = 90
         else:  # normal
-            self.words = WORDS_EASY + WORDS_MEDIUM
+            self.pool = POOL["normal"]
             self.spawn_interval = 2.0
             self.base_speed = 8.0
             self.time_limit = 60
@@ -116,25 +133,33 @@ class Game:
         self.time_remaining = self.time_limit
         self.last_spawn = 0
         self.game_over = False
-        self.used_rows = set()
+        # Rows without a sushi on them, kept sorted
+        self.free_rows = list(range(3, self.height - 5))
+        # Active sushi keyed by the code of the next letter they expect
+        self.by_next_char = defaultdict(list)
+        # Stats bar values and the strings last formatted from them
+        self.last_stats = None
+        self.stats_strings = None
 
     def spawn_sushi(self):
         # Find available row
-        available_rows = []
-        for y in range(3, self.height - 5):
-            if y not in self.used_rows:
-                available_rows.append(y)
-
-        if not available_rows:
+        if not self.free_rows:
             return
 
-        y = random.choice(available_rows)
-        self.used_rows.add(y)
+        y = random.choice(self.free_rows)
+        self.free_rows.remove(y)
 
-        word = random.choice(self.words)
+        word, word_b = random.choice(self.pool)
         speed = self.base_speed + random.uniform(-2, 2)
-        sushi = Sushi(word, y, speed, self.width)
+        sushi = Sushi(word, word_b, y, speed, self.width)
         self.sushi_list.append(sushi)
+        self.add_to_bucket(sushi)
+
+    def add_to_bucket(self, sushi):
+        self.by_next_char[sushi.word_b[sushi.pos]].append(sushi)
+
+    def remove_from_bucket(self, sushi):
+        self.by_next_char[sushi.word_b[sushi.pos]].remove(sushi)
 
     def update(self, dt):
         if self.game_over:
@@ -152,54 +177,78 @@ class Game:
             self.spawn_sushi()
             self.last_spawn = 0
 
-        # Update sushi positions
-        for sushi in self.sushi_list:
-            old_active = sushi.active
+        # Update sushi positions, dropping eaten and missed sushi in place
+        sushi_list = self.sushi_list
+        kept = 0
+        for sushi in sushi_list:
+            if sushi.eaten:
+                insort(self.free_rows, sushi.y)
+                continue
+
             sushi.update(dt)
 
             # Check if sushi went off screen (missed)
-            if old_active and not sushi.active and not sushi.eaten:
+            if not sushi.active:
                 self.missed_count += 1
                 self.combo = 0
-                if sushi.y in self.used_rows:
-                    self.used_rows.discard(sushi.y)
-
-        # Remove inactive sushi
-        self.sushi_list = [s for s in self.sushi_list if s.active or s.eaten]
-
-        # Clean up eaten sushi after a moment
-        for sushi in self.sushi_list[:]:
-            if sushi.eaten:
-                self.sushi_list.remove(sushi)
-                if sushi.y in self.used_rows:
-                    self.used_rows.discard(sushi.y)
+                insort(self.free_rows, sushi.y)
+                self.remove_from_bucket(sushi)
+                continue
+
+            sushi_list[kept] = sushi
+            kept += 1
+        del sushi_list[kept:]
+
+    def get_stats_strings(self):
+        # Stats bar strings are reformatted only when a value has changed
+        stats = (int(self.time_remaining), self.score, self.combo, self.eaten_count)
+        if stats != self.last_stats:
+            self.last_stats = stats
+            self.stats_strings = (
+                f"Time: {stats[0]:02d}s",
+                f"Score: {stats[1]}",
+                f"Combo: {stats[2]}x",
+                f"Eaten: {stats[3]}",
+            )
+        return self.stats_strings
 
     def handle_input(self, char):
         if self.game_over:
             return
 
         self.total_chars += 1
+        char_code = ord(char)
+
+        # Give the key to a sushi waiting for it, prioritizing
+        # sushi that already has progress, then the one nearest the edge
+        best = None
+        for sushi in self.by_next_char.get(char_code, ()):
+            if (best is None or sushi.pos > best.pos or
+                    (sushi.pos == best.pos and sushi.x < best.x)):
+                best = sushi
+
+        if best is None:
+            # No match - wrong key resets progress
+            self.combo = 0
+            for sushi in self.sushi_list:
+                if sushi.pos and not sushi.eaten:
+                    self.remove_from_bucket(sushi)
+                    sushi.pos = 0
+                    self.add_to_bucket(sushi)
+            return
 
-        # Try to match input with any active sushi
-        # Prioritize sushi that already has progress
-        sorted_sushi = sorted(self.sushi_list,
-                              key=lambda s: (-s.get_progress(), s.x))
-
-        for sushi in sorted_sushi:
-            if sushi.check_input(char):
-                if sushi.eaten:
-                    # Successfully ate the sushi
-                    word_score = len(sushi.word) * 10
-                    combo_bonus = self.combo * 5
-                    self.score += word_score + combo_bonus
-                    self.combo += 1
-                    self.max_combo = max(self.max_combo, self.combo)
-                    self.eaten_count += 1
-                self.correct_chars += 1
-                return
-
-        # No match - wrong key
-        self.combo = 0
+        self.remove_from_bucket(best)
+        self.correct_chars += 1
+        if best.check_input(char_code):
+            # Successfully ate the sushi
+            word_score = len(best.word) * 10
+            combo_bonus = self.combo * 5
+            self.score += word_score + combo_bonus
+            self.combo += 1
+            self.max_combo = max(self.max_combo, self.combo)
+            self.eaten_count += 1
+        else:
+            self.add_to_bucket(best)
 
 
 def draw_game(stdscr, game):
@@ -222,10 +271,7 @@ def draw_game(stdscr, game):
                 curses.color_pair(3) | curses.A_BOLD)
 
     # Stats bar
-    time_str = f"Time: {int(game.time_remaining):02d}s"
-    score_str = f"Score: {game.score}"
-    combo_str = f"Combo: {game.combo}x"
-    eaten_str = f"Eaten: {game.eaten_count}"
+    time_str, score_str, combo_str, eaten_str = game.get_stats_strings()
 
     safe_addstr(1, 2, time_str, curses.color_pair(6) | curses.A_BOLD)
     safe_addstr(1, 20, score_str, curses.color_pair(3) | curses.A_BOLD)
@@ -256,8 +302,8 @@ def draw_game(stdscr, game):
         # Draw word with progress highlighting
         word_x = x - len(sushi.word) - 2
         if word_x >= 0:
-            typed_part = sushi.word[:len(sushi.typed)]
-            remaining_part = sushi.word[len(sushi.typed):]
+            typed_part = sushi.word[:sushi.pos]
+            remaining_part = sushi.word[sushi.pos:]
 
             safe_addstr(y, word_x, typed_part, curses.color_pair(2) | curses.A_BOLD)
             safe_addstr(y, word_x + len(typed_part), remaining_part, curses.color_pair(7))
@@ -422,10 +468,11 @@ def main(stdscr):
         # Game loop
         stdscr.nodelay(True)
         game = Game(width, height, difficulty)
-        last_time = time.time()
+        last_time = time.monotonic()
+        next_frame = last_time + FRAME_TIME
 
         while True:
-            current_time = time.time()
+            current_time = time.monotonic()
             dt = current_time - last_time
             last_time = current_time
 
@@ -448,7 +495,15 @@ def main(stdscr):
             except:
                 pass
 
-            time.sleep(0.016)  # ~60 FPS
+            # Sleep until the next frame is due rather than a fixed 16ms on
+            # top of the frame's own work; resync if more than a frame behind
+            now = time.monotonic()
+            delay = next_frame - now
+            if delay > 0:
+                time.sleep(delay)
+            next_frame += FRAME_TIME
+            if delay < -FRAME_TIME:
+                next_frame = now + FRAME_TIME
 
 
 if __name__ == '__main__':
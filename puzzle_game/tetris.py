@@ -13,7 +13,10 @@ Controls:
 """
 
 import curses
+import os
 import random
+import select
+import sys
 import time
 
 # Tetromino shapes (each rotation state)
@@ -78,61 +81,131 @@ BOARD_HEIGHT = 20
 BLOCK = '[]'
 EMPTY = '  '
 
+# Seconds per automatic drop, indexed by level - 1 (last entry from level 10 up)
+DROP_SPEEDS = (1.0, 0.8, 0.65, 0.5, 0.4, 0.3, 0.25, 0.2, 0.15, 0.1)
+
+# Longest wait for input between frames, so a resize is still noticed
+MAX_IDLE_WAIT = 0.1
+
+# Row bitmask of a completely filled row (bit x set = column x occupied)
+FULL_ROW = (1 << BOARD_WIDTH) - 1
+
+
+class PieceShape:
+    """Precomputed layout of one piece rotation."""
+    __slots__ = ('cells', 'min_x', 'max_x', 'max_y', 'rows', 'columns')
+
+    def __init__(self, cells):
+        self.cells = tuple(cells)
+        self.min_x = min(px for px, py in cells)
+        self.max_x = max(px for px, py in cells)
+        self.max_y = max(py for px, py in cells)
+
+        # (py, mask) per occupied row; bit (px - min_x) set per cell, so a
+        # piece at x covers board bits mask << (x + min_x)
+        masks = {}
+        for px, py in cells:
+            masks[py] = masks.get(py, 0) | (1 << (px - self.min_x))
+        self.rows = tuple(sorted(masks.items()))
+
+        # (px, highest py, lowest py) per occupied column
+        columns = {}
+        for px, py in cells:
+            top, bottom = columns.get(px, (py, py))
+            columns[px] = (min(top, py), max(bottom, py))
+        self.columns = tuple((px, top, bottom) for px, (top, bottom) in sorted(columns.items()))
+
+
+# Piece types are stored as indexes into PIECE_NAMES
+PIECE_NAMES = ('I', 'O', 'T', 'S', 'Z', 'J', 'L')
+
+# Cells of every piece and rotation, indexed by piece type
+PIECES = tuple(
+    tuple(tuple(rotation) for rotation in TETROMINOES[name])
+    for name in PIECE_NAMES
+)
+
+# Shape data for every piece and rotation, indexed by piece type
+PIECE_META = tuple(
+    tuple(PieceShape(cells) for cells in rotations)
+    for rotations in PIECES
+)
+
+# Screen cells as (text, attr), indexed by piece type; attributes need curses
+# running, so these are filled in by init_attrs()
+PIECE_ATTRS = ()
+PIECE_CELLS = ()
+GHOST_CELL = ('..', 0)
+EMPTY_CELL = (EMPTY, 0)
+
 
 class Tetris:
     def __init__(self):
+        # Piece type per cell, for drawing; row_mask holds occupancy
         self.board = [[None for _ in range(BOARD_WIDTH)] for _ in range(BOARD_HEIGHT)]
+        self.row_mask = [0] * BOARD_HEIGHT
+        # Highest occupied row per column (BOARD_HEIGHT when empty)
+        self.col_top = [BOARD_HEIGHT] * BOARD_WIDTH
         self.score = 0
         self.level = 1
+        self.drop_speed = DROP_SPEEDS[0]
         self.lines_cleared = 0
         self.game_over = False
         self.paused = False
 
         self.bag = []
-        self.current_piece = None
         self.current_type = None
         self.current_rotation = 0
         self.current_x = 0
         self.current_y = 0
         self.next_type = None
 
+        # Board cells as last drawn by draw_board and where the board was
+        # drawn; None forces a full redraw
+        self.screen_prev = None
+        self.screen_origin = None
+        # Set whenever the game changes so main() knows to draw a frame
+        self.dirty = True
+
         self.spawn_piece()
         self.next_type = self.get_next_piece_type()
 
     def get_next_piece_type(self):
         """Get next piece using 7-bag randomizer."""
         if not self.bag:
-            self.bag = list(TETROMINOES.keys())
+            self.bag = list(range(len(PIECE_NAMES)))
             random.shuffle(self.bag)
         return self.bag.pop()
 
     def spawn_piece(self):
         """Spawn a new piece at the top."""
-        if self.next_type:
+        if self.next_type is not None:
             self.current_type = self.next_type
         else:
             self.current_type = self.get_next_piece_type()
 
         self.next_type = self.get_next_piece_type()
         self.current_rotation = 0
-        self.current_piece = TETROMINOES[self.current_type][0]
         self.current_x = BOARD_WIDTH // 2 - 2
         self.current_y = 0
+        self.dirty = True
 
-        if not self.is_valid_position(self.current_x, self.current_y, self.current_piece):
+        if not self.is_valid_position(self.current_x, self.current_y, self.current_type, 0):
             self.game_over = True
 
-    def is_valid_position(self, x, y, piece):
+    def is_valid_position(self, x, y, piece_type, rotation):
         """Check if the piece can be placed at the given position."""
-        for px, py in piece:
-            new_x = x + px
+        shape = PIECE_META[piece_type][rotation]
+        if x + shape.min_x < 0 or x + shape.max_x >= BOARD_WIDTH:
+            return False
+        if y + shape.max_y >= BOARD_HEIGHT:
+            return False
+
+        shift = x + shape.min_x
+        row_mask = self.row_mask
+        for py, mask in shape.rows:
             new_y = y + py
-
-            if new_x < 0 or new_x >= BOARD_WIDTH:
-                return False
-            if new_y >= BOARD_HEIGHT:
-                return False
-            if new_y >= 0 and self.board[new_y][new_x] is not None:
+            if new_y >= 0 and row_mask[new_y] & (mask << shift):
                 return False
         return True
 
@@ -141,142 +214,179 @@ class Tetris:
         new_x = self.current_x + dx
         new_y = self.current_y + dy
 
-        if self.is_valid_position(new_x, new_y, self.current_piece):
+        if self.is_valid_position(new_x, new_y, self.current_type, self.current_rotation):
             self.current_x = new_x
             self.current_y = new_y
+            self.dirty = True
             return True
         return False
 
     def rotate(self):
         """Rotate the current piece clockwise."""
         new_rotation = (self.current_rotation + 1) % 4
-        new_piece = TETROMINOES[self.current_type][new_rotation]
 
         # Try normal rotation
-        if self.is_valid_position(self.current_x, self.current_y, new_piece):
+        if self.is_valid_position(self.current_x, self.current_y, self.current_type, new_rotation):
             self.current_rotation = new_rotation
-            self.current_piece = new_piece
+            self.dirty = True
             return True
 
         # Wall kick attempts
         kicks = [(-1, 0), (1, 0), (-2, 0), (2, 0), (0, -1)]
         for kick_x, kick_y in kicks:
-            if self.is_valid_position(self.current_x + kick_x, self.current_y + kick_y, new_piece):
+            if self.is_valid_position(self.current_x + kick_x, self.current_y + kick_y,
+                                      self.current_type, new_rotation):
                 self.current_x += kick_x
                 self.current_y += kick_y
                 self.current_rotation = new_rotation
-                self.current_piece = new_piece
+                self.dirty = True
                 return True
 
         return False
 
     def hard_drop(self):
         """Drop the piece instantly to the bottom."""
-        drop_distance = 0
-        while self.move(0, 1):
-            drop_distance += 1
+        ghost_y = self.get_ghost_y()
+        drop_distance = ghost_y - self.current_y
+        self.current_y = ghost_y
         self.score += drop_distance * 2
         self.lock_piece()
 
     def lock_piece(self):
         """Lock the current piece to the board."""
-        for px, py in self.current_piece:
-            x = self.current_x + px
-            y = self.current_y + py
-            if 0 <= y < BOARD_HEIGHT and 0 <= x < BOARD_WIDTH:
-                self.board[y][x] = self.current_type
+        shape = PIECE_META[self.current_type][self.current_rotation]
+        x0 = self.current_x
+        y0 = self.current_y
+
+        # Cells above the board (after a wall kick upwards) are dropped
+        for px, py in shape.cells:
+            if y0 + py >= 0:
+                self.board[y0 + py][x0 + px] = self.current_type
+
+        # Occupancy is updated a whole piece row / column at a time
+        shift = x0 + shape.min_x
+        for py, mask in shape.rows:
+            if y0 + py >= 0:
+                self.row_mask[y0 + py] |= mask << shift
+        for px, top_py, bottom_py in shape.columns:
+            y = max(y0 + top_py, 0)
+            if y <= y0 + bottom_py and y < self.col_top[x0 + px]:
+                self.col_top[x0 + px] = y
 
         self.clear_lines()
         self.spawn_piece()
 
     def clear_lines(self):
         """Clear completed lines and update score."""
-        lines_to_clear = []
-
-        for y in range(BOARD_HEIGHT):
-            if all(cell is not None for cell in self.board[y]):
-                lines_to_clear.append(y)
-
-        for y in lines_to_clear:
-            del self.board[y]
-            self.board.insert(0, [None for _ in range(BOARD_WIDTH)])
+        row_mask = self.row_mask
+        num_lines = row_mask.count(FULL_ROW)
 
-        # Scoring
-        num_lines = len(lines_to_clear)
         if num_lines > 0:
+            # Rebuild both boards in one pass with empty rows on top
+            self.board = ([[None] * BOARD_WIDTH for _ in range(num_lines)] +
+                          [row for y, row in enumerate(self.board) if row_mask[y] != FULL_ROW])
+            self.row_mask = [0] * num_lines + [mask for mask in row_mask if mask != FULL_ROW]
+            self.update_col_top()
+
+            # Scoring
             self.lines_cleared += num_lines
             points = {1: 100, 2: 300, 3: 500, 4: 800}
             self.score += points.get(num_lines, 800) * self.level
 
             # Level up every 10 lines
             self.level = self.lines_cleared // 10 + 1
-
-    def get_drop_speed(self):
-        """Get the current drop speed based on level."""
-        speeds = {
-            1: 1.0,
-            2: 0.8,
-            3: 0.65,
-            4: 0.5,
-            5: 0.4,
-            6: 0.3,
-            7: 0.25,
-            8: 0.2,
-            9: 0.15,
-            10: 0.1,
-        }
-        return speeds.get(min(self.level, 10), 0.1)
+            self.drop_speed = DROP_SPEEDS[min(self.level, len(DROP_SPEEDS)) - 1]
+
+    def update_col_top(self):
+        """Recompute the highest occupied row of every column."""
+        col_top = [BOARD_HEIGHT] * BOARD_WIDTH
+        for y in range(BOARD_HEIGHT - 1, -1, -1):
+            mask = self.row_mask[y]
+            x = 0
+            while mask:
+                if mask & 1:
+                    col_top[x] = y
+                mask >>= 1
+                x += 1
+        self.col_top = col_top
 
     def get_ghost_y(self):
         """Get the Y position where the piece would land."""
-        ghost_y = self.current_y
-        while self.is_valid_position(self.current_x, ghost_y + 1, self.current_piece):
-            ghost_y += 1
-        return ghost_y
+        shape = PIECE_META[self.current_type][self.current_rotation]
+        ghost_y = BOARD_HEIGHT
+        for px, top_py, bottom_py in shape.columns:
+            x = self.current_x + px
+            # The column sweeps rows from here down as the piece falls
+            start = max(self.current_y + top_py + 1, 0)
+            stop = self.col_top[x]
+            if stop < start:
+                # Filled above that (the piece is under an overhang): scan down
+                stop = start
+                bit = 1 << x
+                while stop < BOARD_HEIGHT and not self.row_mask[stop] & bit:
+                    stop += 1
+            ghost_y = min(ghost_y, stop - 1 - bottom_py)
+        return max(ghost_y, self.current_y)
 
 
 def draw_board(stdscr, game, start_y, start_x):
-    """Draw the game board."""
-    # Draw border
-    for y in range(BOARD_HEIGHT + 2):
-        stdscr.addstr(start_y + y, start_x, '|', curses.color_pair(7))
-        stdscr.addstr(start_y + y, start_x + BOARD_WIDTH * 2 + 1, '|', curses.color_pair(7))
+    """Draw the game board, writing only cells that changed since last frame."""
+    if game.screen_prev is None or game.screen_origin != (start_y, start_x):
+        game.screen_prev = [[None] * BOARD_WIDTH for _ in range(BOARD_HEIGHT)]
+        game.screen_origin = (start_y, start_x)
 
-    stdscr.addstr(start_y + BOARD_HEIGHT + 1, start_x, '+' + '-' * (BOARD_WIDTH * 2) + '+', curses.color_pair(7))
+        # Draw border
+        for y in range(BOARD_HEIGHT + 2):
+            stdscr.addstr(start_y + y, start_x, '|', curses.color_pair(7))
+            stdscr.addstr(start_y + y, start_x + BOARD_WIDTH * 2 + 1, '|', curses.color_pair(7))
 
-    # Draw ghost piece
-    ghost_y = game.get_ghost_y()
-    ghost_positions = set()
-    for px, py in game.current_piece:
-        gx = game.current_x + px
-        gy = ghost_y + py
-        if gy >= 0:
-            ghost_positions.add((gx, gy))
-
-    # Draw board cells
-    for y in range(BOARD_HEIGHT):
-        for x in range(BOARD_WIDTH):
-            screen_x = start_x + 1 + x * 2
-            screen_y = start_y + y + 1
-
-            cell = game.board[y][x]
-            if cell is not None:
-                color = curses.color_pair(PIECE_COLORS[cell])
-                stdscr.addstr(screen_y, screen_x, BLOCK, color | curses.A_BOLD)
-            elif (x, y) in ghost_positions:
-                stdscr.addstr(screen_y, screen_x, '..', curses.color_pair(8))
-            else:
-                stdscr.addstr(screen_y, screen_x, EMPTY)
+        stdscr.addstr(start_y + BOARD_HEIGHT + 1, start_x, '+' + '-' * (BOARD_WIDTH * 2) + '+', curses.color_pair(7))
+
+    # Board cells, then the ghost and current piece laid over them
+    board = game.board
+    screen = [[EMPTY_CELL if cell is None else PIECE_CELLS[cell] for cell in row]
+              for row in board]
 
-    # Draw current piece
-    for px, py in game.current_piece:
+    cells = PIECE_META[game.current_type][game.current_rotation].cells
+    ghost_y = game.get_ghost_y()
+    # At the ghost row the piece covers its own ghost
+    if ghost_y != game.current_y:
+        for px, py in cells:
+            x = game.current_x + px
+            y = ghost_y + py
+            if y >= 0 and board[y][x] is None:
+                screen[y][x] = GHOST_CELL
+
+    piece_cell = PIECE_CELLS[game.current_type]
+    for px, py in cells:
         x = game.current_x + px
         y = game.current_y + py
         if y >= 0 and 0 <= x < BOARD_WIDTH:
-            screen_x = start_x + 1 + x * 2
-            screen_y = start_y + y + 1
-            color = curses.color_pair(PIECE_COLORS[game.current_type])
-            stdscr.addstr(screen_y, screen_x, BLOCK, color | curses.A_BOLD)
+            screen[y][x] = piece_cell
+
+    # Redraw the changed span of each row, one addstr per run of cells
+    # sharing an attribute
+    for y in range(BOARD_HEIGHT):
+        want_row = screen[y]
+        prev_row = game.screen_prev[y]
+        if want_row == prev_row:
+            continue
+        game.screen_prev[y] = want_row
+
+        first = 0
+        while want_row[first] == prev_row[first]:
+            first += 1
+        last = BOARD_WIDTH - 1
+        while want_row[last] == prev_row[last]:
+            last -= 1
+
+        screen_y = start_y + y + 1
+        run_start = first
+        for x in range(first + 1, last + 2):
+            if x > last or want_row[x][1] != want_row[run_start][1]:
+                text = ''.join(cell[0] for cell in want_row[run_start:x])
+                stdscr.addstr(screen_y, start_x + 1 + run_start * 2, text, want_row[run_start][1])
+                run_start = x
 
 
 def draw_next_piece(stdscr, game, start_y, start_x):
@@ -288,11 +398,11 @@ def draw_next_piece(stdscr, game, start_y, start_x):
         stdscr.addstr(start_y + 1 + y, start_x, '        ')
 
     # Draw next piece
-    next_piece = TETROMINOES[game.next_type][0]
-    color = curses.color_pair(PIECE_COLORS[game.next_type])
+    next_piece = PIECES[game.next_type][0]
+    attr = PIECE_ATTRS[game.next_type]
 
     for px, py in next_piece:
-        stdscr.addstr(start_y + 1 + py, start_x + px * 2, BLOCK, color | curses.A_BOLD)
+        stdscr.addstr(start_y + 1 + py, start_x + px * 2, BLOCK, attr)
 
 
 def draw_stats(stdscr, game, start_y, start_x):
@@ -379,7 +489,6 @@ def show_pause(stdscr):
         stdscr.addstr(box_y + y, box_x, ' ' * box_width, curses.color_pair(3) | curses.A_REVERSE)
 
     stdscr.addstr(box_y + 2, box_x + 5, 'PAUSED', curses.color_pair(3) | curses.A_REVERSE | curses.A_BOLD)
-    stdscr.refresh()
 
 
 def init_colors():
@@ -396,6 +505,18 @@ def init_colors():
     curses.init_pair(7, curses.COLOR_WHITE, -1)    # L / UI
     curses.init_pair(8, 8, -1)                     # Ghost (gray)
 
+    init_attrs()
+
+
+def init_attrs():
+    """Precompute the curses attributes used when drawing pieces."""
+    global PIECE_ATTRS, PIECE_CELLS, GHOST_CELL
+
+    PIECE_ATTRS = tuple(curses.color_pair(PIECE_COLORS[name]) | curses.A_BOLD
+                        for name in PIECE_NAMES)
+    PIECE_CELLS = tuple((BLOCK, attr) for attr in PIECE_ATTRS)
+    GHOST_CELL = ('..', curses.color_pair(8))
+
 
 def main(stdscr):
     """Main game loop."""
@@ -405,40 +526,56 @@ def main(stdscr):
 
     game = Tetris()
     last_drop = time.time()
+    screen_size = None
+    redraw = True
 
     while True:
-        stdscr.clear()
-
         # Calculate positions
         height, width = stdscr.getmaxyx()
-        board_x = width // 2 - BOARD_WIDTH - 8
-        board_y = 7
-
-        # Draw everything
-        draw_title(stdscr, 1, board_x - 5)
-        draw_board(stdscr, game, board_y, board_x)
-        draw_next_piece(stdscr, game, board_y, board_x + BOARD_WIDTH * 2 + 4)
-        draw_stats(stdscr, game, board_y + 6, board_x + BOARD_WIDTH * 2 + 4)
-        draw_controls(stdscr, board_y + 15, board_x + BOARD_WIDTH * 2 + 4)
-
-        if game.game_over:
-            show_game_over(stdscr, game)
-            stdscr.nodelay(False)
-            while True:
-                key = stdscr.getch()
-                if key in [ord('q'), ord('Q')]:
-                    return
-                if key in [ord('r'), ord('R')]:
-                    game = Tetris()
-                    stdscr.nodelay(True)
-                    last_drop = time.time()
-                    break
-            continue
 
-        if game.paused:
-            show_pause(stdscr)
-
-        stdscr.refresh()
+        # Only wipe the screen when something may be left over from an
+        # overlay or a different layout; draw_board repaints changed cells
+        if redraw or screen_size != (height, width):
+            stdscr.clear()
+            game.screen_prev = None
+            game.dirty = True
+            screen_size = (height, width)
+            redraw = False
+
+        # Frames where nothing moved are left as they are on screen
+        if game.dirty:
+            game.dirty = False
+            board_x = width // 2 - BOARD_WIDTH - 8
+            board_y = 7
+
+            # Draw everything
+            draw_title(stdscr, 1, board_x - 5)
+            draw_board(stdscr, game, board_y, board_x)
+            draw_next_piece(stdscr, game, board_y, board_x + BOARD_WIDTH * 2 + 4)
+            draw_stats(stdscr, game, board_y + 6, board_x + BOARD_WIDTH * 2 + 4)
+            draw_controls(stdscr, board_y + 15, board_x + BOARD_WIDTH * 2 + 4)
+
+            if game.game_over:
+                show_game_over(stdscr, game)
+                stdscr.nodelay(False)
+                while True:
+                    key = stdscr.getch()
+                    if key in [ord('q'), ord('Q')]:
+                        return
+                    if key in [ord('r'), ord('R')]:
+                        game = Tetris()
+                        stdscr.nodelay(True)
+                        last_drop = time.time()
+                        redraw = True
+                        break
+                continue
+
+            if game.paused:
+                show_pause(stdscr)
+
+            # Send the whole frame to the terminal in one update
+            stdscr.noutrefresh()
+            curses.doupdate()
 
         # Handle input
         try:
@@ -450,8 +587,10 @@ def main(stdscr):
             break
         elif key in [ord('p'), ord('P')]:
             game.paused = not game.paused
+            game.dirty = True
             if not game.paused:
                 last_drop = time.time()
+                redraw = True
         elif not game.paused:
             if key in [curses.KEY_LEFT, ord('a'), ord('A')]:
                 game.move(-1, 0)
@@ -470,12 +609,20 @@ def main(stdscr):
         # Auto drop
         if not game.paused and not game.game_over:
             current_time = time.time()
-            if current_time - last_drop >= game.get_drop_speed():
+            if current_time - last_drop >= game.drop_speed:
                 if not game.move(0, 1):
                     game.lock_piece()
                 last_drop = current_time
 
-        time.sleep(0.016)  # ~60 FPS
+        # With no key pending, sleep until a key arrives or the next drop is due
+        if key == -1:
+            if os.name == 'nt':
+                time.sleep(0.016)  # ~60 FPS
+            else:
+                wait = MAX_IDLE_WAIT
+                if not game.paused:
+                    wait = min(max(last_drop + game.drop_speed - time.time(), 0), wait)
+                select.select([sys.stdin], [], [], wait)
 
 
 if __name__ == '__main__':
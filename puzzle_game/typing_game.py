@@ -11,6 +11,7 @@ Controls:
 import curses
 import random
 import time
+from collections import defaultdict
 
 # Word lists by difficulty
 WORDS_EASY = [
@@ -33,6 +34,19 @@ WORDS_HARD = [
 
 ALL_WORDS = WORDS_EASY + WORDS_MEDIUM + WORDS_HARD
 
+# Words available at each difficulty tier
+WORD_TIERS = {
+    'easy': WORDS_EASY,
+    'medium': WORDS_EASY + WORDS_MEDIUM,
+    'all': ALL_WORDS,
+}
+
+# Word colors; attributes need curses running, so these are filled in by
+# init_attrs()
+MATCHED_ATTR = 0
+# Indexed by Word.danger_band: low, medium, high
+DANGER_ATTRS = (0, 0, 0)
+
 
 class Word:
     def __init__(self, text, x, y, speed):
@@ -42,6 +56,10 @@ class Word:
         self.speed = speed
         self.active = True
         self.matched_chars = 0
+        # Screen row and danger band (0-2), kept up to date by Game.update
+        self.row = int(y)
+        self.danger_band = 0
+        self.color_attr = DANGER_ATTRS[0]
 
 
 class Game:
@@ -57,6 +75,13 @@ class Game:
         self.paused = False
 
         self.current_input = ""
+        # Active words by text (in spawn order) and by first letter, and the
+        # words currently showing a partial match
+        self.active_by_text = defaultdict(list)
+        self.by_first_char = defaultdict(list)
+        self.matched_words = []
+        # Shuffled words left to hand out per tier
+        self.word_bags = {tier: [] for tier in WORD_TIERS}
         self.spawn_timer = 0
         self.spawn_delay = 2.0
 
@@ -75,26 +100,37 @@ class Game:
         """Spawn a new word at the top."""
         # Choose word based on level
         if self.level <= 3:
-            word_list = WORDS_EASY
+            text = self.get_next_word('easy')
         elif self.level <= 6:
-            word_list = WORDS_EASY + WORDS_MEDIUM
+            text = self.get_next_word('medium')
         else:
-            word_list = ALL_WORDS
-
-        text = random.choice(word_list)
-
-        # Avoid duplicate active words
-        active_texts = [w.text for w in self.words if w.active]
-        attempts = 0
-        while text in active_texts and attempts < 10:
-            text = random.choice(word_list)
-            attempts += 1
+            text = self.get_next_word('all')
 
         x = random.randint(2, self.width - len(text) - 2)
         y = 2
         speed = self.get_word_speed() + random.uniform(-0.1, 0.1)
 
-        self.words.append(Word(text, x, y, speed))
+        word = Word(text, x, y, speed)
+        self.words.append(word)
+        self.active_by_text[text].append(word)
+        self.by_first_char[text[0]].append(word)
+
+    def get_next_word(self, tier):
+        """Get next word using a shuffled bag per tier, like the Tetris 7-bag."""
+        bag = self.word_bags[tier]
+        if not bag:
+            bag.extend(WORD_TIERS[tier])
+            random.shuffle(bag)
+        return bag.pop()
+
+    def deactivate(self, word):
+        """Mark a word as gone and drop it from the lookup tables."""
+        word.active = False
+        same_text = self.active_by_text[word.text]
+        same_text.remove(word)
+        if not same_text:
+            del self.active_by_text[word.text]
+        self.by_first_char[word.text[0]].remove(word)
 
     def update(self, dt):
         """Update game state."""
@@ -116,12 +152,27 @@ class Game:
 
             # Word reached bottom
             if word.y >= self.height - 4:
-                word.active = False
+                self.deactivate(word)
                 self.lives -= 1
                 self.combo = 0
 
                 if self.lives <= 0:
                     self.game_over = True
+                continue
+
+            word.row = int(word.y)
+
+            # Color based on position (danger indicator)
+            danger = word.y / (self.height - 4)
+            if danger > 0.7:
+                band = 2
+            elif danger > 0.5:
+                band = 1
+            else:
+                band = 0
+            if band != word.danger_band:
+                word.danger_band = band
+                word.color_attr = DANGER_ATTRS[band]
 
         # Clean up inactive words
         self.words = [w for w in self.words if w.active]
@@ -134,14 +185,11 @@ class Game:
         self.current_input += char
 
         # Check for matching words
-        matched_word = None
-        for word in self.words:
-            if word.active and word.text == self.current_input:
-                matched_word = word
-                break
+        same_text = self.active_by_text.get(self.current_input)
+        matched_word = same_text[0] if same_text else None
 
         if matched_word:
-            matched_word.active = False
+            self.deactivate(matched_word)
             self.words_typed += 1
             self.combo += 1
 
@@ -158,23 +206,40 @@ class Game:
 
             self.current_input = ""
 
-        # Update matched characters display
-        for word in self.words:
-            if word.active and word.text.startswith(self.current_input):
-                word.matched_chars = len(self.current_input)
-            else:
-                word.matched_chars = 0
+        self.update_matches()
+
+    def backspace(self):
+        """Delete the last typed character."""
+        if self.current_input:
+            self.current_input = self.current_input[:-1]
+            self.update_matches()
 
     def clear_input(self):
         """Clear current input."""
         self.current_input = ""
-        for word in self.words:
+        self.update_matches()
+
+    def update_matches(self):
+        """Update matched characters display for the current input."""
+        for word in self.matched_words:
             word.matched_chars = 0
+        self.matched_words = []
+
+        if not self.current_input:
+            return
+
+        # Only words starting with the first typed letter can match
+        for word in self.by_first_char.get(self.current_input[0], ()):
+            if word.text.startswith(self.current_input):
+                word.matched_chars = len(self.current_input)
+                self.matched_words.append(word)
 
 
 def draw_game(stdscr, game):
     """Draw the game."""
-    stdscr.clear()
+    # erase() only blanks the buffer; curses then sends just the cells that
+    # changed, where clear() would repaint the whole terminal every frame
+    stdscr.erase()
 
     # Draw header
     header = f" Score: {game.score}  |  Level: {game.level}  |  Combo: {game.combo}x  |  Lives: {'<3 ' * game.lives}"
@@ -188,32 +253,21 @@ def draw_game(stdscr, game):
         if not word.active:
             continue
 
-        y = int(word.y)
+        y = word.row
         if y < 2 or y >= game.height - 3:
             continue
 
-        # Draw matched part in green, rest in white
-        for i, char in enumerate(word.text):
-            x = word.x + i
-            if x >= game.width:
-                break
-
-            if i < word.matched_chars:
-                color = curses.color_pair(2) | curses.A_BOLD
+        # Draw matched part in green, rest in the word's danger color
+        text = word.text[:game.width - word.x]
+        matched = word.matched_chars
+        try:
+            if matched:
+                stdscr.addstr(y, word.x, text[:matched], MATCHED_ATTR)
+                stdscr.addstr(y, word.x + matched, text[matched:], word.color_attr)
             else:
-                # Color based on position (danger indicator)
-                danger = word.y / (game.height - 4)
-                if danger > 0.7:
-                    color = curses.color_pair(5) | curses.A_BOLD
-                elif danger > 0.5:
-                    color = curses.color_pair(3) | curses.A_BOLD
-                else:
-                    color = curses.color_pair(7)
-
-            try:
-                stdscr.addstr(y, x, char, color)
-            except curses.error:
-                pass
+                stdscr.addstr(y, word.x, text, word.color_attr)
+        except curses.error:
+            pass
 
     # Draw danger line
     danger_y = game.height - 4
@@ -260,7 +314,8 @@ def draw_game(stdscr, game):
             except curses.error:
                 pass
 
-    stdscr.refresh()
+    stdscr.noutrefresh()
+    curses.doupdate()
 
 
 def draw_title(stdscr, width, height):
@@ -321,6 +376,20 @@ def init_colors():
     curses.init_pair(7, curses.COLOR_WHITE, -1)
     curses.init_pair(8, 8, -1)
 
+    init_attrs()
+
+
+def init_attrs():
+    """Precompute the curses attributes used when drawing words."""
+    global MATCHED_ATTR, DANGER_ATTRS
+
+    MATCHED_ATTR = curses.color_pair(2) | curses.A_BOLD
+    DANGER_ATTRS = (
+        curses.color_pair(7),
+        curses.color_pair(3) | curses.A_BOLD,
+        curses.color_pair(5) | curses.A_BOLD,
+    )
+
 
 def main(stdscr):
     """Main game loop."""
@@ -358,14 +427,7 @@ def main(stdscr):
             elif game.game_over:
                 pass
             elif key == curses.KEY_BACKSPACE or key == 127:
-                if game.current_input:
-                    game.current_input = game.current_input[:-1]
-                    # Update matched chars
-                    for word in game.words:
-                        if word.active and word.text.startswith(game.current_input):
-                            word.matched_chars = len(game.current_input)
-                        else:
-                            word.matched_chars = 0
+                game.backspace()
             elif 32 <= key <= 126:  # Printable characters
                 char = chr(key).lower()
                 game.type_char(char)